@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Compare the pydantic and msgspec decoding backends of PlayersManager.
+
+Builds a projections response of the requested size from the test fixtures
+and times decoding the raw bytes into player models with each backend, plus
+msgspec decoding to structs only.
+
+Example:
+    python debug/decode_benchmark.py --players 5000 --repeat 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add the project root directory to the Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from debug.payloads import projections_body
+from fangraphs_api_extractor.managers import PlayersManager
+
+
+def best_of(repeat: int, fn) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark decoding backends")
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    content = projections_body(hitters=args.players)["bat"]
+    print(f"{args.players} hitters, {len(content) / 1e6:.1f} MB response")
+
+    cases = {
+        "pydantic": lambda: PlayersManager("hitters").parse_players(content),
+        "msgspec": lambda: PlayersManager("hitters", backend="msgspec").parse_players(
+            content
+        ),
+        "msgspec structs only": lambda: PlayersManager(
+            "hitters", backend="msgspec"
+        ).parse_records(content),
+    }
+    for name, fn in cases.items():
+        print(f"{name:>22}: {best_of(args.repeat, fn) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+"""
+Load test driver for the Fangraphs API Extractor.
+
+Starts the local Fangraphs stand-in server, runs the extractor's request paths
+against it for each worker count, and reports throughput and tail latency.
+Use it to tune `max_workers` and retry settings without touching production.
+
+Example:
+    python debug/load_test.py --workers 4 8 16 32 --latency_ms 80 \
+        --error_rate_429 0.02 --players 2000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add the project root directory to the Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from fangraphs_api_extractor.managers import PlayersManager
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.utils import BATTING_POSITIONS, Logger
+from tests.harness import FangraphsStandIn, ServerConfig
+
+
+def percentile(values: List[float], level: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(level / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_scenario(
+    server: FangraphsStandIn,
+    workers: int,
+    players: int,
+    max_retries: int,
+    backoff_factor: float,
+) -> Dict[str, float]:
+    """Fetch projections for every batting position plus stats pages for players"""
+    logger = Logger("load-test", use_queue=True)
+    core = CoreFangraphs(
+        year=2025,
+        logger=logger,
+        max_workers=workers,
+        fangraphs_url=server.url,
+        build_id=server.build_id,
+        max_retries=max_retries,
+        backoff_factor=backoff_factor,
+    )
+    server.reset_counts()
+
+    def timed(fn, *args, **kwargs) -> Optional[float]:
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        return time.perf_counter() - start if result is not None else None
+
+    jobs = [
+        (core.get_projections_data, ("bat",), {"position": p})
+        for p in BATTING_POSITIONS
+    ]
+    jobs.append((core.get_projections_data, ("pit",), {}))
+    jobs.extend(
+        (core.get_player_stats_data, (f"/players/p-{i}/{i}/stats.json?position=P",), {})
+        for i in range(players)
+    )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda job: timed(job[0], *job[1], **job[2]), jobs))
+    elapsed = time.perf_counter() - start
+
+    latencies = [r for r in results if r is not None]
+    return {
+        "workers": workers,
+        "requests": len(jobs),
+        "failed": len(jobs) - len(latencies),
+        "seconds": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000 if latencies else 0.0,
+        "p95_ms": percentile(latencies, 95) * 1000 if latencies else 0.0,
+        "p99_ms": percentile(latencies, 99) * 1000 if latencies else 0.0,
+        "mean_ms": statistics.mean(latencies) * 1000 if latencies else 0.0,
+        "http_429": server.status_counts.get(429, 0),
+        "http_503": server.status_counts.get(503, 0),
+        "http_404": server.status_counts.get(404, 0),
+    }
+
+
+def main() -> List[Dict[str, float]]:
+    parser = argparse.ArgumentParser(description="Load test against a local Fangraphs")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--players", type=int, default=500, help="Stats pages to fetch")
+    parser.add_argument("--payload_players", type=int, default=1500)
+    parser.add_argument("--latency_ms", type=float, default=50.0)
+    parser.add_argument("--latency_jitter_ms", type=float, default=50.0)
+    parser.add_argument(
+        "--bandwidth", type=int, default=0, help="Bytes/sec, 0 = unlimited"
+    )
+    parser.add_argument("--error_rate_429", type=float, default=0.0)
+    parser.add_argument("--error_rate_503", type=float, default=0.0)
+    parser.add_argument("--rotate_build_id_every", type=int, default=0)
+    parser.add_argument(
+        "--replay_dir",
+        type=str,
+        default=None,
+        help="Serve responses archived with --archive_dir instead of synthetic ones",
+    )
+    parser.add_argument("--max_retries", type=int, default=2)
+    parser.add_argument("--backoff_factor", type=float, default=0.1)
+    args = parser.parse_args()
+
+    config = ServerConfig(
+        hitters=args.payload_players,
+        pitchers=args.payload_players,
+        latency_ms=args.latency_ms,
+        latency_jitter_ms=args.latency_jitter_ms,
+        bandwidth=args.bandwidth,
+        error_rate_429=args.error_rate_429,
+        error_rate_503=args.error_rate_503,
+        rotate_build_id_every=args.rotate_build_id_every,
+        replay_dir=args.replay_dir,
+    )
+
+    reports = []
+    with FangraphsStandIn(config) as server:
+        # Sanity check the payload parses before timing anything
+        sample = CoreFangraphs(
+            2025,
+            Logger("load-test"),
+            fangraphs_url=server.url,
+            build_id=server.build_id,
+        ).get_projections_data("bat")
+        parsed = PlayersManager("hitters").parse_players(sample or {})
+        print(
+            f"Stand-in serving {len(parsed)} hitters per projections page at {server.url}"
+        )
+
+        for workers in args.workers:
+            reports.append(
+                run_scenario(
+                    server, workers, args.players, args.max_retries, args.backoff_factor
+                )
+            )
+
+    columns = [
+        "workers",
+        "requests",
+        "failed",
+        "seconds",
+        "throughput",
+        "p50_ms",
+        "p95_ms",
+        "p99_ms",
+        "http_429",
+        "http_503",
+        "http_404",
+    ]
+    print(" ".join(f"{c:>10}" for c in columns))
+    for report in reports:
+        print(
+            " ".join(
+                (
+                    f"{report[c]:>10.1f}"
+                    if isinstance(report[c], float)
+                    else f"{report[c]:>10}"
+                )
+                for c in columns
+            )
+        )
+    return reports
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Synthetic Fangraphs payloads built from the test fixtures.
+
+Shared by the debug benchmarks and the Fangraphs stand-in server in
+`tests/harness`, so both measure and serve the same response shapes.
+"""
+
+import copy
+import json
+import os
+from typing import Any, Dict, List
+
+FIXTURES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures"
+)
+
+
+def load_fixture(file_name: str) -> Any:
+    with open(os.path.join(FIXTURES_DIR, file_name), "r") as f:
+        return json.load(f)
+
+
+def hitter_templates() -> List[Dict]:
+    """Hitter records of the projections fixture"""
+    return load_fixture("hitter_projections.json")["pageProps"]["dehydratedState"][
+        "queries"
+    ][0]["state"]["data"]
+
+
+def pitcher_templates() -> List[Dict]:
+    """Pitcher records of the fixtures"""
+    return [load_fixture("pitcher_steamer.json")]
+
+
+def scale_records(templates: List[Dict], count: int, offset: int) -> List[Dict]:
+    """`count` copies of the templates with unique playerids starting at `offset`"""
+    records = []
+    for i in range(count):
+        record = copy.deepcopy(templates[i % len(templates)])
+        playerid = str(offset + i)
+        record["playerid"] = playerid
+        record["PlayerName"] = f"{record['PlayerName']} {i}"
+        if record.get("UPURL"):
+            record["UPURL"] = f"/players/player-{playerid}/{playerid}/stats"
+        records.append(record)
+    return records
+
+
+def wrap_response(data: Any) -> Dict:
+    """Wrap records the way the Next.js data endpoints do"""
+    return {
+        "pageProps": {
+            "dehydratedState": {"mutations": [], "queries": [{"state": {"data": data}}]}
+        },
+        "__N_SSP": True,
+    }
+
+
+def projections_body(hitters: int = 0, pitchers: int = 0) -> Dict[str, bytes]:
+    """Encoded "bat" and "pit" projections responses of the given sizes"""
+    return {
+        "bat": json.dumps(
+            wrap_response(scale_records(hitter_templates(), hitters, 100000))
+        ).encode(),
+        "pit": json.dumps(
+            wrap_response(scale_records(pitcher_templates(), pitchers, 500000))
+        ).encode(),
+    }
@@ -0,0 +1,23 @@
+__all__ = [
+    "Category",
+    "ConsensusBuilder",
+    "ConsensusTable",
+    "LeagueSettings",
+    "ProjectionSimulator",
+    "SimulationResult",
+    "ValuationEngine",
+    "ValuationResult",
+    "ValuationTable",
+    "projection_array",
+]
+
+from .arrays import projection_array
+from .consensus import ConsensusBuilder, ConsensusTable
+from .simulation import ProjectionSimulator, SimulationResult
+from .valuation import (
+    Category,
+    LeagueSettings,
+    ValuationEngine,
+    ValuationResult,
+    ValuationTable,
+)
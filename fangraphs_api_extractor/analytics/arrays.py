@@ -0,0 +1,53 @@
+"""
+Helpers for turning parsed player models into NumPy arrays.
+
+Pulling attributes off Pydantic models is the only per-player step; everything
+built on top of these arrays operates on whole columns at once.
+"""
+
+from typing import TYPE_CHECKING, List, Sequence
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from fangraphs_api_extractor.models import PlayerModel
+
+
+def projection_array(
+    players: Sequence["PlayerModel"],
+    system: str,
+    fields: Sequence[str],
+) -> np.ndarray:
+    """
+    Build a (players x fields) float array from one projection system.
+
+    Missing projections, missing attributes and None values become NaN so that
+    callers can mask them with vectorized operations.
+
+    Args:
+        players: Parsed player models
+        system: Projection system key in `PlayerModel.projections`
+        fields: Projection model attribute names to extract
+
+    Returns:
+        Array of shape (len(players), len(fields))
+    """
+    values: List[float] = []
+    for player in players:
+        projection = player.projections.get(system)
+        for field in fields:
+            value = getattr(projection, field, None) if projection else None
+            values.append(np.nan if value is None else float(value))
+
+    return np.array(values, dtype=np.float64).reshape(len(players), len(fields))
+
+
+def group_index(labels: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Map a sequence of labels to integer group codes.
+
+    Returns:
+        Tuple of (unique sorted labels, code for each input label)
+    """
+    unique, codes = np.unique(np.asarray(labels, dtype=object), return_inverse=True)
+    return unique, codes.reshape(-1)
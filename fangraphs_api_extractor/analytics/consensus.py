@@ -0,0 +1,294 @@
+"""
+Weighted consensus projections across projection systems.
+
+Projections are aligned by `playerid` into a (systems x players x fields) array.
+Counting stats are averaged with the system weights, renormalised per player
+over the systems that actually project them. Rate stats with a known formula are
+recomputed from the consensus counting stats (AVG from H/AB, ERA from ER/IP, ...)
+and the remaining rate stats are averaged weighted by playing time. Attributes
+of the player rather than of the projection (age) are taken from the first
+system, in weight order, that reports them.
+"""
+
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+    get_args,
+)
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from fangraphs_api_extractor.models import (
+    BaseProjectionModel,
+    HitterModel,
+    HitterProjectionModel,
+    PitcherModel,
+    PitcherProjectionModel,
+    PlayerModel,
+)
+from fangraphs_api_extractor.utils import PROJECTION_SYSTEMS
+
+CONSENSUS_SYSTEM = "consensus"
+
+# fmt: off
+HITTER_COUNTING_FIELDS = {
+    "games", "pa", "ab", "h", "singles", "doubles", "triples", "hr", "r", "rbi",
+    "bb", "ibb", "so", "hbp", "sf", "sh", "gdp", "sb", "cs", "war", "offense",
+    "defense", "bsr", "w_bsr", "batting", "fielding", "replacement", "positional",
+    "rar", "dollars", "wraa", "wrc", "ubr", "w_league", "off", "def_", "uzr",
+    "base_running", "gdp_runs", "fpts", "spts",
+}
+
+PITCHER_COUNTING_FIELDS = {
+    "wins", "losses", "games_started", "games", "saves", "holds", "blown_saves",
+    "innings_pitched", "total_batters_faced", "hits", "runs", "earned_runs",
+    "home_runs", "strikeouts", "walks", "intentional_walks", "hit_by_pitch", "war",
+    "ra9_war", "quality_starts", "fpts", "spts",
+}
+# fmt: on
+
+# Taken from a single system rather than blended
+FIRST_SYSTEM_FIELDS = {"age"}
+
+Stats = Dict[str, np.ndarray]
+RateFormula = Callable[[Stats], np.ndarray]
+
+
+def _int_fields(model_cls: Type[BaseModel]) -> Set[str]:
+    """Fields of a model annotated as int or Optional[int]"""
+    return {
+        name
+        for name, info in model_cls.model_fields.items()
+        if info.annotation is int or int in get_args(info.annotation)
+    }
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+HITTER_RATE_FORMULAS: Dict[str, RateFormula] = {
+    "avg": lambda s: _ratio(s["h"], s["ab"]),
+    "obp": lambda s: _ratio(
+        s["h"] + s["bb"] + s["hbp"], s["ab"] + s["bb"] + s["hbp"] + s["sf"]
+    ),
+    "slg": lambda s: _ratio(
+        s["singles"] + 2 * s["doubles"] + 3 * s["triples"] + 4 * s["hr"], s["ab"]
+    ),
+    "ops": lambda s: s["obp"] + s["slg"],
+    "iso": lambda s: s["slg"] - s["avg"],
+    "babip": lambda s: _ratio(s["h"] - s["hr"], s["ab"] - s["so"] - s["hr"] + s["sf"]),
+    "k_percent": lambda s: _ratio(s["so"], s["pa"]),
+    "bb_percent": lambda s: _ratio(s["bb"], s["pa"]),
+    "bb_k": lambda s: _ratio(s["bb"], s["so"]),
+}
+
+PITCHER_RATE_FORMULAS: Dict[str, RateFormula] = {
+    "era": lambda s: 9 * _ratio(s["earned_runs"], s["innings_pitched"]),
+    "whip": lambda s: _ratio(s["walks"] + s["hits"], s["innings_pitched"]),
+    "k_per_9": lambda s: 9 * _ratio(s["strikeouts"], s["innings_pitched"]),
+    "bb_per_9": lambda s: 9 * _ratio(s["walks"], s["innings_pitched"]),
+    "hr_per_9": lambda s: 9 * _ratio(s["home_runs"], s["innings_pitched"]),
+    "k_per_bb": lambda s: _ratio(s["strikeouts"], s["walks"]),
+    "k_percent": lambda s: _ratio(s["strikeouts"], s["total_batters_faced"]),
+    "bb_percent": lambda s: _ratio(s["walks"], s["total_batters_faced"]),
+    "k_bb_percent": lambda s: s["k_percent"] - s["bb_percent"],
+}
+
+
+class ConsensusTable(BaseModel):
+    """Consensus projections for one player group"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    group: str
+    playerids: List[str]
+    fields: List[str]
+    # Shape (n_players, n_fields)
+    values: np.ndarray
+    # Renormalised weight each system received, shape (n_players, n_systems)
+    system_weights: np.ndarray
+    systems: List[str]
+
+    def to_projection(
+        self, index: int, model_cls: Type[BaseProjectionModel]
+    ) -> Optional[BaseProjectionModel]:
+        """
+        Build a projection model for the player at `index`, if any system had one.
+
+        Blended values of int-typed fields (e.g. h, hr) are rounded.
+        """
+        if not self.system_weights[index].any():
+            return None
+        row = self.values[index]
+        int_fields = _int_fields(model_cls)
+        return model_cls.model_validate(
+            {
+                field: (int(round(row[j])) if field in int_fields else float(row[j]))
+                for j, field in enumerate(self.fields)
+                if not np.isnan(row[j])
+            }
+        )
+
+
+class ConsensusBuilder:
+    """
+    Blends projection systems into a weighted consensus projection.
+
+    Args:
+        weights: Weight per projection system; defaults to equal weights over
+            `PROJECTION_SYSTEMS`
+    """
+
+    def __init__(self, weights: Optional[Mapping[str, float]] = None):
+        self.weights = dict(weights or {s: 1.0 for s in PROJECTION_SYSTEMS})
+
+    def build(self, players: Sequence[PlayerModel]) -> Dict[str, ConsensusTable]:
+        """
+        Build consensus tables for hitters and pitchers.
+
+        Players may appear several times (e.g. one model per system pull);
+        their projections are merged by `playerid`.
+
+        Returns:
+            Dictionary with "hitters" and "pitchers" tables
+        """
+        return {
+            "hitters": self._build_group(
+                [p for p in players if isinstance(p, HitterModel)],
+                "hitters",
+                HitterProjectionModel,
+                HITTER_COUNTING_FIELDS,
+                HITTER_RATE_FORMULAS,
+                "pa",
+            ),
+            "pitchers": self._build_group(
+                [p for p in players if isinstance(p, PitcherModel)],
+                "pitchers",
+                PitcherProjectionModel,
+                PITCHER_COUNTING_FIELDS,
+                PITCHER_RATE_FORMULAS,
+                "innings_pitched",
+            ),
+        }
+
+    def apply(self, players: Sequence[PlayerModel]) -> Dict[str, ConsensusTable]:
+        """
+        Build consensus tables and attach `projections["consensus"]` to every model.
+
+        Returns:
+            The consensus tables that were applied
+        """
+        tables = self.build(players)
+        model_classes: Dict[str, Type[BaseProjectionModel]] = {
+            "hitters": HitterProjectionModel,
+            "pitchers": PitcherProjectionModel,
+        }
+        for group, table in tables.items():
+            row_by_id = {pid: i for i, pid in enumerate(table.playerids)}
+            cache: Dict[int, Optional[BaseProjectionModel]] = {}
+            group_cls = HitterModel if group == "hitters" else PitcherModel
+            for player in players:
+                if not isinstance(player, group_cls):
+                    continue
+                row = row_by_id[player.playerid]
+                if row not in cache:
+                    cache[row] = table.to_projection(row, model_classes[group])
+                projection = cache[row]
+                if projection is not None:
+                    player.projections[CONSENSUS_SYSTEM] = projection
+        return tables
+
+    def _build_group(
+        self,
+        players: Sequence[PlayerModel],
+        group: str,
+        model_cls: Type[BaseProjectionModel],
+        counting_fields: set,
+        rate_formulas: Dict[str, RateFormula],
+        playing_time_field: str,
+    ) -> ConsensusTable:
+        systems = [s for s in self.weights if s != CONSENSUS_SYSTEM]
+        fields = [f for f in model_cls.model_fields if f != "season"]
+
+        # Align every system's projection by playerid
+        merged: Dict[str, Dict[str, BaseProjectionModel]] = {}
+        for player in players:
+            merged.setdefault(player.playerid, {}).update(player.projections)
+        playerids = list(merged)
+
+        stack = np.full((len(systems), len(playerids), len(fields)), np.nan)
+        for i, pid in enumerate(playerids):
+            for s, system in enumerate(systems):
+                projection = merged[pid].get(system)
+                if projection is None:
+                    continue
+                for j, field in enumerate(fields):
+                    value = getattr(projection, field)
+                    if value is not None:
+                        stack[s, i, j] = value
+
+        present = ~np.isnan(stack)
+        system_weight = np.array([self.weights[s] for s in systems])[:, None, None]
+        field_index = {field: j for j, field in enumerate(fields)}
+
+        # Counting stats: system weights renormalised over systems with a value
+        counting_weight = np.where(present, system_weight, 0.0)
+        values = self._weighted_mean(stack, counting_weight)
+
+        # Other rate stats also weight each system by its playing time
+        playing_time = np.nan_to_num(stack[:, :, field_index[playing_time_field]])
+        rate_weight = counting_weight * playing_time[:, :, None]
+        rate_values = self._weighted_mean(stack, rate_weight)
+        rate_columns = [
+            j
+            for j, field in enumerate(fields)
+            if field not in counting_fields and field not in rate_formulas
+        ]
+        values[:, rate_columns] = rate_values[:, rate_columns]
+
+        # Player attributes come from the first system that reports them
+        players_index = np.arange(len(playerids))
+        for field in FIRST_SYSTEM_FIELDS & field_index.keys():
+            j = field_index[field]
+            first = np.argmax(present[:, :, j], axis=0)
+            values[:, j] = np.where(
+                present[:, :, j].any(axis=0), stack[first, players_index, j], np.nan
+            )
+
+        stats = {field: values[:, j] for j, field in enumerate(fields)}
+        for field, formula in rate_formulas.items():
+            stats[field] = formula(stats)
+            values[:, field_index[field]] = stats[field]
+
+        has_any = present.any(axis=2)
+        row_weight = np.where(has_any, system_weight[:, :, 0], 0.0)
+        totals = row_weight.sum(axis=0)
+        normalised = np.divide(
+            row_weight, totals, out=np.zeros_like(row_weight), where=totals > 0
+        )
+
+        return ConsensusTable(
+            group=group,
+            playerids=playerids,
+            fields=fields,
+            values=values,
+            system_weights=normalised.T,
+            systems=systems,
+        )
+
+    @staticmethod
+    def _weighted_mean(stack: np.ndarray, weight: np.ndarray) -> np.ndarray:
+        total = weight.sum(axis=0)
+        weighted = (np.nan_to_num(stack) * weight).sum(axis=0)
+        return np.divide(
+            weighted, total, out=np.full_like(weighted, np.nan), where=total > 0
+        )
@@ -0,0 +1,166 @@
+"""
+Monte Carlo simulation of fantasy output from projection percentiles.
+
+Fangraphs publishes q10..q90 (observed outcome) and tt_q10..tt_q90 (true talent)
+percentiles with every projection. For hitters these are wOBA percentiles, for
+pitchers ERA percentiles. Each player's percentiles are treated as knots of a
+piecewise-linear quantile function, extrapolated linearly past q10 and q90, and
+sampled for all players at once by inverse transform.
+
+Simulated outcomes are turned into fantasy points by scaling the projected
+`fpts` by the ratio of the simulated outcome to the median (inverted for
+pitchers, where a lower ERA is better).
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from fangraphs_api_extractor.analytics.arrays import group_index, projection_array
+from fangraphs_api_extractor.models import PitcherModel, PlayerModel
+
+PERCENTILE_LEVELS = np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9])
+PERCENTILE_FIELDS = [f"q{int(level * 100)}" for level in PERCENTILE_LEVELS]
+TRUE_TALENT_PERCENTILE_FIELDS = [f"tt_{field}" for field in PERCENTILE_FIELDS]
+
+# Keeps the pitcher ratio finite when the lower tail extrapolates towards zero
+MIN_OUTCOME = 1e-3
+
+
+class SimulationResult(BaseModel):
+    """Simulated fantasy points for a set of players"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    playerids: List[str]
+    teams: List[str]
+    system: str
+    # Shape (n_draws, n_players)
+    fantasy_points: np.ndarray
+
+    @property
+    def n_draws(self) -> int:
+        return int(self.fantasy_points.shape[0])
+
+    def percentiles(self, levels: Sequence[float] = (10, 50, 90)) -> np.ndarray:
+        """Per-player percentiles of simulated points, shape (len(levels), n_players)"""
+        return np.percentile(self.fantasy_points, levels, axis=0)
+
+    def team_totals(
+        self, assignments: Optional[Dict[str, str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Sum simulated points per team for every draw.
+
+        Args:
+            assignments: Optional playerid -> team name mapping (e.g. fantasy
+                rosters). Players missing from the mapping are left out. When
+                omitted, players are grouped by their MLB team.
+
+        Returns:
+            Dictionary of team name -> array of shape (n_draws,)
+        """
+        if assignments is None:
+            labels = self.teams
+            columns = np.arange(len(self.playerids))
+        else:
+            columns = np.array(
+                [i for i, pid in enumerate(self.playerids) if pid in assignments],
+                dtype=np.intp,
+            )
+            labels = [assignments[self.playerids[i]] for i in columns]
+
+        if len(columns) == 0:
+            return {}
+
+        names, codes = group_index(labels)
+        membership = np.zeros((len(columns), len(names)))
+        membership[np.arange(len(columns)), codes] = 1.0
+        totals = self.fantasy_points[:, columns] @ membership
+
+        return {str(name): totals[:, j] for j, name in enumerate(names)}
+
+
+class ProjectionSimulator:
+    """
+    Draws fantasy point outcomes for many players from their projection percentiles.
+
+    Quantile knots and projected points are extracted once at construction so
+    that repeated `simulate` calls only do array arithmetic.
+    """
+
+    def __init__(
+        self,
+        players: Sequence[PlayerModel],
+        system: str = "steamer",
+        true_talent: bool = False,
+    ):
+        self.system = system
+        self.playerids = [p.playerid for p in players]
+        self.teams = [p.team for p in players]
+
+        fields = TRUE_TALENT_PERCENTILE_FIELDS if true_talent else PERCENTILE_FIELDS
+        knots = projection_array(players, system, fields)
+        # Pitcher percentiles are ordered by performance (q90 is the lowest
+        # ERA), so sort every row into an ascending quantile function
+        knots = np.sort(knots, axis=1)
+
+        self.has_distribution = ~np.isnan(knots).any(axis=1)
+        # Players without percentiles get a flat quantile function at 1.0 so
+        # they simulate to exactly their projected points
+        self.knots = np.where(self.has_distribution[:, None], knots, 1.0)
+        self.median = self.knots[:, 4]
+
+        fpts = projection_array(players, system, ["fpts"])[:, 0]
+        self.fpts = np.nan_to_num(fpts, nan=0.0)
+        self.lower_is_better = np.array(
+            [isinstance(p, PitcherModel) for p in players], dtype=bool
+        )
+
+    def sample_outcomes(
+        self, n_draws: int, rng: Optional[np.random.Generator] = None
+    ) -> np.ndarray:
+        """
+        Sample raw outcomes (wOBA for hitters, ERA for pitchers).
+
+        Returns:
+            Array of shape (n_draws, n_players)
+        """
+        rng = rng if rng is not None else np.random.default_rng()
+        n_players = self.knots.shape[0]
+        u = rng.random((n_draws, n_players))
+
+        # Segment j spans PERCENTILE_LEVELS[j]..PERCENTILE_LEVELS[j + 1]; the
+        # outer segments are reused to extrapolate into the tails
+        segment = np.clip(np.floor(u * 10).astype(np.intp) - 1, 0, 7)
+        columns = np.arange(n_players)
+        lower = self.knots[columns, segment]
+        upper = self.knots[columns, segment + 1]
+        weight = (u - PERCENTILE_LEVELS[segment]) / 0.1
+
+        return lower + weight * (upper - lower)
+
+    def simulate(self, n_draws: int, seed: Optional[int] = None) -> SimulationResult:
+        """
+        Simulate fantasy points for every player.
+
+        Args:
+            n_draws: Number of Monte Carlo draws
+            seed: Optional seed for reproducible draws
+
+        Returns:
+            SimulationResult holding an (n_draws, n_players) points array
+        """
+        outcomes = np.maximum(
+            self.sample_outcomes(n_draws, np.random.default_rng(seed)), MIN_OUTCOME
+        )
+        median = np.maximum(self.median, MIN_OUTCOME)
+        factor = np.where(self.lower_is_better, median / outcomes, outcomes / median)
+
+        return SimulationResult(
+            playerids=self.playerids,
+            teams=self.teams,
+            system=self.system,
+            fantasy_points=factor * self.fpts,
+        )
@@ -0,0 +1,393 @@
+"""
+Custom league scoring and auction valuation.
+
+Projections for every hitter and pitcher in every system are pulled into
+column arrays once. Each valuation then scores all players of a (group, system)
+pair with array operations: fantasy points from a scoring table, category
+z-scores or SGP, replacement level per position from `min_position`, and
+auction dollars from value above replacement. Results are memoized by a hash of
+the league settings, so what-if settings only pay for the array math.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Dict, List, Literal, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+from fangraphs_api_extractor.analytics.arrays import projection_array
+from fangraphs_api_extractor.models import HitterModel, PitcherModel, PlayerModel
+from fangraphs_api_extractor.utils import PROJECTION_SYSTEMS
+
+PlayerGroup = Literal["hitters", "pitchers"]
+
+# Slots any player of the group can fill
+FLEX_POSITIONS = {"hitters": "UT", "pitchers": "P"}
+
+
+class Category(BaseModel):
+    """A rotisserie category scored from a projection model attribute"""
+
+    field: str
+    higher_is_better: bool = True
+    # Playing-time attribute that weights a rate stat (e.g. "ab" for avg)
+    denominator: Optional[str] = None
+
+
+class LeagueSettings(BaseModel):
+    """Scoring, roster and auction settings for a league"""
+
+    teams: int = 12
+    budget: float = 260.0
+    hitter_budget_share: float = 0.67
+    min_bid: float = 1.0
+    basis: Literal["categories", "points"] = "categories"
+
+    hitter_slots: Dict[str, int] = Field(
+        default_factory=lambda: {
+            "C": 1,
+            "1B": 1,
+            "2B": 1,
+            "3B": 1,
+            "SS": 1,
+            "OF": 5,
+            "UT": 1,
+        }
+    )
+    pitcher_slots: Dict[str, int] = Field(default_factory=lambda: {"P": 9})
+
+    hitter_points: Dict[str, float] = Field(default_factory=dict)
+    pitcher_points: Dict[str, float] = Field(default_factory=dict)
+
+    hitter_categories: List[Category] = Field(
+        default_factory=lambda: [
+            Category(field="r"),
+            Category(field="hr"),
+            Category(field="rbi"),
+            Category(field="sb"),
+            Category(field="avg", denominator="ab"),
+        ]
+    )
+    pitcher_categories: List[Category] = Field(
+        default_factory=lambda: [
+            Category(field="wins"),
+            Category(field="saves"),
+            Category(field="strikeouts"),
+            Category(
+                field="era", higher_is_better=False, denominator="innings_pitched"
+            ),
+            Category(
+                field="whip", higher_is_better=False, denominator="innings_pitched"
+            ),
+        ]
+    )
+
+    # Standings gain points per unit of each category; z-scores are used for
+    # categories without a denominator here
+    sgp_denominators: Dict[str, float] = Field(default_factory=dict)
+
+    @property
+    def config_hash(self) -> str:
+        """Stable hash of the settings used as the memoization key"""
+        payload = json.dumps(self.model_dump(), sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def slots(self, group: PlayerGroup) -> Dict[str, int]:
+        return self.hitter_slots if group == "hitters" else self.pitcher_slots
+
+    def points(self, group: PlayerGroup) -> Dict[str, float]:
+        return self.hitter_points if group == "hitters" else self.pitcher_points
+
+    def categories(self, group: PlayerGroup) -> List[Category]:
+        return self.hitter_categories if group == "hitters" else self.pitcher_categories
+
+    def group_budget(self, group: PlayerGroup) -> float:
+        share = self.hitter_budget_share
+        return self.teams * self.budget * (share if group == "hitters" else 1 - share)
+
+
+class ValuationTable(BaseModel):
+    """Valuation of one player group under one projection system"""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    group: str
+    system: str
+    playerids: List[str]
+    points: np.ndarray
+    category_names: List[str]
+    # Shape (n_players, n_categories)
+    category_scores: np.ndarray
+    value: np.ndarray
+    replacement: np.ndarray
+    dollars: np.ndarray
+
+    def to_records(self) -> List[Dict[str, object]]:
+        """Row-oriented view of the table for serialization"""
+        return [
+            {
+                "playerid": pid,
+                "group": self.group,
+                "system": self.system,
+                "points": float(self.points[i]),
+                "categories": dict(
+                    zip(self.category_names, self.category_scores[i].tolist())
+                ),
+                "value": float(self.value[i]),
+                "replacement": float(self.replacement[i]),
+                "dollars": float(self.dollars[i]),
+            }
+            for i, pid in enumerate(self.playerids)
+        ]
+
+
+class ValuationResult(BaseModel):
+    """Valuation tables for every (group, system) under one set of settings"""
+
+    config_hash: str
+    tables: Dict[str, Dict[str, ValuationTable]]
+
+    def table(self, group: PlayerGroup, system: str) -> ValuationTable:
+        return self.tables[group][system]
+
+
+class ValuationEngine:
+    """
+    Values every hitter and pitcher across projection systems for league settings.
+
+    Stat columns are extracted from the models lazily and cached, and whole
+    valuations are memoized by `LeagueSettings.config_hash`.
+    """
+
+    def __init__(
+        self,
+        players: Sequence[PlayerModel],
+        systems: Optional[Sequence[str]] = None,
+        cache_size: int = 32,
+    ):
+        self.groups: Dict[str, List[PlayerModel]] = {
+            "hitters": [p for p in players if isinstance(p, HitterModel)],
+            "pitchers": [p for p in players if isinstance(p, PitcherModel)],
+        }
+        self.systems = list(systems) if systems is not None else PROJECTION_SYSTEMS
+        self.cache_size = cache_size
+
+        self._columns: Dict[Tuple[str, str, str], np.ndarray] = {}
+        self._projected_masks: Dict[Tuple[str, str], np.ndarray] = {}
+        self._results: "OrderedDict[str, ValuationResult]" = OrderedDict()
+        self._eligibility = {
+            group: [self._positions(p, FLEX_POSITIONS[group]) for p in members]
+            for group, members in self.groups.items()
+        }
+
+    @staticmethod
+    def _positions(player: PlayerModel, flex: str) -> List[str]:
+        positions = [pos for pos in (player.min_position or "").split("/") if pos]
+        return positions + [flex]
+
+    def _projected(self, group: str, system: str) -> np.ndarray:
+        """Mask of players that have a projection in the given system"""
+        key = (group, system)
+        if key not in self._projected_masks:
+            self._projected_masks[key] = np.array(
+                [system in p.projections for p in self.groups[group]], dtype=bool
+            )
+        return self._projected_masks[key]
+
+    def _column(self, group: str, system: str, field: str) -> np.ndarray:
+        key = (group, system, field)
+        if key not in self._columns:
+            self._columns[key] = projection_array(self.groups[group], system, [field])[
+                :, 0
+            ]
+        return self._columns[key]
+
+    def _matrix(self, group: str, system: str, fields: Sequence[str]) -> np.ndarray:
+        if not fields:
+            return np.zeros((len(self.groups[group]), 0))
+        return np.column_stack([self._column(group, system, f) for f in fields])
+
+    def value(self, settings: Optional[LeagueSettings] = None) -> ValuationResult:
+        """
+        Value all players under the given settings, reusing memoized results.
+
+        Args:
+            settings: League settings; defaults to a 12-team 5x5 auction league
+
+        Returns:
+            ValuationResult with a table per player group and projection system
+        """
+        settings = settings or LeagueSettings()
+        key = settings.config_hash
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        tables: Dict[str, Dict[str, ValuationTable]] = {}
+        for group in ("hitters", "pitchers"):
+            tables[group] = {}
+            for system in self.systems:
+                tables[group][system] = self._value_group(settings, group, system)
+
+        result = ValuationResult(config_hash=key, tables=tables)
+        self._results[key] = result
+        if len(self._results) > self.cache_size:
+            self._results.popitem(last=False)
+        return result
+
+    def _value_group(
+        self, settings: LeagueSettings, group: PlayerGroup, system: str
+    ) -> ValuationTable:
+        members = self.groups[group]
+        n = len(members)
+        slots = settings.slots(group)
+        roster_size = settings.teams * sum(slots.values())
+
+        # Players without a projection in this system are valued at nothing
+        projected = self._projected(group, system)
+
+        scoring = settings.points(group)
+        stats = np.nan_to_num(self._matrix(group, system, list(scoring)))
+        points = stats @ np.array(list(scoring.values()), dtype=np.float64)
+
+        categories = settings.categories(group)
+        scores = np.zeros((n, len(categories)))
+        if settings.basis == "points":
+            value = points.copy()
+        else:
+            # Rank once by a provisional score, then recompute category scores
+            # against the pool of players who would actually be rostered
+            pool = projected.copy()
+            for _ in range(2):
+                scores = self._category_scores(settings, group, system, pool)
+                value = scores.sum(axis=1)
+                pool = self._top_mask(value, projected, roster_size)
+
+        value = np.where(projected, value, -np.inf)
+        replacement = self._replacement(settings, group, value)
+        surplus = np.where(projected, value - replacement, 0.0)
+        dollars = self._dollars(settings, group, surplus, roster_size)
+
+        return ValuationTable(
+            group=group,
+            system=system,
+            playerids=[p.playerid for p in members],
+            points=points,
+            category_names=[c.field for c in categories],
+            category_scores=scores,
+            value=np.where(projected, value, np.nan),
+            replacement=replacement,
+            dollars=dollars,
+        )
+
+    def _category_scores(
+        self,
+        settings: LeagueSettings,
+        group: PlayerGroup,
+        system: str,
+        pool: np.ndarray,
+    ) -> np.ndarray:
+        categories = settings.categories(group)
+        n = len(self.groups[group])
+        scores = np.zeros((n, len(categories)))
+        if not pool.any():
+            return scores
+
+        for j, category in enumerate(categories):
+            stat = np.nan_to_num(self._column(group, system, category.field))
+            if category.denominator:
+                # Rate stats count in proportion to playing time
+                weight = np.nan_to_num(
+                    self._column(group, system, category.denominator)
+                )
+                pool_weight = weight[pool].sum()
+                league_rate = (
+                    (stat[pool] * weight[pool]).sum() / pool_weight
+                    if pool_weight
+                    else 0.0
+                )
+                mean_weight = weight[pool].mean()
+                contribution = (stat - league_rate) * weight / (mean_weight or 1.0)
+            else:
+                contribution = stat - stat[pool].mean()
+
+            if not category.higher_is_better:
+                contribution = -contribution
+
+            sgp = settings.sgp_denominators.get(category.field)
+            if sgp:
+                scores[:, j] = contribution / sgp
+            else:
+                spread = contribution[pool].std()
+                scores[:, j] = contribution / spread if spread else 0.0
+
+        return scores
+
+    @staticmethod
+    def _top_mask(value: np.ndarray, eligible: np.ndarray, count: int) -> np.ndarray:
+        ranked = np.where(eligible, value, -np.inf)
+        order = np.argsort(-ranked, kind="stable")[:count]
+        mask = np.zeros(len(value), dtype=bool)
+        mask[order] = True
+        return mask & eligible
+
+    def _replacement(
+        self, settings: LeagueSettings, group: PlayerGroup, value: np.ndarray
+    ) -> np.ndarray:
+        """
+        Replacement level per player.
+
+        Each position's replacement level is the value of the first player past
+        the league's rostered count at that position (the flex slot counts every
+        slot of the group). A player is measured against the lowest replacement
+        level among the positions they are eligible for. Overlapping eligibility is
+        not solved as an assignment problem.
+        """
+        slots = settings.slots(group)
+        positions = list(slots)
+        n = len(value)
+        if n == 0:
+            return np.zeros(0)
+
+        eligible = np.zeros((n, len(positions)), dtype=bool)
+        column = {pos: j for j, pos in enumerate(positions)}
+        for i, player_positions in enumerate(self._eligibility[group]):
+            for pos in player_positions:
+                if pos in column:
+                    eligible[i, column[pos]] = True
+
+        counts = np.array(
+            [
+                settings.teams
+                * (sum(slots.values()) if pos == FLEX_POSITIONS[group] else slots[pos])
+                for pos in positions
+            ]
+        )
+
+        # Column-wise descending sort of values among eligible players
+        ranked = -np.sort(-np.where(eligible, value[:, None], -np.inf), axis=0)
+        index = np.minimum(counts, n - 1)
+        levels = ranked[index, np.arange(len(positions))]
+        # Positions too thin to fill fall back to a zero replacement level
+        levels = np.where(np.isfinite(levels), levels, 0.0)
+
+        per_player = np.where(eligible, levels[None, :], np.inf).min(axis=1)
+        return np.where(np.isfinite(per_player), per_player, 0.0)
+
+    @staticmethod
+    def _dollars(
+        settings: LeagueSettings,
+        group: PlayerGroup,
+        surplus: np.ndarray,
+        roster_size: int,
+    ) -> np.ndarray:
+        drafted = ValuationEngine._top_mask(surplus, surplus > 0, roster_size)
+        total_surplus = surplus[drafted].sum()
+        spendable = settings.group_budget(group) - settings.min_bid * roster_size
+        if total_surplus <= 0 or spendable <= 0:
+            return np.zeros(len(surplus))
+
+        rate = spendable / total_surplus
+        return np.where(drafted, settings.min_bid + surplus * rate, 0.0)
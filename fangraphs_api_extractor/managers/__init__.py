@@ -1,3 +1,6 @@
-__all__ = ["PlayersManager"]
+__all__ = ["HydrationManager", "LeaderboardsManager", "PlayersManager", "SplitsManager"]
 
+from .hydration_manager import HydrationManager
+from .leaderboards_manager import LeaderboardsManager
 from .players_manager import PlayersManager
+from .splits_manager import SplitsManager
@@ -0,0 +1,142 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from tqdm import tqdm
+
+from fangraphs_api_extractor.models import PlayerModel
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.utils import Logger, RateLimiter, get_nested_values
+
+from .players_manager import FG_PAGE_PROPS_API_PATH
+
+# A two-way player has a hitter and a pitcher stats page under one playerid
+HydrationKey = Tuple[str, Optional[str]]
+
+
+class HydrationManager:
+    """
+    Fetches per-player stats pages concurrently and attaches them to the models.
+
+    Requests go through the pooled `CoreFangraphs` session with at most
+    `max_workers` in flight and an optional requests-per-second cap. Completed
+    players are appended to a JSON lines state file, so an interrupted
+    hydration resumes with only the players still missing. Players are keyed
+    on (playerid, player_type), so both halves of a two-way player are fetched.
+    """
+
+    def __init__(
+        self,
+        core: CoreFangraphs,
+        state_path: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+    ):
+        self.logger = Logger("hydration_manager")
+        self.log = self.logger.logging
+        self.core = core
+        self.state_path = state_path
+        self.max_workers = max_workers or core.max_workers
+        self.rate_limiter = RateLimiter(requests_per_second)
+        self.state_lock = Lock()
+        self.hydrated: Dict[HydrationKey, Any] = self._load_state()
+
+    @staticmethod
+    def _key(player: PlayerModel) -> HydrationKey:
+        return (player.playerid, getattr(player, "player_type", None))
+
+    def _load_state(self) -> Dict[HydrationKey, Any]:
+        hydrated: Dict[HydrationKey, Any] = {}
+        if not self.state_path or not os.path.exists(self.state_path):
+            return hydrated
+
+        with open(self.state_path, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line from an interrupted run
+                    continue
+                hydrated[(entry["playerid"], entry.get("player_type"))] = entry["stats"]
+
+        self.log.info(f"Resuming hydration with {len(hydrated)} players already done")
+        return hydrated
+
+    def _save(self, key: HydrationKey, stats: Any) -> None:
+        playerid, player_type = key
+        entry = {"playerid": playerid, "player_type": player_type, "stats": stats}
+        with self.state_lock:
+            self.hydrated[key] = stats
+            if self.state_path:
+                with open(self.state_path, "a") as f:
+                    f.write(json.dumps(entry) + "\n")
+
+    @staticmethod
+    def parse_stats(raw_data: Dict[str, Any]) -> Any:
+        """Extract the stats data from a stats page response"""
+        page_props = raw_data.get("pageProps", raw_data)
+        try:
+            data = get_nested_values(page_props, FG_PAGE_PROPS_API_PATH)
+        except (AssertionError, IndexError):
+            data = None
+        return data if data is not None else page_props
+
+    def _fetch(self, player: PlayerModel) -> Optional[Any]:
+        self.rate_limiter.acquire()
+        raw_data = self.core.get_player_stats_data(player.stats_api)
+        if raw_data is None:
+            return None
+        return self.parse_stats(raw_data)
+
+    def hydrate(self, players: Sequence[PlayerModel]) -> List[PlayerModel]:
+        """
+        Attach stats to every player, fetching only those not yet hydrated.
+
+        Args:
+            players: Parsed player models
+
+        Returns:
+            Players that failed to hydrate and will be retried on the next run
+        """
+        pending: Dict[HydrationKey, List[PlayerModel]] = {}
+        for player in players:
+            key = self._key(player)
+            if key in self.hydrated:
+                player.stats = self.hydrated[key]
+            else:
+                pending.setdefault(key, []).append(player)
+
+        self.log.info(
+            f"Hydrating {len(pending)} players "
+            f"({len(players) - sum(map(len, pending.values()))} already hydrated)"
+        )
+
+        failed: List[PlayerModel] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._fetch, group[0]): key
+                for key, group in pending.items()
+            }
+            for future in tqdm(
+                as_completed(futures), total=len(futures), desc="Hydrating"
+            ):
+                key = futures[future]
+                try:
+                    stats = future.result()
+                except Exception as e:
+                    self.log.warning(f"Error hydrating player {key[0]} ({key[1]}): {e}")
+                    stats = None
+
+                if stats is None:
+                    failed.extend(pending[key])
+                    continue
+
+                self._save(key, stats)
+                for player in pending[key]:
+                    player.stats = stats
+
+        if failed:
+            self.log.warning(f"{len(failed)} players failed to hydrate")
+        return failed
@@ -0,0 +1,201 @@
+import math
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from fangraphs_api_extractor.models import PlayerModel
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.utils import Logger
+from fangraphs_api_extractor.utils.constants import LEADERBOARD_PAGE_SIZE
+
+# Key of the actual season stats in `player.projections`
+LEADERBOARD_SOURCE = "actual"
+
+
+class LeaderboardsManager:
+    """
+    Pulls paginated season leaderboards (actual stats) into player models.
+
+    The first page of every requested season is fetched concurrently; once a
+    first page reports the leaderboard's total row count, the rest of that
+    season's pages are queued on the same worker pool, so a multi-season pull
+    runs in parallel rather than page by page. Rows are parsed as their pages
+    arrive, into the hitter/pitcher models with the stats stored under
+    `projections["actual"]`, validated by the same projection field definitions.
+    """
+
+    def __init__(
+        self,
+        core: CoreFangraphs,
+        max_workers: Optional[int] = None,
+        page_size: int = LEADERBOARD_PAGE_SIZE,
+        fields: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            core: Fangraphs client used for the page requests
+            max_workers: Pages fetched at once (default: the client's pool size)
+            page_size: Rows per leaderboard page
+            fields: Optional stat attribute names (e.g. ["hr", "avg"]) to validate;
+                all other stats are skipped
+        """
+        self.logger = Logger("leaderboards_manager")
+        self.log = self.logger.logging
+        self.core = core
+        self.max_workers = max_workers or core.max_workers
+        self.page_size = page_size
+        self.fields: Optional[FrozenSet[str]] = (
+            frozenset(fields) if fields is not None else None
+        )
+        # (season, page) of every page of the last pull that could not be fetched
+        self.failed_pages: List[Tuple[int, int]] = []
+
+    @staticmethod
+    def normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Reshape a leaderboard row into the projections record layout.
+
+        Leaderboards report the team as a link (with the abbreviation in
+        "TeamNameAbb"), numeric player ids and seasons, and the position as
+        "position" rather than "minpos".
+        """
+        record = dict(row)
+        if record.get("TeamNameAbb"):
+            record["Team"] = record["TeamNameAbb"]
+        if record.get("playerid") is not None:
+            record["playerid"] = str(record["playerid"])
+        if record.get("Season") is not None:
+            record["Season"] = str(record["Season"])
+        if "minpos" not in record and record.get("position"):
+            record["minpos"] = record["position"]
+        return record
+
+    def parse_rows(self, rows: Iterable[Dict[str, Any]]) -> List[PlayerModel]:
+        """Parse leaderboard rows, skipping (and logging) rows that fail validation"""
+        players: List[PlayerModel] = []
+        for i, row in enumerate(rows):
+            try:
+                players.append(
+                    PlayerModel.parse_player(
+                        self.normalize_row(row), LEADERBOARD_SOURCE, self.fields
+                    )
+                )
+            except Exception as e:
+                self.log.warning(
+                    f"Error parsing leaderboard row {i + 1} "
+                    f"({row.get('PlayerName')}): {e}"
+                )
+        return players
+
+    def _remaining_pages(self, data: Dict[str, Any], page: int) -> List[int]:
+        """Pages still to fetch after `page`, from the total count if reported"""
+        total = data.get("totalCount")
+        if isinstance(total, int):
+            if page != 1:
+                return []
+            return list(range(2, math.ceil(total / self.page_size) + 1))
+        # Without a total, keep paging while pages come back full
+        if len(data.get("data") or []) >= self.page_size:
+            return [page + 1]
+        return []
+
+    def iter_pages(
+        self, position_group: str, seasons: Iterable[int]
+    ) -> Iterator[Tuple[int, int, List[PlayerModel]]]:
+        """
+        Fetch every page of each season's leaderboard concurrently.
+
+        Args:
+            position_group: Type of player data (bat, pit, sta, rel)
+            seasons: Seasons to pull
+
+        Yields:
+            (season, page, parsed players), in the order pages complete
+        """
+        self.failed_pages = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures: Dict[Future, Tuple[int, int]] = {}
+
+            def submit(season: int, page: int) -> None:
+                future = executor.submit(
+                    self.core.get_leaderboard_page,
+                    position_group,
+                    season,
+                    page,
+                    self.page_size,
+                )
+                futures[future] = (season, page)
+
+            for season in seasons:
+                submit(season, 1)
+
+            try:
+                while futures:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        season, page = futures.pop(future)
+                        try:
+                            data = future.result()
+                        except Exception as e:
+                            self.log.warning(
+                                f"Error fetching {season} page {page}: {e}"
+                            )
+                            data = None
+
+                        if not isinstance(data, dict):
+                            self.failed_pages.append((season, page))
+                            continue
+
+                        for next_page in self._remaining_pages(data, page):
+                            submit(season, next_page)
+                        yield season, page, self.parse_rows(data.get("data") or [])
+            finally:
+                # A consumer that stops early should not wait for unused pages
+                for future in futures:
+                    future.cancel()
+
+    def pull(
+        self, position_group: str, seasons: Iterable[int]
+    ) -> Dict[int, List[PlayerModel]]:
+        """
+        Pull the full leaderboards of several seasons.
+
+        Args:
+            position_group: Type of player data (bat, pit, sta, rel)
+            seasons: Seasons to pull
+
+        Returns:
+            Players by season, in leaderboard order; pages that failed are listed
+            in `failed_pages` and missing from the result
+        """
+        seasons = list(seasons)
+        pages: Dict[int, Dict[int, List[PlayerModel]]] = {
+            season: {} for season in seasons
+        }
+        for season, page, players in self.iter_pages(position_group, seasons):
+            pages[season][page] = players
+
+        results: Dict[int, List[PlayerModel]] = {}
+        for season, season_pages in pages.items():
+            results[season] = [
+                player for page in sorted(season_pages) for player in season_pages[page]
+            ]
+            self.log.info(
+                f"Pulled {len(results[season])} {position_group} leaderboard rows "
+                f"for {season} in {len(season_pages)} pages"
+            )
+
+        if self.failed_pages:
+            self.log.warning(
+                f"{len(self.failed_pages)} leaderboard pages failed: "
+                f"{sorted(self.failed_pages)}"
+            )
+        return results
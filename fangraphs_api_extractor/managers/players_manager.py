@@ -1,7 +1,23 @@
-from typing import Any, Dict, List
+import json
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
 
 from fangraphs_api_extractor.models.base_player import PlayerModel
-from fangraphs_api_extractor.utils import Logger, get_nested_values
+from fangraphs_api_extractor.models.lazy_player import LazyPlayer
+from fangraphs_api_extractor.models.structs import decode_records, record_dict
+from fangraphs_api_extractor.utils import Logger, RecordPredicate, get_nested_values
+
+if TYPE_CHECKING:
+    from fangraphs_api_extractor.storage.parse_cache import ParseCache
+    from fangraphs_api_extractor.storage.spill import SpillingPlayerList
 
 FG_PAGE_PROPS_API_PATH: List[str | int] = [
     "dehydratedState",
@@ -12,11 +28,63 @@ FG_PAGE_PROPS_API_PATH: List[str | int] = [
 ]
 
 
+DECODING_BACKENDS = ["pydantic", "msgspec"]
+
+
 class PlayersManager:
-    def __init__(self, player_group: str = "hitters"):
+    def __init__(
+        self,
+        player_group: str = "hitters",
+        projection_system: str = "steamer",
+        backend: str = "pydantic",
+        players: Optional["SpillingPlayerList"] = None,
+        lazy: bool = False,
+        cache: Optional["ParseCache"] = None,
+    ):
+        """
+        Args:
+            player_group: "hitters" or "pitchers"
+            projection_system: Projection system of the parsed data
+            backend: "pydantic" validates the decoded dict tree record by record;
+                "msgspec" decodes response bytes straight into typed structs and
+                converts them to the pydantic models (needs the msgspec extra)
+            players: Optional memory-bounded container to append parsed players
+                to (see `storage.SpillingPlayerList`); may be shared by several
+                managers so all their players stay under one budget
+            lazy: Return `LazyPlayer` proxies that keep each raw record and
+                validate its fields or projection only when first accessed
+            cache: Optional `storage.ParseCache`; raw response bytes parsed
+                without `where` predicates are looked up by content hash and
+                reloaded instead of re-validated
+        """
+        if backend not in DECODING_BACKENDS:
+            raise ValueError(f"Unknown decoding backend: {backend}")
         self.logger = Logger(f"{player_group}_players_manager")
         self.log = self.logger.logging
-        self.players: List[PlayerModel] = []
+        self.player_group = player_group
+        self.projection_system = projection_system
+        self.backend = backend
+        self.lazy = lazy
+        self.cache = cache
+        self.players: List[PlayerModel] | SpillingPlayerList = (
+            players if players is not None else []
+        )
+        self.fields: Optional[FrozenSet[str]] = None
+        self.predicates: List[RecordPredicate] = []
+        self.stop_at: Optional[int] = None
+
+    def _accepts(self, record: Dict[str, Any]) -> bool:
+        """Whether a raw record passes every predicate"""
+        return all(predicate(record) for predicate in self.predicates)
+
+    def _build_player(self, data: Dict[str, Any]) -> Any:
+        """Parse a record into a model, or wrap it in a lazy proxy"""
+        if self.lazy:
+            return LazyPlayer(data, self.projection_system, self.fields)
+        return PlayerModel.parse_player(data, self.projection_system, self.fields)
+
+    def _limit_reached(self) -> bool:
+        return self.stop_at is not None and len(self.players) >= self.stop_at
 
     def _parse_nested_player_data(self, data: Dict[str, Any]):
         if self.log:
@@ -28,15 +96,23 @@ class PlayersManager:
                 self.log.debug(f"Found {len(unnested_data)} players in unnested data")
 
             for i, player_data in enumerate(unnested_data):
+                if self._limit_reached():
+                    self.log.debug(f"Limit reached after {i} records")
+                    break
+                if not self._accepts(player_data):
+                    continue
+
                 if self.log and i < 5:  # Log details for first 5 players only
                     self.log.debug(f"Processing player {i + 1} of {len(unnested_data)}")
                     self.log.debug(f"Player data keys: {list(player_data.keys())[:5]}")
 
                 try:
-                    player = PlayerModel.parse_player(player_data)
+                    player = self._build_player(player_data)
 
                     if self.log and i < 5:
-                        self.log.debug(f"Successfully parsed player: {player.name}")
+                        self.log.debug(
+                            f"Successfully parsed player: {player_data.get('PlayerName')}"
+                        )
                         self.log.debug(f"Player type: {type(player)}")
 
                     self.players.append(player)
@@ -66,14 +142,20 @@ class PlayersManager:
             self.log.debug(f"Handling list of player data, length: {len(data)}")
 
         for i, player_data in enumerate(data):
+            if self._limit_reached():
+                self.log.debug(f"Limit reached after {i} records")
+                break
+            if not self._accepts(player_data):
+                continue
+
             if self.log and i < 5:
                 self.log.debug(f"Processing list item {i + 1}")
 
             try:
-                player = PlayerModel.parse_player(player_data)
+                player = self._build_player(player_data)
                 if self.log and i < 5:
                     self.log.debug(
-                        f"Successfully parsed player from list: {player.name}"
+                        f"Successfully parsed player from list: {player_data.get('PlayerName')}"
                     )
                 self.players.append(player)
             except Exception as e:
@@ -86,33 +168,114 @@ class PlayersManager:
         if self.log:
             self.log.debug("Handling single player data")
 
+        if self._limit_reached() or not self._accepts(data):
+            return
+
         try:
-            player = PlayerModel.parse_player(data)
+            player = self._build_player(data)
             if self.log:
-                self.log.debug(f"Successfully parsed single player: {player.name}")
+                self.log.debug(
+                    f"Successfully parsed single player: {data.get('PlayerName')}"
+                )
             self.players.append(player)
         except Exception as e:
             if self.log:
                 self.log.warning(f"Error parsing single player: {e}")
 
-    def parse_players(self, data: Dict[str, Any] | List) -> List[PlayerModel]:
+    def parse_records(self, data: bytes | Dict[str, Any] | List) -> List[Any]:
+        """
+        Decode player data into msgspec record structs without building models.
+
+        Args:
+            data: Raw response bytes, a decoded response, or a list of records
+
+        Returns:
+            List of record structs; see `models.structs.to_player_model`
+        """
+        return decode_records(data, self.player_group, self.projection_system)
+
+    def _parse_records(self, data: bytes | Dict[str, Any] | List) -> None:
+        records = self.parse_records(data)
+        self.log.debug(f"Decoded {len(records)} records with msgspec")
+        for i, record in enumerate(records):
+            if self._limit_reached():
+                break
+            raw = record_dict(record)
+            if not self._accepts(raw):
+                continue
+            try:
+                self.players.append(self._build_player(raw))
+            except Exception as e:
+                self.log.warning(f"Error converting record {i + 1}: {e}")
+
+    def parse_players(
+        self,
+        data: bytes | Dict[str, Any] | List,
+        fields: Optional[Iterable[str]] = None,
+        where: Optional[Sequence[RecordPredicate]] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[PlayerModel]:
         """
         Parse player data from various formats into a list of PlayerModel objects.
 
         Args:
-            data: API response data - can be in various formats
+            data: API response data - can be in various formats, or the raw
+                response bytes with the msgspec backend
+            fields: Optional projection attribute names (e.g. ["hr", "avg"]) to
+                validate; all other projection stats are skipped
+            where: Optional predicates on the raw API records (see
+                `utils.record_filters`); records failing any are skipped before
+                validation, so they never become models
+            limit: Stop once this call has parsed this many players (at least 1);
+                it counts the players of this manager's group only, not players
+                already in the list or parsed by other managers
 
         Returns:
             List of PlayerModel objects
 
         Raises:
-            ValueError: If unable to parse the data
+            ValueError: If unable to parse the data, or if `limit` is below 1
         """
+        if limit is not None and limit < 1:
+            raise ValueError(f"limit must be at least 1, got {limit}")
         self.log.debug(f"Starting parse_players with data type: {type(data)}")
+        self.fields = frozenset(fields) if fields is not None else None
+        self.predicates = list(where or [])
+        self.stop_at = len(self.players) + limit if limit is not None else None
+
+        # Identical payloads parsed with the same options reload the cached set
+        cache_key: Optional[str] = None
+        if (
+            self.cache is not None
+            and isinstance(data, (bytes, bytearray))
+            and not self.predicates
+            and not self.lazy
+        ):
+            cache_key = self.cache.key(
+                bytes(data),
+                self.player_group,
+                self.projection_system,
+                self.fields,
+                limit,
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.log.info(f"Loaded {len(cached)} players from the parse cache")
+                self.players.extend(cached)
+                return self.players
+        parsed_from = len(self.players)
 
         try:
+            # Decode straight into structs with the msgspec backend
+            if self.backend == "msgspec":
+                self._parse_records(data)
+
+            # Raw response bytes for the pydantic backend
+            elif isinstance(data, (bytes, bytearray)):
+                self._parse_nested_player_data(json.loads(data)["pageProps"])
+
             # Handle full API response structure
-            if isinstance(data, dict) and "pageProps" in data:
+            elif isinstance(data, dict) and "pageProps" in data:
                 self._parse_nested_player_data(data["pageProps"])
 
             # Handle direct list of player data
@@ -131,6 +294,11 @@ class PlayersManager:
 
                 raise ValueError(f"Unrecognized data format: {type(data)}")
 
+            # Spilling containers are not re-read just to fill the cache
+            if cache_key is not None and isinstance(self.players, list):
+                assert self.cache is not None
+                self.cache.put(cache_key, self.players[parsed_from:])
+
         except Exception as e:
             # Log error details
             if self.log:
@@ -0,0 +1,165 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+from fangraphs_api_extractor.models import HitterModel, PitcherModel, PlayerModel
+from fangraphs_api_extractor.utils import BATTING_POSITIONS, Logger
+from fangraphs_api_extractor.utils.errors import (
+    InvalidPositionError,
+    InvalidPositionGroupError,
+)
+
+# min_position only reports "OF" for outfielders, so the individual outfield
+# positions are served from the OF eligibility list
+OUTFIELD_POSITIONS = {"lf", "cf", "rf"}
+
+PITCHER_ROLES = ["sta", "rel"]
+
+
+class SplitsManager:
+    """
+    Serves position and role splits from a single "all" pull per system.
+
+    Fangraphs' per-position batting pages and "sta"/"rel" pitching pages are
+    subsets of the "bat"/"pit" all pages. This builds a position eligibility
+    index from `min_position` (multi-position strings like "SS/2B" count for
+    every listed position) and a starter/reliever index from GS/G, so splits
+    can be served locally instead of as separate requests. `iter_split()`
+    applies the same rules to a stream of players without indexing (or
+    holding) them, e.g. for a `SpillingPlayerList`.
+    """
+
+    def __init__(
+        self,
+        players: Sequence[PlayerModel] = (),
+        projection_system: str = "steamer",
+        starter_ratio: float = 0.5,
+    ):
+        self.logger = Logger("splits_manager")
+        self.log = self.logger.logging
+        self.players = list(players)
+        self.projection_system = projection_system
+        self.starter_ratio = starter_ratio
+
+        self.hitters: List[int] = []
+        self.pitchers: List[int] = []
+        self.positions: Dict[str, List[int]] = {}
+        self.roles: Dict[str, List[int]] = {role: [] for role in PITCHER_ROLES}
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        for i, player in enumerate(self.players):
+            if isinstance(player, PitcherModel):
+                self.pitchers.append(i)
+                self.roles[self._role(player)].append(i)
+            elif isinstance(player, HitterModel):
+                self.hitters.append(i)
+                for position in self._eligible_positions(player):
+                    self.positions.setdefault(position, []).append(i)
+
+        self.log.debug(
+            f"Indexed {len(self.hitters)} hitters across "
+            f"{len(self.positions)} positions and {len(self.pitchers)} pitchers"
+        )
+
+    @staticmethod
+    def _eligible_positions(player: PlayerModel) -> List[str]:
+        return [
+            position.strip().lower()
+            for position in (player.min_position or "").split("/")
+            if position.strip()
+        ]
+
+    def _role(self, player: PlayerModel) -> str:
+        projection = player.projections.get(self.projection_system)
+        if projection is None and player.projections:
+            projection = next(iter(player.projections.values()))
+
+        games = getattr(projection, "games", None) or 0.0
+        games_started = getattr(projection, "games_started", None) or 0.0
+        if games and games_started / games >= self.starter_ratio:
+            return "sta"
+        return "rel"
+
+    def get_players(
+        self, position_group: str, position: str = "all"
+    ) -> Optional[List[PlayerModel]]:
+        """
+        Return the players a Fangraphs (position_group, position) page would list.
+
+        Args:
+            position_group: Type of player data (bat, pit, sta, rel)
+            position: Batting position filter (all, c, 1b, etc.)
+
+        Returns:
+            List of matching players, or None if the split is invalid
+        """
+        try:
+            indexes = self._split_indexes(position_group, position)
+        except InvalidPositionError as e:
+            self.log.error(f"Invalid position: {e}")
+            return None
+        except InvalidPositionGroupError as e:
+            self.log.error(f"Invalid position group: {e}")
+            return None
+
+        return [self.players[i] for i in indexes]
+
+    def get_split(self, split: str) -> Optional[List[PlayerModel]]:
+        """
+        Players of a batting position (e.g. "ss") or pitcher role ("sta", "rel").
+
+        Returns:
+            List of matching players, or None if the split is invalid
+        """
+        if split in PITCHER_ROLES:
+            return self.get_players(split)
+        return self.get_players("bat", split)
+
+    def _in_split(self, player: PlayerModel, split: str) -> bool:
+        if split in PITCHER_ROLES:
+            return isinstance(player, PitcherModel) and self._role(player) == split
+        if split not in BATTING_POSITIONS:
+            raise InvalidPositionError(split)
+        if not isinstance(player, HitterModel):
+            return False
+        if split == "all":
+            return True
+        if split in OUTFIELD_POSITIONS:
+            split = "of"
+        return split in self._eligible_positions(player)
+
+    def iter_split(
+        self, players: Iterable[PlayerModel], split: str
+    ) -> Optional[Iterator[PlayerModel]]:
+        """
+        Stream the players of a batting position or pitcher role split.
+
+        Args:
+            players: Players to filter, read once (e.g. a `SpillingPlayerList`)
+            split: Batting position (e.g. "ss") or pitcher role ("sta", "rel")
+
+        Returns:
+            Iterator over the matching players, or None if the split is invalid
+        """
+        if split not in PITCHER_ROLES and split not in BATTING_POSITIONS:
+            self.log.error(f"Invalid position: {split}")
+            return None
+        return (player for player in players if self._in_split(player, split))
+
+    def _split_indexes(self, position_group: str, position: str) -> List[int]:
+        if position_group not in ["bat", "pit", "sta", "rel"]:
+            raise InvalidPositionGroupError(position_group)
+
+        if position_group == "bat":
+            if position not in BATTING_POSITIONS:
+                raise InvalidPositionError(position)
+            if position == "all":
+                return self.hitters
+            if position in OUTFIELD_POSITIONS:
+                return self.positions.get("of", [])
+            return self.positions.get(position, [])
+
+        if position != "all":
+            raise InvalidPositionError(position)
+        if position_group == "pit":
+            return self.pitchers
+        return self.roles[position_group]
@@ -3,6 +3,7 @@ __all__ = [
     "PlayerModel", 
     "BaseProjectionModel",
     "ProjectionSource",
+    "LazyPlayer",
     
     # Hitter models
     "HitterModel", 
@@ -39,3 +40,6 @@ from .pitcher import (
     PitcherATCProjectionModel,
     PitcherTHEBATProjectionModel
 )
+
+# Import lazy proxies
+from .lazy_player import LazyPlayer
@@ -1,7 +1,27 @@
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, ForwardRef, Optional, TypeVar
-
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    ForwardRef,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    SerializeAsAny,
+    create_model,
+    field_validator,
+)
 
 from fangraphs_api_extractor.utils import normalize_string
 
@@ -65,6 +85,63 @@ class BaseProjectionModel(BaseModel):
     spts_ip: Optional[float] = Field(None, alias="SPTS_IP")
 
 
+# Slimmed projection models built by `projection_model_for_fields`, mapped to
+# the (full model, fields) they were built from
+SLIM_MODEL_ORIGINS: Dict[
+    Type[BaseProjectionModel], Tuple[Type[BaseProjectionModel], FrozenSet[str]]
+] = {}
+
+
+@lru_cache(maxsize=128)
+def projection_model_for_fields(
+    proj_cls: Type[BaseProjectionModel], fields: FrozenSet[str]
+) -> Type[BaseProjectionModel]:
+    """
+    Build (and cache) a slimmed-down copy of a projection model.
+
+    The copy is a `BaseProjectionModel` subclass that only declares the
+    requested fields, with the same aliases, defaults and field validators as
+    `proj_cls`, so validating a record skips every other stat. Common fields
+    that were not requested are shadowed by None class attributes. Fields that
+    `proj_cls` does not declare are ignored.
+
+    Args:
+        proj_cls: Projection model to slim down
+        fields: Attribute names to keep (e.g. {"hr", "avg"})
+
+    Returns:
+        A `BaseProjectionModel` subclass with only the requested fields
+    """
+    field_definitions: Dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in proj_cls.model_fields.items()
+        if name in fields
+    }
+    hidden: Dict[str, Any] = {
+        name: (ClassVar[Any], None)
+        for name in BaseProjectionModel.model_fields
+        if name not in field_definitions
+    }
+
+    validators: Dict[str, Any] = {}
+    for name, decorator in proj_cls.__pydantic_decorators__.field_validators.items():
+        applicable = [f for f in decorator.info.fields if f in field_definitions]
+        if applicable:
+            validators[name] = field_validator(*applicable, mode=decorator.info.mode)(
+                getattr(decorator.func, "__func__", decorator.func)
+            )
+
+    slim_cls = create_model(
+        f"{proj_cls.__name__}Slim",
+        __base__=BaseProjectionModel,
+        __validators__=validators,
+        **hidden,
+        **field_definitions,
+    )
+    SLIM_MODEL_ORIGINS[slim_cls] = (proj_cls, fields)
+    return slim_cls
+
+
 class PlayerModel(BaseModel):
     """Base class for all player types"""
 
@@ -129,8 +206,15 @@ class PlayerModel(BaseModel):
         # Handle URL transformation
         return self.upurl.replace("stats", "stats.json")
 
-    # Dictionary to store projections from different sources
-    projections: Dict[str, BaseProjectionModel] = {}
+    # Dictionary to store projections from different sources; serialized with
+    # the fields of each projection's own model, not just the common ones
+    projections: Dict[str, SerializeAsAny[BaseProjectionModel]] = {}
+
+    # Stats page data attached by hydration
+    stats: Optional[Any] = None
+
+    # Other providers' ids (espn, yahoo, ...) attached by the crosswalk
+    external_ids: Dict[str, str] = {}
 
     def model_dump_json(self, **kwargs) -> str:
         """
@@ -162,73 +246,121 @@ class PlayerModel(BaseModel):
         )
 
     @classmethod
-    def parse_player(
+    def model_classes(
         cls, data: Dict[str, Any], projection_source: str = "steamer"
-    ) -> Any:
-        """Factory method to determine player type and return appropriate instance"""
-        from typing import Type
-
-        from . import (
-            HitterATCProjectionModel,
-            HitterModel,
-            HitterProjectionModel,
-            HitterSteamerProjectionModel,
-            HitterTHEBATProjectionModel,
-            PitcherATCProjectionModel,
-            PitcherModel,
-            PitcherProjectionModel,
-            PitcherSteamerProjectionModel,
-            PitcherTHEBATProjectionModel,
-        )
+    ) -> Tuple[Type["PlayerModel"], Type[BaseProjectionModel]]:
+        """
+        Determine the player and projection model classes for a raw record.
 
-        # Determine player and projection types
-        player_cls: Type[PitcherModel | HitterModel]
-        proj_cls: Type[
-            PitcherSteamerProjectionModel
-            | PitcherATCProjectionModel
-            | PitcherTHEBATProjectionModel
-            | PitcherProjectionModel
-            | HitterSteamerProjectionModel
-            | HitterATCProjectionModel
-            | HitterTHEBATProjectionModel
-            | HitterProjectionModel
-        ]
+        Args:
+            data: Raw player record from the Fangraphs API
+            projection_source: Projection system the record comes from
 
+        Returns:
+            (player model class, projection model class)
+
+        Raises:
+            ValueError: If the record is neither a hitter nor a pitcher
+        """
         if "W" in data and "L" in data and "ERA" in data:
-            player_cls = PitcherModel
-            if projection_source.lower() == "steamer":
-                proj_cls = PitcherSteamerProjectionModel
-            elif projection_source.lower() == "atc":
-                proj_cls = PitcherATCProjectionModel
-            elif projection_source.lower() == "the_bat":
-                proj_cls = PitcherTHEBATProjectionModel
-            else:
-                proj_cls = PitcherProjectionModel
-        elif "AB" in data and "PA" in data and "RBI" in data:
-            player_cls = HitterModel
-            if projection_source.lower() == "steamer":
-                proj_cls = HitterSteamerProjectionModel
-            elif projection_source.lower() == "atc":
-                proj_cls = HitterATCProjectionModel
-            elif projection_source.lower() == "the_bat":
-                proj_cls = HitterTHEBATProjectionModel
-            else:
-                proj_cls = HitterProjectionModel
-        else:
-            raise ValueError(f"Unknown player type from data: {list(data.keys())[:10]}")
+            return _model_classes_for("pitcher", projection_source.lower())
+        if "AB" in data and "PA" in data and "RBI" in data:
+            return _model_classes_for("hitter", projection_source.lower())
+        raise ValueError(f"Unknown player type from data: {list(data.keys())[:10]}")
 
-        # Extract player data
-        player_data = {}
-        for k, v in data.items():
-            player_data[k] = v
+    @classmethod
+    def parse_projection(
+        cls,
+        data: Dict[str, Any],
+        proj_cls: Type[BaseProjectionModel],
+        fields: Optional[Iterable[str]] = None,
+    ) -> BaseProjectionModel:
+        """Validate a record's projection, limited to the requested fields if any"""
+        if fields is not None:
+            slim_cls = projection_model_for_fields(proj_cls, frozenset(fields))
+            return slim_cls.model_validate(data)
+        return proj_cls.model_validate(data)
+
+    @classmethod
+    def parse_player(
+        cls,
+        data: Dict[str, Any],
+        projection_source: str = "steamer",
+        fields: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """
+        Factory method to determine player type and return appropriate instance
+
+        Args:
+            data: Raw player record from the Fangraphs API
+            projection_source: Projection system the record comes from
+            fields: Optional projection attribute names to validate; when given,
+                the projection is a cached slimmed-down model with only these
+        """
+        player_cls, proj_cls = cls.model_classes(data, projection_source)
 
         # Create player instance
-        player = player_cls.model_validate(player_data)
+        player = player_cls.model_validate(data)
 
-        # Create projection instance
-        projection = proj_cls.model_validate(data)
+        # Create projection instance, limited to the requested fields if any
+        projection = cls.parse_projection(data, proj_cls, fields)
 
         # Add projection to player
         player.projections[projection_source] = projection
 
         return player
+
+
+@lru_cache(maxsize=None)
+def _model_classes_for(
+    player_type: str, projection_source: str
+) -> Tuple[Type[PlayerModel], Type[BaseProjectionModel]]:
+    """Player and projection model classes by player type and lowercase source"""
+    from . import (
+        HitterATCProjectionModel,
+        HitterModel,
+        HitterProjectionModel,
+        HitterSteamerProjectionModel,
+        HitterTHEBATProjectionModel,
+        PitcherATCProjectionModel,
+        PitcherModel,
+        PitcherProjectionModel,
+        PitcherSteamerProjectionModel,
+        PitcherTHEBATProjectionModel,
+    )
+
+    # Determine player and projection types
+    player_cls: Type[PitcherModel | HitterModel]
+    proj_cls: Type[
+        PitcherSteamerProjectionModel
+        | PitcherATCProjectionModel
+        | PitcherTHEBATProjectionModel
+        | PitcherProjectionModel
+        | HitterSteamerProjectionModel
+        | HitterATCProjectionModel
+        | HitterTHEBATProjectionModel
+        | HitterProjectionModel
+    ]
+
+    if player_type == "pitcher":
+        player_cls = PitcherModel
+        if projection_source == "steamer":
+            proj_cls = PitcherSteamerProjectionModel
+        elif projection_source == "atc":
+            proj_cls = PitcherATCProjectionModel
+        elif projection_source == "the_bat":
+            proj_cls = PitcherTHEBATProjectionModel
+        else:
+            proj_cls = PitcherProjectionModel
+    else:
+        player_cls = HitterModel
+        if projection_source == "steamer":
+            proj_cls = HitterSteamerProjectionModel
+        elif projection_source == "atc":
+            proj_cls = HitterATCProjectionModel
+        elif projection_source == "the_bat":
+            proj_cls = HitterTHEBATProjectionModel
+        else:
+            proj_cls = HitterProjectionModel
+
+    return player_cls, proj_cls
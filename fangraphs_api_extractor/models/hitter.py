@@ -124,4 +124,7 @@ class HitterModel(PlayerModel):
 
     # This class only contains fields that are unique to the player
     # but not part of any projection system
-    pass
+
+    @property
+    def player_type(self) -> str:
+        return "hitter"
@@ -0,0 +1,106 @@
+from typing import Any, Dict, Iterable, Optional, Type
+
+from .base_player import PlayerModel
+
+
+class LazyPlayer:
+    """
+    Proxy for a player model that validates its raw record on demand.
+
+    Construction only decides whether the record is a hitter or a pitcher.
+    The player model (identity fields: name, team, ids, ...) is validated on
+    first access to any player attribute, and the projection only on first
+    access to `projections`; both are cached. Attribute reads and writes are
+    forwarded to the validated model, and `__class__` reports the player model
+    class, so `isinstance(proxy, HitterModel)` holds without validating
+    anything and proxies pass the hitter/pitcher checks of the splits,
+    consensus, valuation and simulation code. Code that needs a real pydantic
+    model (e.g. to validate it into another model) should call `materialize()`.
+
+    Unlike eager parsing, a record that fails validation raises when it is
+    first accessed rather than being skipped.
+    """
+
+    __slots__ = (
+        "_record",
+        "_projection_source",
+        "_fields",
+        "_player_cls",
+        "_proj_cls",
+        "_player",
+        "_projection_loaded",
+    )
+
+    def __init__(
+        self,
+        record: Dict[str, Any],
+        projection_source: str = "steamer",
+        fields: Optional[Iterable[str]] = None,
+    ):
+        """
+        Args:
+            record: Raw player record from the Fangraphs API (kept by reference)
+            projection_source: Projection system the record comes from
+            fields: Optional projection attribute names to validate
+
+        Raises:
+            ValueError: If the record is neither a hitter nor a pitcher
+        """
+        player_cls, proj_cls = PlayerModel.model_classes(record, projection_source)
+        setattr_ = object.__setattr__
+        setattr_(self, "_record", record)
+        setattr_(self, "_projection_source", projection_source)
+        setattr_(self, "_fields", frozenset(fields) if fields is not None else None)
+        setattr_(self, "_player_cls", player_cls)
+        setattr_(self, "_proj_cls", proj_cls)
+        setattr_(self, "_player", None)
+        setattr_(self, "_projection_loaded", False)
+
+    @property  # type: ignore[misc]
+    def __class__(self) -> Type[PlayerModel]:  # type: ignore[override]
+        # Lets isinstance() see the player model class; type() still says LazyPlayer
+        return self._player_cls
+
+    @property
+    def record(self) -> Dict[str, Any]:
+        """The raw API record"""
+        return self._record
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the player model has been validated"""
+        return self._player is not None
+
+    def _model(self) -> PlayerModel:
+        if self._player is None:
+            object.__setattr__(
+                self, "_player", self._player_cls.model_validate(self._record)
+            )
+        return self._player
+
+    @property
+    def projections(self) -> Dict[str, Any]:
+        player = self._model()
+        if not self._projection_loaded:
+            projection = PlayerModel.parse_projection(
+                self._record, self._proj_cls, self._fields
+            )
+            player.projections[self._projection_source] = projection
+            object.__setattr__(self, "_projection_loaded", True)
+        return player.projections
+
+    def materialize(self) -> PlayerModel:
+        """Validate everything and return the underlying player model"""
+        self.projections
+        return self._model()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for names not found on the proxy itself
+        return getattr(self._model(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._model(), name, value)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "unloaded"
+        return f"LazyPlayer({self._record.get('PlayerName')!r}, {state})"
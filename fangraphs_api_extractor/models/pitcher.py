@@ -84,4 +84,7 @@ class PitcherModel(PlayerModel):
 
     # This class only contains fields that are unique to the player
     # but not part of any projection system
-    pass
+
+    @property
+    def player_type(self) -> str:
+        return "pitcher"
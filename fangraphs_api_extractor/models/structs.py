@@ -0,0 +1,158 @@
+"""
+msgspec decoding backend for projections responses.
+
+Struct types are generated from the pydantic player and projection models'
+field names, aliases and types, so a projections response is decoded from
+bytes straight into typed records in one pass, without building the
+intermediate dict tree. Records convert to the pydantic models on demand.
+Requires the optional `msgspec` package
+(`pip install fangraphs-api-extractor[msgspec]`).
+"""
+
+import types
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import BaseModel
+
+from .base_player import PlayerModel, _model_classes_for
+
+# Player model fields that are not part of an API record
+NON_RECORD_FIELDS = {"projections", "stats"}
+
+
+def _msgspec() -> Any:
+    try:
+        import msgspec
+    except ImportError as e:
+        raise ImportError(
+            "The msgspec backend requires the optional msgspec package: "
+            "pip install fangraphs-api-extractor[msgspec]"
+        ) from e
+    return msgspec
+
+
+def _struct_type(annotation: Any) -> Any:
+    """
+    Map a pydantic field annotation to a lenient msgspec type.
+
+    Every type is nullable, and int fields also accept floats (the API sends
+    counting stats like H and HR as floats; the pydantic validators round them).
+    """
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else Any
+
+    if annotation is int:
+        return Optional[Union[int, float]]
+    if annotation in (float, str, bool):
+        return Optional[annotation]
+    return Any
+
+
+def _record_fields(model_classes: List[Type[BaseModel]]) -> List[tuple]:
+    msgspec = _msgspec()
+    fields: Dict[str, tuple] = {}
+    for model_cls in model_classes:
+        for name, info in model_cls.model_fields.items():
+            if name in NON_RECORD_FIELDS or name in fields:
+                continue
+            # Missing keys stay UNSET and are left out of `record_dict`, while
+            # explicit nulls are kept, so pydantic sees the record as sent
+            fields[name] = (
+                name,
+                _struct_type(info.annotation),
+                msgspec.field(default=msgspec.UNSET, name=info.alias or name),
+            )
+    return list(fields.values())
+
+
+@lru_cache(maxsize=None)
+def record_struct(player_group: str, projection_system: str = "steamer") -> Any:
+    """
+    Struct type for one player record of a projections response.
+
+    Args:
+        player_group: "hitters" or "pitchers"
+        projection_system: Projection system of the records, whose projection
+            model may add system-specific fields
+
+    Returns:
+        A msgspec Struct class whose encoded field names are the API keys
+    """
+    msgspec = _msgspec()
+    player_type = "pitcher" if player_group == "pitchers" else "hitter"
+    player_cls, proj_cls = _model_classes_for(player_type, projection_system.lower())
+    return msgspec.defstruct(
+        f"{proj_cls.__name__}Record", _record_fields([player_cls, proj_cls])
+    )
+
+
+@lru_cache(maxsize=None)
+def response_struct(player_group: str, projection_system: str = "steamer") -> Any:
+    """Struct type for a full projections response (pageProps envelope included)"""
+    msgspec = _msgspec()
+    record = record_struct(player_group, projection_system)
+    state = msgspec.defstruct("State", [("data", List[record])])  # type: ignore[valid-type]
+    query = msgspec.defstruct("Query", [("state", state)])
+    dehydrated = msgspec.defstruct("DehydratedState", [("queries", List[query])])  # type: ignore[valid-type]
+    page_props = msgspec.defstruct(
+        "PageProps",
+        [("dehydrated_state", dehydrated, msgspec.field(name="dehydratedState"))],
+    )
+    return msgspec.defstruct(
+        "ProjectionsResponse",
+        [("page_props", page_props, msgspec.field(name="pageProps"))],
+    )
+
+
+def decode_records(
+    data: Any, player_group: str = "hitters", projection_system: str = "steamer"
+) -> List[Any]:
+    """
+    Decode projection records into structs.
+
+    Args:
+        data: Raw response bytes, a decoded response dict, or a list of records
+        player_group: "hitters" or "pitchers"
+        projection_system: Projection system of the records
+
+    Returns:
+        List of record structs
+    """
+    msgspec = _msgspec()
+    response_type = response_struct(player_group, projection_system)
+    record_type = record_struct(player_group, projection_system)
+    if isinstance(data, (bytes, bytearray, memoryview, str)):
+        response = msgspec.json.decode(data, type=response_type)
+        return response.page_props.dehydrated_state.queries[0].state.data
+    if isinstance(data, dict) and "pageProps" in data:
+        response = msgspec.convert(data, response_type)
+        return response.page_props.dehydrated_state.queries[0].state.data
+    if isinstance(data, dict):
+        return [msgspec.convert(data, record_type)]
+    return msgspec.convert(data, List[record_type])  # type: ignore[valid-type]
+
+
+def record_dict(record: Any) -> Dict[str, Any]:
+    """Convert a record struct to a dict keyed by the API field names"""
+    return _msgspec().to_builtins(record)
+
+
+def to_player_model(
+    record: Any,
+    projection_source: str = "steamer",
+    fields: Optional[Iterable[str]] = None,
+) -> PlayerModel:
+    """Convert a decoded record struct to the pydantic player model"""
+    return PlayerModel.parse_player(record_dict(record), projection_source, fields)
@@ -1,24 +1,56 @@
+import math
 import os
+import re
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
-from threading import Lock
-from typing import Any, Dict, Optional
+from threading import Event, Lock
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.sessions import RequestsCookieJar
 
 from fangraphs_api_extractor.utils import (
     BATTING_POSITIONS,
-    FANGRAPHS_PROJECTIONS_ENDPOINT,
     PROJECTION_SYSTEMS,
     Logger,
 )
-from fangraphs_api_extractor.utils.constants import USER_AGENT_HEADER
+from fangraphs_api_extractor.utils.compression import open_compressed, with_extension
+from fangraphs_api_extractor.utils.constants import (
+    BUILD_ID,
+    FANGRAPHS_LEADERBOARDS_PATH,
+    FANGRAPHS_PROJECTIONS_PATH,
+    LEADERBOARD_PAGE_SIZE,
+    FANGRAPHS_URL,
+    USER_AGENT_HEADER,
+)
 from fangraphs_api_extractor.utils.errors import (
+    DeadlineExceededError,
     InvalidPositionError,
     InvalidPositionGroupError,
     InvalidProjectionsSystemError,
+    RequestCancelledError,
 )
 
+# Recent request latencies kept for the hedging threshold
+LATENCY_WINDOW = 500
+
+
+def archive_name(endpoint_path: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Base file name (without extension) a response is archived under.
+
+    Example:
+    - Input: "/projections.json", {"stats": "bat", "type": "steamer"}
+    - Output: "projections.json_bat_steamer"
+    """
+    name = re.sub(r"[^A-Za-z0-9.]+", "_", endpoint_path.split("?")[0]).strip("_")
+    if params:
+        name += "_" + "_".join(str(params[k]) for k in sorted(params))
+    return name
+
 
 class ResponseStatus(Enum):
     """Enum representing possible API response statuses"""
@@ -37,10 +69,45 @@ class CoreFangraphs:
     Responsible only for making API requests and returning raw data.
     """
 
-    def __init__(self, year: int, logger: Logger, max_workers: Optional[int] = None):
+    def __init__(
+        self,
+        year: int,
+        logger: Logger,
+        max_workers: Optional[int] = None,
+        fangraphs_url: str = FANGRAPHS_URL,
+        build_id: str = BUILD_ID,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        archive_dir: Optional[str] = None,
+        archive_compression: Optional[str] = "gzip",
+        archive_level: Optional[int] = None,
+        timeout: Optional[float] = 30.0,
+        deadline: Optional[float] = None,
+        hedge_percentile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+    ):
+        """
+        Args:
+            year: Season of the projections
+            logger: Logger for logging messages
+            max_workers: Size of the connection pool (default: 4 per CPU, up to 32)
+            fangraphs_url: Base URL of the site
+            build_id: Next.js build id of the data URLs
+            max_retries: Retries for rate limited, unavailable and timed out requests
+            backoff_factor: Base of the exponential retry backoff in seconds
+            archive_dir: Optional directory to keep every raw response body in
+            archive_compression: Compression of archived bodies
+            archive_level: Compression level of archived bodies
+            timeout: Seconds to wait for each response (None waits forever)
+            deadline: Total seconds all requests of this client may take; once
+                spent, requests in flight time out and new ones fail immediately
+            hedge_percentile: When set (e.g. 95), a request still unanswered after
+                that percentile of recent latencies is sent again and the first
+                response wins
+            hedge_min_samples: Latencies to observe before hedging starts
+        """
         self.year = year
         self.logger = logger
-        self.logger_lock = Lock()  # Thread-safe logging
 
         # Configure default number of workers if not specified (use CPU count)
         cpu_count = os.cpu_count()
@@ -53,9 +120,232 @@ class CoreFangraphs:
         self.session = requests.Session()
         self.session.headers.update(USER_AGENT_HEADER)
         self.session.cookies = RequestsCookieJar()
+        # Size the connection pool so every worker thread can keep a connection
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers, pool_maxsize=self.max_workers
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Retries for rate limiting and unavailable responses
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # Set the API URLs; the Next.js build id can be refreshed at runtime
+        self.fangraphs_url = fangraphs_url
+        self._build_lock = Lock()
+        self._set_build_id(build_id)
+
+        # Optional archive of raw response bodies, compressed as they are written
+        self.archive_dir = archive_dir
+        self.archive_compression = archive_compression
+        self.archive_level = archive_level
+
+        # In-flight projection requests keyed by normalized params, so that
+        # concurrent identical requests share a single fetch
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = Lock()
+
+        # Per-request timeout, whole-run deadline and cancellation
+        self.timeout = timeout
+        self.deadline_at: Optional[float] = None
+        if deadline is not None:
+            self.set_deadline(deadline)
+        self._cancelled = Event()
+
+        # Hedged requests, triggered by a percentile of the recent latencies
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.hedged_requests = 0
+        self._latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._latency_lock = Lock()
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        if hedge_percentile is not None:
+            # Room for every worker's request and its duplicate
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=self.max_workers * 2, thread_name_prefix="fangraphs-hedge"
+            )
+
+    def set_deadline(self, seconds: float) -> None:
+        """Give every request from now on a total budget of `seconds`"""
+        self.deadline_at = time.monotonic() + seconds
+
+    def cancel(self) -> None:
+        """Fail all further requests; retry backoffs in progress end early"""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the client was cancelled or its deadline has passed"""
+        return self._cancelled.is_set() or self._remaining() == 0.0
+
+    def close(self) -> None:
+        """Release the hedging threads and pooled connections"""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    def _remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, or None without one"""
+        if self.deadline_at is None:
+            return None
+        return max(self.deadline_at - time.monotonic(), 0.0)
+
+    def _request_timeout(self) -> Optional[float]:
+        """
+        Timeout for the next request, capped by the time left before the deadline.
+
+        Raises:
+            RequestCancelledError: If the client was cancelled
+            DeadlineExceededError: If the deadline has passed
+        """
+        if self._cancelled.is_set():
+            raise RequestCancelledError("Requests were cancelled")
+        remaining = self._remaining()
+        if remaining is None:
+            return self.timeout
+        if remaining <= 0:
+            raise DeadlineExceededError("Request deadline exceeded")
+        return remaining if self.timeout is None else min(self.timeout, remaining)
+
+    def _backoff(self, seconds: float) -> None:
+        """Sleep before a retry, giving up early on cancellation or the deadline"""
+        remaining = self._remaining()
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceededError("Request deadline exceeded during backoff")
+        if self._cancelled.wait(seconds):
+            raise RequestCancelledError("Requests were cancelled")
+
+    def _record_latency(self, seconds: float) -> None:
+        with self._latency_lock:
+            self._latencies.append(seconds)
+
+    def hedge_threshold(self) -> Optional[float]:
+        """
+        Seconds after which a request is hedged.
+
+        Returns:
+            The `hedge_percentile` of recent latencies, or None while hedging is
+            disabled or fewer than `hedge_min_samples` have been observed
+        """
+        if self.hedge_percentile is None:
+            return None
+        with self._latency_lock:
+            if len(self._latencies) < self.hedge_min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = math.ceil(self.hedge_percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(index, 0), len(ordered) - 1)]
+
+    def _timed_get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+        timeout: Optional[float],
+    ) -> Tuple[requests.Response, float]:
+        start = time.monotonic()
+        r = self.session.get(endpoint, params=params, headers=headers, timeout=timeout)
+        return r, time.monotonic() - start
 
-        # Set the API URL
-        self.fg_projections_url = FANGRAPHS_PROJECTIONS_ENDPOINT
+    def _send(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """
+        Send one GET within the timeout and deadline, hedging it if it runs long.
+
+        A hedged request is sent a second time once it has been outstanding for
+        longer than `hedge_threshold()`; the first successful response is
+        returned and the other finishes in the background and is discarded.
+        """
+        timeout = self._request_timeout()
+        threshold = self.hedge_threshold()
+        if threshold is None or self._hedge_executor is None:
+            r, elapsed = self._timed_get(endpoint, params, headers, timeout)
+            self._record_latency(elapsed)
+            return r
+
+        attempts: List[Future] = [
+            self._hedge_executor.submit(
+                self._timed_get, endpoint, params, headers, timeout
+            )
+        ]
+        done, _ = wait(attempts, timeout=threshold)
+        if not done:
+            self.logger.logging.debug(
+                f"Hedging request after {threshold:.3f}s: {endpoint}"
+            )
+            with self._latency_lock:
+                self.hedged_requests += 1
+            attempts.append(
+                self._hedge_executor.submit(
+                    self._timed_get, endpoint, params, headers, self._request_timeout()
+                )
+            )
+
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    r, elapsed = future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                self._record_latency(elapsed)
+                return r
+        assert error is not None
+        raise error
+
+    def _set_build_id(self, build_id: str) -> None:
+        self.build_id = build_id
+        self.fg_build_url = f"{self.fangraphs_url}/_next/data/{build_id}"
+        self.fg_projections_url = self.fg_build_url + FANGRAPHS_PROJECTIONS_PATH
+
+    def refresh_build_id(self, stale_build_id: Optional[str] = None) -> bool:
+        """
+        Re-discover the Next.js build id from the projections page.
+
+        Fangraphs data URLs embed the site's build id, which changes on every
+        deploy and turns all data requests into 404s.
+
+        Args:
+            stale_build_id: Build id the caller saw fail; if another thread has
+                already replaced it, no request is made
+
+        Returns:
+            True if a build id different from the stale one is now in use
+        """
+        with self._build_lock:
+            if stale_build_id is not None and self.build_id != stale_build_id:
+                return True
+
+            try:
+                r = self.session.get(
+                    f"{self.fangraphs_url}/projections",
+                    timeout=self._request_timeout(),
+                )
+                match = re.search(r'"buildId"\s*:\s*"([^"]+)"', r.text)
+            except Exception as e:
+                self.logger.logging.error(f"Error refreshing build id: {e}")
+                return False
+
+            if match is None or match.group(1) == self.build_id:
+                return False
+
+            self.logger.logging.info(f"Build id changed to {match.group(1)}")
+            self._set_build_id(match.group(1))
+            return True
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return float(retry_after)
+        return self.backoff_factor * (2**attempt)
 
     def _check_request_status(
         self,
@@ -71,57 +361,213 @@ class CoreFangraphs:
             params: Query parameters used in the request
             headers: Headers used in the request
         """
-        # For error cases, use thread-safe logging
-        with self.logger_lock:
-            match status:
-                case ResponseStatus.SUCCESS.value:
-                    return
+        match status:
+            case ResponseStatus.SUCCESS.value:
+                return
 
-                case ResponseStatus.NOT_FOUND.value:
-                    self.logger.logging.warn(f"Endpoint not found: {extend}")
+            case ResponseStatus.NOT_FOUND.value:
+                self.logger.logging.warn(f"Endpoint not found: {extend}")
 
-                case ResponseStatus.RATE_LIMITED.value:
-                    self.logger.logging.warn("Rate limit exceeded")
+            case ResponseStatus.RATE_LIMITED.value:
+                self.logger.logging.warn("Rate limit exceeded")
 
-                case ResponseStatus.SERVER_ERROR.value:
-                    self.logger.logging.warn("Internal server error")
+            case ResponseStatus.SERVER_ERROR.value:
+                self.logger.logging.warn("Internal server error")
 
-                case ResponseStatus.SERVICE_UNAVAILABLE.value:
-                    self.logger.logging.warn("Service unavailable")
+            case ResponseStatus.SERVICE_UNAVAILABLE.value:
+                self.logger.logging.warn("Service unavailable")
 
-                case _:
-                    self.logger.logging.warn(f"Unknown error: {status}")
+            case _:
+                self.logger.logging.warn(f"Unknown error: {status}")
 
     def _get(
         self,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
         extend: str = "",
-    ) -> Dict[str, Any]:
+        path: str = FANGRAPHS_PROJECTIONS_PATH,
+        decode: bool = True,
+        base_url: Optional[str] = None,
+    ) -> Any:
         """
-        Make a GET request to the Fangraphs API.
+        Make a GET request to the Fangraphs API over the pooled session.
+
+        Rate limited and unavailable responses are retried with exponential
+        backoff (honouring Retry-After), timed out requests with the same
+        backoff, and a 404 triggers one build id refresh.
 
         Args:
             params: Query parameters for the request
             headers: Additional headers for the request
             extend: URL path extension
+            path: Data path under the build URL, defaults to projections
+            decode: Decode the JSON body; when False the raw bytes are returned
+            base_url: URL the path is appended to instead of the build URL;
+                such requests never refresh the build id
 
         Returns:
-            The JSON response from the API
+            The JSON response from the API, or its raw bytes
+
+        Raises:
+            RequestCancelledError: If the client is cancelled or out of deadline
         """
-        endpoint = self.fg_projections_url + extend
-        r = requests.get(
-            endpoint, params=params, headers=headers, cookies=self.session.cookies
-        )
-        self._check_request_status(r.status_code, extend)
+        attempt = 0
+        refreshed = False
+        while True:
+            build_id = self.build_id
+            endpoint = (base_url or self.fg_build_url) + path + extend
+            try:
+                r = self._send(endpoint, params=params, headers=headers)
+            except requests.Timeout:
+                self.logger.logging.warn(f"Request timed out: {path + extend}")
+                if attempt >= self.max_retries:
+                    raise
+                self._backoff(self.backoff_factor * (2**attempt))
+                attempt += 1
+                continue
+            self._check_request_status(r.status_code, extend)
 
-        if self.logger:
-            with self.logger_lock:
-                self.logger.log_request(
-                    endpoint=endpoint, params=params, headers=headers, response=r.json()
+            if (
+                r.status_code == ResponseStatus.NOT_FOUND.value
+                and not refreshed
+                and base_url is None
+            ):
+                refreshed = True
+                if self.refresh_build_id(build_id):
+                    continue
+
+            if (
+                r.status_code
+                in (
+                    ResponseStatus.RATE_LIMITED.value,
+                    ResponseStatus.SERVICE_UNAVAILABLE.value,
                 )
+                and attempt < self.max_retries
+            ):
+                self._backoff(self._retry_delay(r, attempt))
+                attempt += 1
+                continue
+            break
+
+        if self.archive_dir and r.status_code == ResponseStatus.SUCCESS.value:
+            self._archive_response(path + extend, params, r.content)
+
+        if not decode:
+            r.raise_for_status()
+            return r.content
+
+        data = r.json()
+
+        if self.logger:
+            self.logger.log_request(
+                endpoint=endpoint, params=params, headers=headers, response=data
+            )
+
+        return data
+
+    def _archive_response(
+        self, endpoint_path: str, params: Optional[Dict[str, Any]], content: bytes
+    ) -> None:
+        """Write a raw response body to the archive directory"""
+        assert self.archive_dir is not None
+        file_path = with_extension(
+            os.path.join(
+                self.archive_dir, f"{archive_name(endpoint_path, params)}.json"
+            ),
+            self.archive_compression,
+        )
+        try:
+            os.makedirs(self.archive_dir, exist_ok=True)
+            with open_compressed(
+                file_path, "wb", self.archive_compression, self.archive_level
+            ) as f:
+                for start in range(0, len(content), 1 << 16):
+                    f.write(content[start : start + (1 << 16)])
+        except Exception as e:
+            self.logger.logging.error(f"Error archiving response to {file_path}: {e}")
+
+    def get_player_stats_data(self, stats_api: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a player's raw stats page data.
+
+        Args:
+            stats_api: Player stats path, as built by `PlayerModel.stats_api`
+
+        Returns:
+            Raw JSON data from the API, or None if an error occurred
+        """
+        try:
+            return self._get(extend=stats_api, path="")
+        except RequestCancelledError as e:
+            self.logger.logging.debug(f"Skipped {stats_api}: {e}")
+            return None
+        except Exception as e:
+            self.logger.logging.error(f"Error fetching {stats_api}: {e}")
+            return None
+
+    def get_leaderboard_page(
+        self,
+        position_group: str,
+        season: int,
+        page: int = 1,
+        page_size: int = LEADERBOARD_PAGE_SIZE,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get one page of a season's leaderboard (actual stats) from the Fangraphs API.
+
+        Args:
+            position_group: Type of player data to get (bat, pit, sta, rel)
+            season: Season of the stats
+            page: 1-based page number
+            page_size: Rows per page
+            params: Additional query parameters
+
+        Returns:
+            Raw JSON data with the page's rows under "data" and the row count of
+            the whole leaderboard under "totalCount", or None if an error occurred
+        """
+        try:
+            if position_group not in ["bat", "pit", "sta", "rel"]:
+                raise InvalidPositionGroupError(position_group)
+        except InvalidPositionGroupError as e:
+            self.logger.logging.error(f"Invalid position group: {e}")
+            return None
+
+        merged_params: Dict[str, Any] = {
+            "pos": "all",
+            "stats": position_group,
+            "lg": "all",
+            # Every player, not only those qualified for the rate stats
+            "qual": 0,
+            "season": season,
+            "season1": season,
+            "ind": 0,
+            "type": 8,
+            "pageitems": page_size,
+            "pagenum": page,
+        }
+        merged_params.update(params or {})
 
-        return r.json()
+        try:
+            self.logger.logging.debug(
+                f"Fetching {season} {position_group} leaderboard page {page}"
+            )
+            return self._get(
+                params=merged_params,
+                path=FANGRAPHS_LEADERBOARDS_PATH,
+                base_url=self.fangraphs_url,
+            )
+        except RequestCancelledError as e:
+            self.logger.logging.debug(
+                f"Skipped {season} {position_group} leaderboard page {page}: {e}"
+            )
+            return None
+        except Exception as e:
+            self.logger.logging.error(
+                f"Error fetching {season} {position_group} leaderboard page {page}: {e}"
+            )
+            return None
 
     def get_projections_data(
         self,
@@ -142,6 +588,43 @@ class CoreFangraphs:
         Returns:
             Raw JSON data from the API, or None if an error occurred
         """
+        merged_params = self._projection_params(
+            position_group, params, position, projections_system
+        )
+        if merged_params is None:
+            return None
+        return self._coalesced_get(merged_params)
+
+    def get_projections_content(
+        self,
+        position_group: str,
+        params: Optional[Dict[str, Any]] = None,
+        position: str = "all",
+        projections_system: str = "steamer",
+    ) -> Optional[bytes]:
+        """
+        Get the undecoded projections response body, for byte-level decoders.
+
+        Takes the same arguments as `get_projections_data`.
+
+        Returns:
+            Raw response bytes, or None if an error occurred
+        """
+        merged_params = self._projection_params(
+            position_group, params, position, projections_system
+        )
+        if merged_params is None:
+            return None
+        return self._coalesced_get(merged_params, decode=False)
+
+    def _projection_params(
+        self,
+        position_group: str,
+        params: Optional[Dict[str, Any]],
+        position: str,
+        projections_system: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Validate a projections request and merge its query parameters"""
         try:
             if position_group not in ["bat", "pit", "sta", "rel"]:
                 raise InvalidPositionGroupError(position_group)
@@ -169,15 +652,60 @@ class CoreFangraphs:
             "pos": position,
             "stats": position_group,
             "type": projections_system,
+            "season": self.year,
         }
         merged_params.update(params or {})
+        return merged_params
+
+    @staticmethod
+    def _request_key(params: Dict[str, Any]) -> Tuple:
+        """Normalize request params into a hashable key"""
+        return tuple(sorted((str(k), str(v)) for k, v in params.items()))
+
+    def _coalesced_get(self, params: Dict[str, Any], decode: bool = True) -> Any:
+        """
+        Fetch projections, joining an identical request already in flight.
 
+        The first caller for a given set of params performs the request; callers
+        arriving before it completes wait on it and receive the same decoded
+        response object, which must therefore be treated as read-only.
+
+        Args:
+            params: Fully merged query parameters
+            decode: Return decoded JSON rather than the raw bytes
+
+        Returns:
+            Raw JSON data (or bytes) from the API, or None if an error occurred
+        """
+        key = self._request_key(params) + (("decode", str(decode)),)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            self.logger.logging.debug(f"Joining in-flight request: {params}")
+            return future.result()
+
+        raw_data: Any = None
         try:
             self.logger.logging.info(
-                f"Fetching {position_group} projections with {projections_system}"
+                f"Fetching {params.get('season')} {params.get('stats')} projections "
+                f"with {params.get('type')}"
             )
-            raw_data = self._get(params=merged_params)
-            return raw_data
+            if decode:
+                raw_data = self._get(params=params)
+            else:
+                raw_data = self._get(params=params, decode=False)
+        except RequestCancelledError as e:
+            self.logger.logging.error(f"Projections not fetched: {e}")
         except Exception as e:
             self.logger.logging.error(f"Error fetching projections: {e}")
-            return None
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            future.set_result(raw_data)
+
+        return raw_data
@@ -0,0 +1,335 @@
+import argparse
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Lock
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel
+from tqdm import tqdm
+
+from fangraphs_api_extractor.managers import PlayersManager, SplitsManager
+from fangraphs_api_extractor.managers.splits_manager import PITCHER_ROLES
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.utils import (
+    BATTING_POSITIONS,
+    PROJECTION_SYSTEMS,
+    Logger,
+    read_json_file,
+    serialize_players,
+    write_json_file,
+)
+from fangraphs_api_extractor.utils.errors import (
+    InvalidPositionError,
+    InvalidPositionGroupError,
+)
+
+BACKFILL_GROUPS = ["bat", "pit", *PITCHER_ROLES]
+
+
+class BackfillTask(BaseModel):
+    """A single "all" projections request in the backfill matrix"""
+
+    year: int
+    system: str
+    # "bat" or "pit"
+    group: str
+    # Part files written from the pull: "all" and batting positions for "bat",
+    # "all" and the "sta"/"rel" roles for "pit"; subsets are served locally
+    # by `SplitsManager` rather than requested separately
+    splits: List[str] = ["all"]
+
+    @property
+    def key(self) -> str:
+        # The splits are part of the key, so a rerun asking for other part
+        # files is not mistaken for a task that already wrote them
+        return f"{self.year}/{self.group}/{'+'.join(sorted(self.splits))}/{self.system}"
+
+    def part_file(self, split: str = "all") -> str:
+        if split in PITCHER_ROLES:
+            return f"{split}_all_{self.system}.json"
+        return f"{self.group}_{split}_{self.system}.json"
+
+
+def plan_backfill(
+    years: Sequence[int],
+    systems: Sequence[str] = PROJECTION_SYSTEMS,
+    groups: Sequence[str] = ("bat", "pit"),
+    positions: Sequence[str] = ("all",),
+) -> List[BackfillTask]:
+    """
+    Plan one "all" request per (year, system) for batters and for pitchers.
+
+    Batting positions and the "sta"/"rel" pitcher groups are subsets of the
+    "bat"/"pit" all pages, so they become splits of those requests instead of
+    requests of their own.
+
+    Raises:
+        InvalidPositionGroupError: If a group is not bat, pit, sta or rel
+        InvalidPositionError: If a position is not a batting position
+    """
+    for group in groups:
+        if group not in BACKFILL_GROUPS:
+            raise InvalidPositionGroupError(group)
+    for position in positions:
+        if position not in BATTING_POSITIONS:
+            raise InvalidPositionError(position)
+
+    group_splits: Dict[str, List[str]] = {}
+    if "bat" in groups:
+        group_splits["bat"] = list(dict.fromkeys(positions))
+    pitcher_splits = [g for g in ["pit", *PITCHER_ROLES] if g in groups]
+    if pitcher_splits:
+        group_splits["pit"] = ["all" if g == "pit" else g for g in pitcher_splits]
+
+    tasks: List[BackfillTask] = []
+    for year in years:
+        for group, splits in group_splits.items():
+            for system in systems:
+                tasks.append(
+                    BackfillTask(year=year, system=system, group=group, splits=splits)
+                )
+    return tasks
+
+
+class BackfillCheckpoint:
+    """
+    Persistent record of completed backfill tasks.
+
+    The checkpoint file is rewritten atomically after every completed task, so
+    an interrupted run resumes with only the missing tasks.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = Lock()
+        self.completed: Dict[str, str] = {}
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                self.completed = json.load(f).get("completed", {})
+
+    def is_done(self, task: BackfillTask) -> bool:
+        return task.key in self.completed
+
+    def mark_done(self, task: BackfillTask, output_path: str) -> None:
+        with self.lock:
+            self.completed[task.key] = output_path
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"completed": self.completed}, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def run_task(
+    task: BackfillTask,
+    clients: Dict[int, CoreFangraphs],
+    output_dir: str,
+    logger: Logger,
+) -> Optional[str]:
+    """
+    Fetch, parse and write one task and its splits.
+
+    Args:
+        task: Task to run
+        clients: Fangraphs clients by season
+        output_dir: Directory the season's part files are written under
+        logger: Logger for logging messages
+
+    Returns:
+        The directory the part files were written to, or None on failure
+    """
+    raw_data = clients[task.year].get_projections_data(
+        task.group, projections_system=task.system
+    )
+    if not raw_data:
+        return None
+
+    manager = PlayersManager(
+        "hitters" if task.group == "bat" else "pitchers", projection_system=task.system
+    )
+    players = manager.parse_players(raw_data)
+    splits = SplitsManager(players, task.system)
+
+    parts_dir = os.path.join(output_dir, str(task.year), "parts")
+    for split in task.splits:
+        selected = players if split == "all" else splits.get_split(split)
+        if selected is None:
+            return None
+        path = write_json_file(
+            serialize_players(selected, logger),
+            parts_dir,
+            task.part_file(split),
+            logger,
+        )
+        if path is None:
+            return None
+    return parts_dir
+
+
+def merge_season_outputs(
+    year: int, output_dir: str, logger: Logger, file_name: str = "fangraph_players.json"
+) -> int:
+    """
+    Merge a season's partial outputs into one file, combining projections by player.
+
+    Players are matched on (playerid, player_type), so a two-way player keeps
+    separate hitter and pitcher entries whose projections never overwrite
+    each other.
+
+    Returns:
+        Number of players written
+    """
+    parts_dir = os.path.join(output_dir, str(year), "parts")
+    merged: Dict[Tuple[str, Optional[str]], Dict] = {}
+    for part in sorted(os.listdir(parts_dir)):
+        for player in read_json_file(os.path.join(parts_dir, part)):
+            key = (player["playerid"], player.get("player_type"))
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = player
+            else:
+                existing["projections"].update(player.get("projections", {}))
+
+    write_json_file(
+        list(merged.values()), os.path.join(output_dir, str(year)), file_name, logger
+    )
+    return len(merged)
+
+
+def run_backfill(
+    tasks: Sequence[BackfillTask],
+    output_dir: str,
+    checkpoint: BackfillCheckpoint,
+    logger: Logger,
+    max_workers: Optional[int] = None,
+) -> List[BackfillTask]:
+    """
+    Execute the pending tasks concurrently and merge every fully completed season.
+
+    Returns:
+        Tasks that failed and will be retried on the next run
+    """
+    log = logger.logging
+    pending = [task for task in tasks if not checkpoint.is_done(task)]
+    log.info(
+        f"Backfill: {len(tasks)} planned, {len(tasks) - len(pending)} already done"
+    )
+
+    clients = {
+        year: CoreFangraphs(year=year, logger=logger, max_workers=max_workers)
+        for year in sorted({task.year for task in tasks})
+    }
+    workers = max_workers or max((c.max_workers for c in clients.values()), default=1)
+
+    failed: List[BackfillTask] = []
+    # Release the clients' hedging threads and pooled connections
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(run_task, task, clients, output_dir, logger): task
+                for task in pending
+            }
+            for future in tqdm(
+                as_completed(futures), total=len(futures), desc="Backfill", unit="req"
+            ):
+                task = futures[future]
+                try:
+                    output_path = future.result()
+                except Exception as e:
+                    log.error(f"Backfill task {task.key} failed: {e}")
+                    output_path = None
+
+                if output_path is None:
+                    failed.append(task)
+                else:
+                    checkpoint.mark_done(task, output_path)
+    finally:
+        for client in clients.values():
+            client.close()
+
+    failed_years = {task.year for task in failed}
+    for year in sorted(clients):
+        if year in failed_years:
+            log.warning(f"Season {year} incomplete; rerun to resume missing requests")
+            continue
+        count = merge_season_outputs(year, output_dir, logger)
+        log.info(f"Season {year}: wrote {count} players")
+
+    return failed
+
+
+def main(
+    years: Optional[List[int]] = None,
+    output_dir: Optional[str] = None,
+) -> List[BackfillTask]:
+    """
+    Backfill projections for several seasons with checkpoint/resume.
+
+    Args:
+        years: Optional seasons to backfill, overriding --years
+        output_dir: Optional output directory, overriding --output_dir
+
+    Returns:
+        Tasks that failed
+    """
+    parser = argparse.ArgumentParser(description="Backfill Fangraphs projections")
+    parser.add_argument(
+        "--years", type=int, nargs="+", default=[2025], help="Seasons to backfill"
+    )
+    parser.add_argument(
+        "--systems",
+        nargs="+",
+        default=PROJECTION_SYSTEMS,
+        help="Projection systems to pull (default: all)",
+    )
+    parser.add_argument(
+        "--groups",
+        nargs="+",
+        default=["bat", "pit"],
+        help="Position groups to pull (default: bat pit)",
+    )
+    parser.add_argument(
+        "--positions",
+        nargs="+",
+        default=["all"],
+        help="Batting positions to pull (default: all)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Number of concurrent requests (default: 4x CPU cores)",
+    )
+    parser.add_argument(
+        "--output_dir", type=str, default=".", help="Directory for per-season output"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=str,
+        default=None,
+        help="Checkpoint file (default: <output_dir>/backfill_checkpoint.json)",
+    )
+
+    args = parser.parse_args()
+    if years is not None:
+        args.years = years
+    if output_dir is not None:
+        args.output_dir = output_dir
+
+    logger = Logger("fangraphs-backfill", use_queue=True)
+    checkpoint = BackfillCheckpoint(
+        args.checkpoint or os.path.join(args.output_dir, "backfill_checkpoint.json")
+    )
+    try:
+        tasks = plan_backfill(args.years, args.systems, args.groups, args.positions)
+    except (InvalidPositionError, InvalidPositionGroupError) as e:
+        parser.error(f"unknown position or group: {e}")
+
+    return run_backfill(
+        tasks, args.output_dir, checkpoint, logger, max_workers=args.threads
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+import argparse
+import os
+import socket
+import threading
+from multiprocessing import Process
+from typing import Dict, List, Optional, Sequence
+
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.runners.backfill import (
+    BackfillTask,
+    merge_season_outputs,
+    plan_backfill,
+    run_task,
+)
+from fangraphs_api_extractor.storage.work_queue import WorkQueue
+from fangraphs_api_extractor.utils import PROJECTION_SYSTEMS, Logger
+
+
+def enqueue_tasks(queue: WorkQueue, tasks: Sequence[BackfillTask]) -> int:
+    """Enqueue backfill tasks by key; tasks already queued are left as they are"""
+    return queue.enqueue((task.key, task.model_dump()) for task in tasks)
+
+
+def _keep_lease(
+    queue_path: str,
+    key: str,
+    worker_id: str,
+    lease_seconds: float,
+    done: threading.Event,
+) -> None:
+    """Renew a lease at a third of its length until `done` is set"""
+    with WorkQueue(queue_path) as queue:
+        while not done.wait(lease_seconds / 3):
+            if not queue.renew(key, worker_id, lease_seconds):
+                return
+
+
+def run_worker(
+    queue: WorkQueue,
+    output_dir: str,
+    logger: Logger,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = 300.0,
+    max_jobs: Optional[int] = None,
+) -> int:
+    """
+    Claim and run jobs until the queue has nothing claimable.
+
+    Each job writes its partial output under `<output_dir>/<year>/parts`, the
+    same layout as the backfill runner, so `output_dir` must be shared by all
+    workers. Leases are renewed while a job runs; a job whose lease was lost
+    (e.g. the worker stalled and another claimed it) is not marked done here.
+
+    Returns:
+        Number of jobs completed by this worker
+    """
+    log = logger.logging
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    clients: Dict[int, CoreFangraphs] = {}
+    completed = 0
+
+    # Release the clients' hedging threads and pooled connections
+    try:
+        while max_jobs is None or completed < max_jobs:
+            claimed = queue.claim(worker_id, lease_seconds)
+            if claimed is None:
+                break
+            key, payload = claimed
+            task = BackfillTask(**payload)
+            if task.year not in clients:
+                clients[task.year] = CoreFangraphs(year=task.year, logger=logger)
+
+            done = threading.Event()
+            heartbeat = threading.Thread(
+                target=_keep_lease,
+                args=(queue.db_path, key, worker_id, lease_seconds, done),
+                daemon=True,
+            )
+            heartbeat.start()
+            try:
+                output_path = run_task(task, clients, output_dir, logger)
+            except Exception as e:
+                log.error(f"Job {key} failed: {e}")
+                output_path = None
+            finally:
+                done.set()
+                heartbeat.join()
+
+            if output_path is None:
+                queue.fail(key, worker_id, "fetch or parse failed")
+            elif queue.complete(key, worker_id, output_path):
+                completed += 1
+            else:
+                log.warning(f"Lease on {key} was lost; its result may be redone")
+    finally:
+        for client in clients.values():
+            client.close()
+
+    log.info(f"Worker {worker_id} completed {completed} jobs")
+    return completed
+
+
+def merge_completed(queue: WorkQueue, output_dir: str, logger: Logger) -> List[int]:
+    """
+    Merge every season whose jobs are all done.
+
+    Returns:
+        Seasons that were merged
+    """
+    log = logger.logging
+    years: Dict[int, bool] = {}
+    for job in queue.jobs().values():
+        year = job["payload"]["year"]
+        years[year] = years.get(year, True) and job["status"] == "done"
+
+    merged = []
+    for year, complete in sorted(years.items()):
+        if not complete:
+            log.warning(f"Season {year} has unfinished jobs; not merging")
+            continue
+        count = merge_season_outputs(year, output_dir, logger)
+        log.info(f"Season {year}: wrote {count} players")
+        merged.append(year)
+    return merged
+
+
+def _worker_process(
+    queue_path: str, output_dir: str, lease_seconds: float, max_attempts: int
+) -> None:
+    logger = Logger("fangraphs-worker", use_queue=True)
+    with WorkQueue(queue_path, max_attempts=max_attempts) as queue:
+        run_worker(queue, output_dir, logger, lease_seconds=lease_seconds)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Coordinator/worker pulls of the projections matrix through a work queue.
+
+    Commands:
+        enqueue: plan the matrix and add its jobs to the queue
+        work: claim and run jobs until none are left (--processes for several)
+        merge: merge the partial outputs of every fully completed season
+        status: print the number of jobs per status
+    """
+    parser = argparse.ArgumentParser(
+        description="Distributed Fangraphs projections pulls"
+    )
+    parser.add_argument("command", choices=["enqueue", "work", "merge", "status"])
+    parser.add_argument(
+        "--queue",
+        type=str,
+        default="work_queue.db",
+        help="SQLite work queue shared by the coordinator and workers",
+    )
+    parser.add_argument(
+        "--output_dir", type=str, default=".", help="Shared directory for outputs"
+    )
+    parser.add_argument(
+        "--years", type=int, nargs="+", default=[2025], help="Seasons to enqueue"
+    )
+    parser.add_argument(
+        "--systems",
+        nargs="+",
+        default=PROJECTION_SYSTEMS,
+        help="Projection systems to enqueue (default: all)",
+    )
+    parser.add_argument(
+        "--groups",
+        nargs="+",
+        default=["bat", "pit"],
+        help="Position groups to enqueue (default: bat pit)",
+    )
+    parser.add_argument(
+        "--positions",
+        nargs="+",
+        default=["all"],
+        help="Batting positions to enqueue (default: all)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes to start on this host",
+    )
+    parser.add_argument(
+        "--lease_seconds",
+        type=float,
+        default=300.0,
+        help="Seconds a claimed job is held before others may take it over",
+    )
+    parser.add_argument(
+        "--max_attempts",
+        type=int,
+        default=3,
+        help="Claims per job before it is marked failed",
+    )
+
+    args = parser.parse_args(argv)
+    logger = Logger("fangraphs-distributed", use_queue=True)
+    log = logger.logging
+
+    if args.command == "work" and args.processes > 1:
+        processes = [
+            Process(
+                target=_worker_process,
+                args=(
+                    args.queue,
+                    args.output_dir,
+                    args.lease_seconds,
+                    args.max_attempts,
+                ),
+            )
+            for _ in range(args.processes)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        return
+
+    with WorkQueue(args.queue, max_attempts=args.max_attempts) as queue:
+        if args.command == "enqueue":
+            tasks = plan_backfill(args.years, args.systems, args.groups, args.positions)
+            enqueue_tasks(queue, tasks)
+        elif args.command == "work":
+            run_worker(queue, args.output_dir, logger, lease_seconds=args.lease_seconds)
+        elif args.command == "merge":
+            merge_completed(queue, args.output_dir, logger)
+        log.info(f"Queue status: {queue.counts()}")
+
+
+if __name__ == "__main__":
+    main()
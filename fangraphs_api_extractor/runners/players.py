@@ -1,26 +1,57 @@
 import argparse
-from typing import List, Optional, Union
+import os
+import sys
+from typing import List, Optional, Sequence, Union
 
-from fangraphs_api_extractor.managers import PlayersManager
+from fangraphs_api_extractor.managers import (
+    HydrationManager,
+    PlayersManager,
+    SplitsManager,
+)
 from fangraphs_api_extractor.models import PlayerModel
 from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
-from fangraphs_api_extractor.utils import Logger, serialize_players, write_json_file
+from fangraphs_api_extractor.service import (
+    FanOutWriter,
+    JsonFileSink,
+    ListSink,
+    NdjsonSink,
+    SnapshotSink,
+    StdoutSink,
+    StreamSink,
+)
+from fangraphs_api_extractor.storage import Crosswalk, ParseCache, SpillingPlayerList
+from fangraphs_api_extractor.utils import (
+    Logger,
+    RecordPredicate,
+    iter_serialized_players,
+    min_stat,
+    set_console_stream,
+    team_in,
+    write_json_file,
+    write_partitioned,
+)
 
 
 def main(
     sample_size: Optional[int] = None,
     output_dir: Optional[str] = None,
     use_test_data: bool = False,
-) -> Union[List[PlayerModel], None]:
+    snapshot_db: Optional[str] = None,
+    hydrate: bool = False,
+) -> Union[Sequence[PlayerModel], None]:
     """
     Main function to extract player data from Fangraphs Baseball API.
 
     Args:
-        sample_size: Optional maximum number of players to process. If provided,
-                    this will limit API calls to save time when only a sample is needed.
+        sample_size: Optional maximum number of players to process per group, so a
+                    run keeps up to this many hitters and this many pitchers. If
+                    provided (at least 1), this will limit API calls to save time
+                    when only a sample is needed.
         output_file: Optional path to write the JSON output. If None, no file is written.
         pretty: Whether to pretty-print the JSON output with indentation.
         use_test_data: If True, use test fixture data instead of making API calls.
+        snapshot_db: Optional SQLite path to record this run in a SnapshotStore.
+        hydrate: If True, fetch each player's stats page and attach it.
 
     Returns:
         List of PlayerModel objects if successful, None otherwise
@@ -48,76 +79,363 @@ def main(
         default=".",
         help="Path to write JSON output.",
     )
+    parser.add_argument(
+        "--hydrate",
+        action="store_true",
+        help="Fetch each player's stats page and include it in the output.",
+    )
+    parser.add_argument(
+        "--hydration_state",
+        type=str,
+        default=None,
+        help="JSON lines file recording hydrated players so reruns resume.",
+    )
+    parser.add_argument(
+        "--requests_per_second",
+        type=float,
+        default=None,
+        help="Maximum player hydration request rate (default: unlimited).",
+    )
+    parser.add_argument(
+        "--fields",
+        nargs="+",
+        default=None,
+        help="Only parse these projection stats, e.g. --fields hr avg era (default: all).",
+    )
+    parser.add_argument(
+        "--min_pa",
+        type=float,
+        default=None,
+        help="Skip hitters projected for fewer plate appearances.",
+    )
+    parser.add_argument(
+        "--min_ip",
+        type=float,
+        default=None,
+        help="Skip pitchers projected for fewer innings.",
+    )
+    parser.add_argument(
+        "--teams",
+        nargs="+",
+        default=None,
+        help="Only keep players on these teams, e.g. --teams NYY LAD FA.",
+    )
+    parser.add_argument(
+        "--splits",
+        nargs="+",
+        default=None,
+        help="Also write fangraph_players_<split>.json for batting positions (e.g. ss of) or pitcher roles (sta rel), served from the two 'all' pulls without extra requests.",
+    )
+    parser.add_argument(
+        "--partition_by",
+        nargs="+",
+        default=None,
+        choices=["player_type", "system", "team", "position"],
+        help="Also write one file per partition plus a manifest under <output_dir>/partitions.",
+    )
+    parser.add_argument(
+        "--compression",
+        choices=["gzip", "zstd"],
+        default=None,
+        help="Compress the output (and response archive) as it is written.",
+    )
+    parser.add_argument(
+        "--compression_level",
+        type=int,
+        default=None,
+        help="Compression level (default: 6 for gzip, 3 for zstd).",
+    )
+    parser.add_argument(
+        "--archive_dir",
+        type=str,
+        default=None,
+        help="Directory to archive raw Fangraphs responses in.",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=30.0,
+        help="Seconds to wait for each Fangraphs response (default: 30).",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help="Total seconds for all Fangraphs requests; later requests are skipped.",
+    )
+    parser.add_argument(
+        "--hedge_percentile",
+        type=float,
+        default=None,
+        help="Resend requests slower than this latency percentile (e.g. 95).",
+    )
+    parser.add_argument(
+        "--crosswalk",
+        type=str,
+        default=None,
+        help="ID register CSV (e.g. SFBB Player ID Map) to join ESPN/Yahoo/... ids from.",
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Also write fangraph_players.ndjson (one compact JSON object per line).",
+    )
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Also stream the players to stdout as NDJSON; log output moves to stderr.",
+    )
+    parser.add_argument(
+        "--memory_budget_mb",
+        type=float,
+        default=None,
+        help="Keep at most this many MB of parsed players in memory, spilling the rest to disk.",
+    )
+    parser.add_argument(
+        "--spill_dir",
+        type=str,
+        default=None,
+        help="Directory for spilled players (default: system temp dir).",
+    )
+    parser.add_argument(
+        "--parse_cache",
+        type=str,
+        default=None,
+        help="Directory caching parsed players by response hash; unchanged payloads reload without validation.",
+    )
+    parser.add_argument(
+        "--parse_cache_mb",
+        type=float,
+        default=256,
+        help="Maximum parse cache size before least recently used entries are evicted (default: 256).",
+    )
+    parser.add_argument(
+        "--snapshot_db",
+        type=str,
+        default=None,
+        help="SQLite database to record this run in for historical queries.",
+    )
 
     args = parser.parse_args()
+    if sample_size is not None and sample_size < 1:
+        parser.error(f"sample_size must be at least 1, got {sample_size}")
 
     # Override args with function parameters if provided
     if output_dir is not None:
         args.output_dir = output_dir
+    if snapshot_db is not None:
+        args.snapshot_db = snapshot_db
+    if hydrate:
+        args.hydrate = hydrate
 
-    logger = Logger("fangraphs-player-extractor")
+    if args.stdout:
+        # stdout carries the NDJSON records only
+        set_console_stream(sys.stderr)
+    logger = Logger("fangraphs-player-extractor", use_queue=True)
+
+    # Filters applied to raw records before they are parsed into models
+    hitter_filters: List[RecordPredicate] = []
+    pitcher_filters: List[RecordPredicate] = []
+    if args.min_pa is not None:
+        hitter_filters.append(min_stat("PA", args.min_pa))
+    if args.min_ip is not None:
+        pitcher_filters.append(min_stat("IP", args.min_ip))
+    if args.teams:
+        hitter_filters.append(team_in(args.teams))
+        pitcher_filters.append(team_in(args.teams))
     log = logger.logging
     year = args.year
 
-    cf = CoreFangraphs(year=year, logger=logger)
-    hitters: List[PlayerModel] = []
-    pitchers: List[PlayerModel] = []
-    players: List[PlayerModel] = []
-
-    # Get hitter projections
-    log.info(f"Fetching hitter projections for {year}...")
+    cf = CoreFangraphs(
+        year=year,
+        logger=logger,
+        max_workers=args.threads,
+        archive_dir=args.archive_dir,
+        archive_compression=args.compression or "gzip",
+        archive_level=args.compression_level,
+        timeout=args.timeout,
+        deadline=args.deadline,
+        hedge_percentile=args.hedge_percentile,
+    )
+    # Release the hedging threads and pooled connections however the run ends
     try:
-        # Get raw hitter data from API
-        hitter_data = cf.get_projections_data("bat")
-        if hitter_data:
-            hitters_manager = PlayersManager("hitters")
-            # Parse the raw data into player models
-            hitters = hitters_manager.parse_players(hitter_data)
-            log.info(f"Parsed {len(hitters)} hitters")
-            players.extend(hitters)
-        else:
-            log.warning("Failed to fetch hitter data")
+        hitters: Sequence[PlayerModel] = []
+        pitchers: Sequence[PlayerModel] = []
+        players: List[PlayerModel] | SpillingPlayerList = []
+
+        # With a memory budget, both managers append into one spilling container
+        spill: Optional[SpillingPlayerList] = None
+        if args.memory_budget_mb is not None:
+            spill = SpillingPlayerList(
+                int(args.memory_budget_mb * 1024 * 1024), spill_dir=args.spill_dir
+            )
+            players = spill
+
+        # Content-addressed cache of parsed players, keyed by the raw response bytes
+        cache: Optional[ParseCache] = None
+        if args.parse_cache:
+            cache = ParseCache(
+                args.parse_cache, max_bytes=int(args.parse_cache_mb * 1024 * 1024)
+            )
+
+        # Get hitter projections
+        log.info(f"Fetching hitter projections for {year}...")
+        try:
+            # Get raw hitter data from API
+            hitter_data = (
+                cf.get_projections_content("bat")
+                if cache
+                else cf.get_projections_data("bat")
+            )
+            if hitter_data:
+                hitters_manager = PlayersManager("hitters", players=spill, cache=cache)
+                # Parse the raw data into player models
+                hitters = hitters_manager.parse_players(
+                    hitter_data,
+                    fields=args.fields,
+                    where=hitter_filters,
+                    limit=sample_size,
+                )
+                if spill is None:
+                    log.info(f"Parsed {len(hitters)} hitters")
+                    players.extend(hitters)
+                else:
+                    log.info(f"Parsed {len(spill)} hitters")
+            else:
+                log.warning("Failed to fetch hitter data")
+                hitters = []
+        except Exception as e:
+            log.error(f"Error fetching hitter data: {e}")
             hitters = []
-    except Exception as e:
-        log.error(f"Error fetching hitter data: {e}")
-        hitters = []
 
-    # Get pitcher projections
-    log.info(f"Fetching pitcher projections for {year}...")
-    try:
-        # Get raw pitcher data from API
-        pitcher_data = cf.get_projections_data("pit")
-        if pitcher_data:
-            pitchers_manager = PlayersManager("pitchers")
-            # Parse the raw data into player models
-            pitchers = pitchers_manager.parse_players(pitcher_data)
-            log.info(f"Parsed {len(pitchers)} pitchers")
-            players.extend(pitchers)
-        else:
-            log.warning("Failed to fetch pitcher data")
+        # Get pitcher projections
+        log.info(f"Fetching pitcher projections for {year}...")
+        try:
+            # Get raw pitcher data from API
+            pitcher_data = (
+                cf.get_projections_content("pit")
+                if cache
+                else cf.get_projections_data("pit")
+            )
+            if pitcher_data:
+                parsed_before = len(players)
+                pitchers_manager = PlayersManager(
+                    "pitchers", players=spill, cache=cache
+                )
+                # Parse the raw data into player models
+                pitchers = pitchers_manager.parse_players(
+                    pitcher_data,
+                    fields=args.fields,
+                    where=pitcher_filters,
+                    limit=sample_size,
+                )
+                if spill is None:
+                    log.info(f"Parsed {len(pitchers)} pitchers")
+                    players.extend(pitchers)
+                else:
+                    log.info(f"Parsed {len(spill) - parsed_before} pitchers")
+            else:
+                log.warning("Failed to fetch pitcher data")
+                pitchers = []
+        except Exception as e:
+            log.error(f"Error fetching pitcher data: {e}")
             pitchers = []
-    except Exception as e:
-        log.error(f"Error fetching pitcher data: {e}")
-        pitchers = []
 
-    log.info(f"Total players: {len(players)}")
+        log.info(f"Total players: {len(players)}")
+        if cf.cancelled:
+            log.warning("Request deadline reached; output is missing unfetched data")
+
+        # Fetch per-player stats pages
+        if args.hydrate:
+            hydration_manager = HydrationManager(
+                cf,
+                state_path=args.hydration_state,
+                requests_per_second=args.requests_per_second,
+            )
+            if spill is None:
+                hydration_manager.hydrate(players)
+            else:
+                spill.apply(hydration_manager.hydrate)
+
+        # Join other providers' ids
+        if args.crosswalk:
+            with Crosswalk(args.crosswalk) as crosswalk:
+                if spill is None:
+                    crosswalk.enrich(players)
+                else:
+                    spill.apply(crosswalk.enrich)
+
+        # Serialize every player once and feed the record to each output concurrently
+        sinks: List[StreamSink] = []
+        partition_sink: Optional[ListSink] = None
+        if args.output_dir:
+            sinks.append(
+                JsonFileSink(
+                    args.output_dir,
+                    "fangraph_players.json",
+                    logger,
+                    compression=args.compression,
+                    level=args.compression_level,
+                )
+            )
+            if args.ndjson:
+                sinks.append(
+                    NdjsonSink(
+                        os.path.join(args.output_dir, "fangraph_players.ndjson"),
+                        compression=args.compression,
+                        level=args.compression_level,
+                    )
+                )
+            if args.partition_by:
+                # Partitioning groups the whole set, so it keeps the records
+                partition_sink = ListSink()
+                sinks.append(partition_sink)
+        # Record the run for historical queries if a snapshot database is provided
+        if args.snapshot_db:
+            sinks.append(SnapshotSink(args.snapshot_db, year))
+        if args.stdout:
+            sinks.append(StdoutSink())
 
-    # Apply sample size limit if provided
-    if sample_size and sample_size < len(players):
-        log.info(f"Limiting to sample of {sample_size} players")
-        limited_hitters = hitters[: min(sample_size, len(hitters))]
-        limited_pitchers = pitchers[: min(sample_size, len(pitchers))]
-        players = limited_hitters + limited_pitchers
-        log.info(f"Limited to {len(players)} players")
+        if sinks:
+            failed = [m for m in FanOutWriter(sinks, logger).write(players) if m.error]
+            if failed:
+                raise IOError(
+                    "Failed to write outputs: "
+                    + ", ".join(f"{m.name} ({m.error})" for m in failed)
+                )
 
-    # Serialize player data
-    player_data = serialize_players(players, logger)
+        if partition_sink is not None:
+            write_partitioned(
+                partition_sink.records,
+                os.path.join(args.output_dir, "partitions"),
+                logger,
+                partition_by=args.partition_by,
+                max_workers=args.threads,
+                compression=args.compression,
+                level=args.compression_level,
+            )
 
-    # Write to file if output path is provided
-    if args.output_dir:
-        write_json_file(player_data, args.output_dir, "fangraph_players.json", logger)
+        # Position and role splits are subsets of the "all" pulls, so they are
+        # served locally instead of requested; each is streamed from the players
+        # (spilled ones included) rather than indexed in memory
+        if args.splits and args.output_dir:
+            splits_manager = SplitsManager()
+            for split in args.splits:
+                selected = splits_manager.iter_split(players, split)
+                if selected is None:
+                    continue
+                write_json_file(
+                    iter_serialized_players(selected, logger),
+                    args.output_dir,
+                    f"fangraph_players_{split}.json",
+                    logger,
+                    compression=args.compression,
+                    level=args.compression_level,
+                )
 
-    return players
+        return players
+    finally:
+        cf.close()
 
 
 if __name__ == "__main__":
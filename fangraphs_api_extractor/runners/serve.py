@@ -0,0 +1,36 @@
+import argparse
+
+from fangraphs_api_extractor.service import QueryService
+
+
+def main() -> None:
+    """Serve projection queries over HTTP from an extractor output file"""
+    parser = argparse.ArgumentParser(description="Serve Fangraphs projection queries")
+    parser.add_argument(
+        "--players_file",
+        type=str,
+        default="fangraph_players.json",
+        help="Extractor output to serve; reloaded when it changes",
+    )
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--reload_interval",
+        type=float,
+        default=2.0,
+        help="Seconds between checks for a new players file (default: 2)",
+    )
+    args = parser.parse_args()
+
+    service = QueryService(
+        args.players_file,
+        host=args.host,
+        port=args.port,
+        reload_interval=args.reload_interval,
+    )
+    service.log.info(f"Serving projection queries on {service.url}")
+    service.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
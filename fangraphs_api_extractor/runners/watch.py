@@ -0,0 +1,79 @@
+import argparse
+import signal
+
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.service import (
+    FileDropSink,
+    Sink,
+    UnixSocketSink,
+    WatchDaemon,
+    WatchTarget,
+)
+from fangraphs_api_extractor.utils import Logger
+
+
+def main() -> None:
+    """Run the extractor as a resident daemon publishing changed players"""
+    parser = argparse.ArgumentParser(description="Watch Fangraphs projections")
+    parser.add_argument(
+        "--year", type=int, default=2025, help="League year (default: 2025)"
+    )
+    parser.add_argument(
+        "--systems", nargs="+", default=["steamer"], help="Projection systems to poll"
+    )
+    parser.add_argument(
+        "--groups", nargs="+", default=["bat", "pit"], help="Position groups to poll"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=900.0,
+        help="Seconds between polls of each page (default: 900)",
+    )
+    parser.add_argument(
+        "--drop_dir", type=str, default=None, help="Directory to drop change events in"
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="Unix socket to stream change events to",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["pydantic", "msgspec"],
+        default="pydantic",
+        help="Decoding backend (default: pydantic)",
+    )
+    args = parser.parse_args()
+
+    sinks: list[Sink] = []
+    if args.drop_dir:
+        sinks.append(FileDropSink(args.drop_dir))
+    if args.socket:
+        sinks.append(UnixSocketSink(args.socket))
+    if not sinks:
+        parser.error("at least one of --drop_dir or --socket is required")
+
+    logger = Logger("fangraphs-watch", use_queue=True)
+    daemon = WatchDaemon(
+        CoreFangraphs(year=args.year, logger=logger),
+        [
+            WatchTarget(system=system, group=group)
+            for group in args.groups
+            for system in args.systems
+        ],
+        sinks,
+        interval=args.interval,
+        backend=args.backend,
+    )
+
+    signal.signal(signal.SIGTERM, lambda *_: daemon.stop())
+    try:
+        daemon.run_forever()
+    except KeyboardInterrupt:
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    main()
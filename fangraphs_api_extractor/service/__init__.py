@@ -0,0 +1,33 @@
+__all__ = [
+    "FanOutWriter",
+    "FileDropSink",
+    "JsonFileSink",
+    "ListSink",
+    "NdjsonSink",
+    "PlayerIndex",
+    "QueryService",
+    "RecordSink",
+    "Sink",
+    "SinkMetrics",
+    "SnapshotSink",
+    "StdoutSink",
+    "StreamSink",
+    "UnixSocketSink",
+    "WatchDaemon",
+    "WatchTarget",
+]
+
+from .fanout import (
+    FanOutWriter,
+    JsonFileSink,
+    ListSink,
+    NdjsonSink,
+    RecordSink,
+    SinkMetrics,
+    SnapshotSink,
+    StdoutSink,
+    StreamSink,
+)
+from .query_service import PlayerIndex, QueryService
+from .sinks import FileDropSink, Sink, UnixSocketSink
+from .watch_daemon import WatchDaemon, WatchTarget
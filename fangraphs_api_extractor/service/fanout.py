@@ -0,0 +1,362 @@
+import json
+import os
+import queue
+from abc import ABC, abstractmethod
+import sys
+import threading
+import time
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from fangraphs_api_extractor.storage import SnapshotStore
+from fangraphs_api_extractor.utils import (
+    Logger,
+    iter_serialized_players,
+    open_compressed,
+    write_json_file,
+)
+from fangraphs_api_extractor.utils.compression import with_extension
+
+# Marks the end of a sink's record stream
+_END = object()
+# Marks a record stream whose producer failed
+_ABORT = object()
+
+
+class RecordStreamAborted(Exception):
+    """Raised inside a sink's record stream when the producer failed"""
+
+
+class StreamSink(ABC):
+    """
+    Destination for serialized players fed by `FanOutWriter`, taking the whole
+    record stream at once.
+
+    `consume()` runs on the sink's own thread. The stream raises
+    `RecordStreamAborted` if the producer fails, in which case the sink must
+    not publish what it has written so far. Records are shared between sinks
+    and must not be modified.
+    """
+
+    name = "sink"
+
+    @abstractmethod
+    def consume(self, records: Iterator[Dict[str, Any]]) -> None:
+        """Write every record of the stream"""
+
+
+class RecordSink(StreamSink):
+    """
+    Stream sink written record by record.
+
+    Subclasses implement `write()`, and optionally `open()`, `close()` (called
+    once every record was written) and `abort()` (called instead of `close()`
+    when the producer or a write fails; defaults to `close()`).
+    """
+
+    def open(self) -> None:
+        pass
+
+    @abstractmethod
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record"""
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        self.close()
+
+    def consume(self, records: Iterator[Dict[str, Any]]) -> None:
+        self.open()
+        try:
+            for record in records:
+                self.write(record)
+        except BaseException:
+            self.abort()
+            raise
+        self.close()
+
+
+class JsonFileSink(StreamSink):
+    """
+    Writes the `fangraph_players.json` array, streamed record by record; an
+    aborted stream leaves the previous file in place.
+    """
+
+    name = "json"
+
+    def __init__(
+        self,
+        dir_path: str,
+        file_name: str = "fangraph_players.json",
+        logger: Optional[Logger] = None,
+        indent: Optional[int] = 2,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+    ):
+        self.dir_path = dir_path
+        self.file_name = file_name
+        self.logger = logger or Logger("json_file_sink")
+        self.indent = indent
+        self.compression = compression
+        self.level = level
+
+    def consume(self, records: Iterator[Dict[str, Any]]) -> None:
+        path = write_json_file(
+            records,
+            self.dir_path,
+            self.file_name,
+            self.logger,
+            indent=self.indent,
+            compression=self.compression,
+            level=self.level,
+        )
+        if path is None:
+            raise IOError(f"Failed to write {self.file_name}")
+
+
+class NdjsonSink(RecordSink):
+    """Writes one compact JSON object per line, atomically renamed into place"""
+
+    name = "ndjson"
+
+    def __init__(
+        self,
+        path: str,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+    ):
+        self.path = with_extension(path, compression)
+        self.compression = compression
+        self.level = level
+        self.file: Optional[IO] = None
+
+    def open(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.file = open_compressed(
+            f"{self.path}.tmp", "wt", self.compression, self.level
+        )
+
+    def write(self, record: Dict[str, Any]) -> None:
+        assert self.file is not None
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        os.replace(f"{self.path}.tmp", self.path)
+
+    def abort(self) -> None:
+        """Discard the partial file, keeping any previously published one"""
+        if self.file is None:
+            return
+        self.file.close()
+        self.file = None
+        os.remove(f"{self.path}.tmp")
+
+
+class StdoutSink(NdjsonSink):
+    """Writes NDJSON to a stream (stdout by default) for piping into other tools"""
+
+    name = "stdout"
+
+    def __init__(self, stream: Optional[IO] = None):
+        self.stream = stream
+
+    def open(self) -> None:
+        self.file = self.stream or sys.stdout
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.flush()
+            self.file = None
+
+    def abort(self) -> None:
+        # Records already streamed cannot be taken back
+        self.close()
+
+
+class SnapshotSink(StreamSink):
+    """Loads the run into a `SnapshotStore` database; an aborted run is rolled back"""
+
+    name = "snapshot"
+
+    def __init__(self, db_path: str, year: int, label: Optional[str] = None):
+        self.db_path = db_path
+        self.year = year
+        self.label = label
+        self.run_id: Optional[int] = None
+
+    def consume(self, records: Iterator[Dict[str, Any]]) -> None:
+        # SQLite connections belong to the thread that opens them
+        with SnapshotStore(self.db_path) as store:
+            self.run_id = store.record_run(records, self.year, label=self.label)
+
+
+class ListSink(RecordSink):
+    """Keeps the records, for outputs that need the whole set (e.g. partitions)"""
+
+    name = "list"
+
+    def __init__(self) -> None:
+        self.records: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        self.records.append(record)
+
+
+class SinkMetrics(BaseModel):
+    """Throughput of one sink during a `FanOutWriter.write()` call"""
+
+    name: str
+    records: int = 0
+    # Wall time from start until the sink finished
+    seconds: float = 0.0
+    # Time the sink spent writing, excluding waits for new records
+    busy_seconds: float = 0.0
+    # Time the producer was blocked because this sink's queue was full
+    blocked_seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.busy_seconds if self.busy_seconds else 0.0
+
+
+class FanOutWriter:
+    """
+    Serializes each player once and feeds the record to several sinks.
+
+    Every sink runs on its own thread and reads from its own bounded queue, so
+    a slow sink applies backpressure instead of buffering the whole run, and
+    the sinks write concurrently. A sink that fails is logged and drained; the
+    other sinks are unaffected. If the producer fails, every sink is aborted
+    (so no partial output is published) and the error is raised.
+    """
+
+    def __init__(
+        self,
+        sinks: Sequence[StreamSink],
+        logger: Optional[Logger] = None,
+        queue_size: int = 1000,
+    ):
+        """
+        Args:
+            sinks: Destinations for the serialized players
+            logger: Logger for logging messages
+            queue_size: Records buffered per sink before the producer blocks
+        """
+        self.logger = logger or Logger("fanout_writer")
+        self.log = self.logger.logging
+        self.sinks = list(sinks)
+        self.queue_size = queue_size
+
+    def _run_sink(
+        self, sink: StreamSink, records: queue.Queue, metrics: SinkMetrics
+    ) -> None:
+        start = time.perf_counter()
+        waiting = 0.0
+        ended = False
+
+        def stream() -> Iterator[Dict[str, Any]]:
+            nonlocal waiting, ended
+            while True:
+                wait_start = time.perf_counter()
+                record = records.get()
+                waiting += time.perf_counter() - wait_start
+                if record is _END:
+                    ended = True
+                    return
+                if record is _ABORT:
+                    ended = True
+                    raise RecordStreamAborted("the record producer failed")
+                metrics.records += 1
+                yield record
+
+        try:
+            sink.consume(stream())
+        except RecordStreamAborted as e:
+            metrics.error = str(e)
+        except Exception as e:
+            metrics.error = str(e)
+            self.log.error(f"Sink {metrics.name} failed: {e}")
+        finally:
+            # Drain so the producer never blocks on a sink that stopped early
+            while not ended:
+                ended = records.get() in (_END, _ABORT)
+        metrics.seconds = time.perf_counter() - start
+        metrics.busy_seconds = max(metrics.seconds - waiting, 0.0)
+
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> List[SinkMetrics]:
+        """
+        Feed already serialized records to every sink.
+
+        Returns:
+            Metrics per sink, in sink order
+
+        Raises:
+            Exception: Whatever iterating `records` raised, once every sink
+                has discarded its partial output
+        """
+        queues: List[queue.Queue] = [
+            queue.Queue(maxsize=self.queue_size) for _ in self.sinks
+        ]
+        metrics = [SinkMetrics(name=sink.name) for sink in self.sinks]
+        threads = [
+            threading.Thread(
+                target=self._run_sink,
+                args=(sink, q, m),
+                name=f"sink-{sink.name}",
+                daemon=True,
+            )
+            for sink, q, m in zip(self.sinks, queues, metrics)
+        ]
+        for thread in threads:
+            thread.start()
+
+        def put(q: queue.Queue, m: SinkMetrics, item: Any) -> None:
+            try:
+                q.put_nowait(item)
+            except queue.Full:
+                blocked_start = time.perf_counter()
+                q.put(item)
+                m.blocked_seconds += time.perf_counter() - blocked_start
+
+        end = _ABORT
+        try:
+            for record in records:
+                for q, m in zip(queues, metrics):
+                    put(q, m, record)
+            end = _END
+        finally:
+            for q, m in zip(queues, metrics):
+                put(q, m, end)
+            for thread in threads:
+                thread.join()
+
+        for m in metrics:
+            self.log.info(
+                f"Sink {m.name}: {m.records} records in {m.seconds:.2f}s "
+                f"({m.records_per_second:.0f}/s busy, {m.blocked_seconds:.2f}s blocked)"
+                + (f", failed: {m.error}" if m.error else "")
+            )
+        return metrics
+
+    def write(self, players: Iterable[Any]) -> List[SinkMetrics]:
+        """
+        Serialize players once each and feed every record to every sink.
+
+        Args:
+            players: Player models (or proxies, or a spilling container)
+
+        Returns:
+            Metrics per sink, in sink order
+
+        Raises:
+            Exception: If iterating the players fails; no sink publishes output
+        """
+        return self.write_records(iter_serialized_players(players, self.logger))
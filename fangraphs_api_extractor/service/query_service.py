@@ -0,0 +1,431 @@
+import heapq
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+from fangraphs_api_extractor.utils import Logger, normalize_string, read_json_file
+
+# Query parameters that are not stat filters
+QUERY_OPTIONS = {
+    "position",
+    "system",
+    "type",
+    "team",
+    "name",
+    "sort",
+    "order",
+    "limit",
+}
+
+# Cached response bodies per snapshot; cleared when full
+RESPONSE_CACHE_SIZE = 4096
+
+
+class PlayerIndex:
+    """
+    Immutable in-memory index over one snapshot of serialized players.
+
+    Players are looked up by playerid, slug and normalized name, and grouped by
+    eligible position, player type and team, so queries only scan the players
+    that can match. A two-way player's hitter and pitcher records share a
+    playerid and slug, so those map to every matching player. Error records
+    (players that failed to serialize, without a playerid) are skipped. A new
+    snapshot builds a new index; the indexed data is never mutated after
+    construction, which lets readers use it without locks.
+    """
+
+    def __init__(self, players: Sequence[Dict[str, Any]], version: str = ""):
+        self.logger = Logger("player_index")
+        self.log = self.logger.logging
+        self.players: List[Dict[str, Any]] = []
+        for player in players:
+            if player.get("playerid") is None:
+                self.log.warning(
+                    f"Skipping player without a playerid: {player.get('name')} "
+                    f"({player.get('error', 'no error recorded')})"
+                )
+                continue
+            self.players.append(player)
+        self.version = version
+        self.loaded_at = time.time()
+
+        self.by_id: Dict[str, List[int]] = {}
+        self.by_slug: Dict[str, List[int]] = {}
+        self.by_name: Dict[str, List[int]] = {}
+        self.by_position: Dict[str, List[int]] = {}
+        self.by_type: Dict[str, List[int]] = {}
+        self.by_team: Dict[str, List[int]] = {}
+        self.systems: set = set()
+
+        for i, player in enumerate(self.players):
+            self.by_id.setdefault(str(player["playerid"]), []).append(i)
+            if player.get("slug"):
+                self.by_slug.setdefault(player["slug"], []).append(i)
+            name = normalize_string(player.get("name", "")).lower()
+            self.by_name.setdefault(name, []).append(i)
+            if player.get("player_type"):
+                self.by_type.setdefault(player["player_type"], []).append(i)
+            self.by_team.setdefault(str(player.get("team", "FA")).lower(), []).append(i)
+            for position in self._eligible_positions(player):
+                self.by_position.setdefault(position, []).append(i)
+            self.systems.update(player.get("projections", {}))
+
+        self._responses: Dict[Tuple, bytes] = {}
+
+    @staticmethod
+    def _eligible_positions(player: Dict[str, Any]) -> List[str]:
+        if player.get("player_type") == "pitcher":
+            return ["p"]
+        return [
+            position.strip().lower()
+            for position in (player.get("min_position") or "").split("/")
+            if position.strip()
+        ]
+
+    @classmethod
+    def from_file(cls, path: str) -> "PlayerIndex":
+        """Build an index from a `fangraph_players.json` style file, optionally compressed"""
+        stat = os.stat(path)
+        players = read_json_file(path)
+        return cls(players, version=f"{stat.st_mtime_ns}-{stat.st_size}")
+
+    def lookup(
+        self, key: str, player_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the players with a playerid or slug.
+
+        Args:
+            key: Playerid or slug
+            player_type: Only return the "hitter" or "pitcher" record
+
+        Returns:
+            Matching players; two for a two-way player without a type
+        """
+        indices = self.by_id.get(key) or self.by_slug.get(key) or []
+        players = [self.players[i] for i in indices]
+        if player_type:
+            players = [
+                p for p in players if p.get("player_type") == player_type.lower()
+            ]
+        return players
+
+    def get(
+        self, key: str, player_type: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Look up the first player with a playerid or slug (see `lookup`)"""
+        players = self.lookup(key, player_type)
+        return players[0] if players else None
+
+    def _candidates(
+        self,
+        position: Optional[str],
+        player_type: Optional[str],
+        team: Optional[str],
+        name: Optional[str],
+    ) -> List[int]:
+        """Intersect the index lists for every given criterion"""
+        groups: List[List[int]] = []
+        if position:
+            groups.append(self.by_position.get(position.lower(), []))
+        if player_type:
+            groups.append(self.by_type.get(player_type.lower(), []))
+        if team:
+            groups.append(self.by_team.get(team.lower(), []))
+        if name:
+            groups.append(self.by_name.get(normalize_string(name).lower(), []))
+
+        if not groups:
+            return list(range(len(self.players)))
+
+        groups.sort(key=len)
+        selected = groups[0]
+        for group in groups[1:]:
+            members = set(group)
+            selected = [i for i in selected if i in members]
+        return selected
+
+    def query(
+        self,
+        position: Optional[str] = None,
+        system: Optional[str] = None,
+        player_type: Optional[str] = None,
+        team: Optional[str] = None,
+        name: Optional[str] = None,
+        filters: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        sort: Optional[str] = None,
+        descending: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find players matching every given criterion.
+
+        Args:
+            position: Eligible position (c, 1b, ss, of, p, ...)
+            system: Projection system; players without it are excluded and only
+                that projection is returned
+            player_type: "hitter" or "pitcher"
+            team: Team abbreviation
+            name: Player name, accents and case ignored
+            filters: Stat name to (minimum, maximum) bounds, either may be None
+            sort: Stat to sort by; players without the stat are excluded
+            descending: Sort from highest to lowest
+            limit: Maximum number of players to return
+
+        Returns:
+            Matching serialized players
+        """
+        selected = []
+        for i in self._candidates(position, player_type, team, name):
+            player = self.players[i]
+            projections = player.get("projections", {})
+            if system is not None:
+                if system not in projections:
+                    continue
+                stats = projections[system]
+            else:
+                stats = next(iter(projections.values()), {})
+
+            if filters and not _within_bounds(stats, filters):
+                continue
+            if sort is not None and not isinstance(stats.get(sort), (int, float)):
+                continue
+            selected.append((i, stats))
+
+        if sort is not None:
+            count = limit if limit is not None else len(selected)
+            pick = heapq.nlargest if descending else heapq.nsmallest
+            selected = pick(count, selected, key=lambda item: item[1][sort])
+        elif limit is not None:
+            selected = selected[:limit]
+
+        if system is None:
+            return [self.players[i] for i, _ in selected]
+        return [
+            {**self.players[i], "projections": {system: stats}} for i, stats in selected
+        ]
+
+    def cached_response(self, key: Tuple, build: Any) -> bytes:
+        """Return the encoded response for a query, building it on first use"""
+        body = self._responses.get(key)
+        if body is None:
+            body = json.dumps(build()).encode()
+            if len(self._responses) >= RESPONSE_CACHE_SIZE:
+                self._responses.clear()
+            self._responses[key] = body
+        return body
+
+
+def _within_bounds(
+    stats: Dict[str, Any], filters: Dict[str, Tuple[Optional[float], Optional[float]]]
+) -> bool:
+    for stat, (minimum, maximum) in filters.items():
+        value = stats.get(stat)
+        if not isinstance(value, (int, float)):
+            return False
+        if minimum is not None and value < minimum:
+            return False
+        if maximum is not None and value > maximum:
+            return False
+    return True
+
+
+def parse_filters(
+    query: Dict[str, List[str]],
+) -> Dict[str, Tuple[Optional[float], Optional[float]]]:
+    """
+    Parse `min_<stat>=x` / `max_<stat>=y` query parameters into stat bounds.
+
+    Raises:
+        ValueError: If a parameter is unknown or a bound is not a number
+    """
+    filters: Dict[str, List[Optional[float]]] = {}
+    for key, values in query.items():
+        if key in QUERY_OPTIONS:
+            continue
+        bound, _, stat = key.partition("_")
+        if bound not in ("min", "max") or not stat:
+            raise ValueError(f"Unknown query parameter: {key}")
+        bounds = filters.setdefault(stat, [None, None])
+        bounds[0 if bound == "min" else 1] = float(values[-1])
+    return {stat: (bounds[0], bounds[1]) for stat, bounds in filters.items()}
+
+
+class QueryService:
+    """
+    Read-only HTTP service answering projection queries from memory.
+
+    The players file is loaded once into a `PlayerIndex`. A background thread
+    watches the file and, when the extractor writes a new one, builds a fresh
+    index and swaps the reference in a single assignment; requests in flight
+    keep using the index they started with, so readers never wait on a reload.
+
+    Routes:
+        GET /players?position=ss&system=steamer&sort=hr&limit=10&min_hr=20
+        GET /players/<playerid or slug>[?type=hitter|pitcher]
+        GET /health
+    """
+
+    def __init__(
+        self,
+        players_file: str,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        reload_interval: float = 2.0,
+    ):
+        self.logger = Logger("query_service")
+        self.log = self.logger.logging
+        self.players_file = players_file
+        self.reload_interval = reload_interval
+        self.index = PlayerIndex.from_file(players_file)
+        self.log.info(f"Loaded {len(self.index.players)} players from {players_file}")
+
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def reload(self) -> bool:
+        """
+        Swap in a new index if the players file changed.
+
+        Returns:
+            True if a new snapshot was loaded
+        """
+        try:
+            stat = os.stat(self.players_file)
+        except OSError as e:
+            self.log.warning(f"Cannot stat {self.players_file}: {e}")
+            return False
+        if f"{stat.st_mtime_ns}-{stat.st_size}" == self.index.version:
+            return False
+
+        try:
+            index = PlayerIndex.from_file(self.players_file)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Most likely a partially written or malformed file; keep serving the
+            # old snapshot
+            self.log.warning(f"Skipping reload of {self.players_file}: {e}")
+            return False
+
+        self.index = index
+        self.log.info(f"Reloaded {len(index.players)} players ({index.version})")
+        return True
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.reload_interval):
+            self.reload()
+
+    def start(self) -> "QueryService":
+        """Serve and watch for new snapshots on background threads"""
+        self._threads = [
+            threading.Thread(target=self.httpd.serve_forever, daemon=True),
+            threading.Thread(target=self._watch, daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve on the calling thread, watching for new snapshots in the background"""
+        threading.Thread(target=self._watch, daemon=True).start()
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._threads:
+            self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "QueryService":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def handle(self, path: str) -> Tuple[int, bytes]:
+        """Answer a GET request path with a status code and JSON body"""
+        index = self.index
+        parsed = urlparse(path)
+        route = parsed.path.rstrip("/")
+
+        if route == "/health":
+            health = {
+                "players": len(index.players),
+                "systems": sorted(index.systems),
+                "version": index.version,
+                "loaded_at": index.loaded_at,
+            }
+            return 200, json.dumps(health).encode()
+
+        query = parse_qs(parsed.query)
+
+        def option(name: str) -> Optional[str]:
+            return query[name][-1] if name in query else None
+
+        if route.startswith("/players/"):
+            players = index.lookup(unquote(route[len("/players/") :]), option("type"))
+            if not players:
+                return 404, b'{"error": "player not found"}'
+            if len(players) > 1:
+                # A two-way player; both records are returned until a type is given
+                return 300, json.dumps(players).encode()
+            return 200, json.dumps(players[0]).encode()
+
+        if route != "/players":
+            return 404, b'{"error": "unknown route"}'
+
+        try:
+            filters = parse_filters(query)
+            limit = int(query["limit"][-1]) if "limit" in query else None
+            if limit is not None and limit < 0:
+                raise ValueError(f"limit must not be negative: {limit}")
+        except ValueError as e:
+            return 400, json.dumps({"error": str(e)}).encode()
+
+        key = (parsed.query,)
+        return 200, index.cached_response(
+            key,
+            lambda: index.query(
+                position=option("position"),
+                system=option("system"),
+                player_type=option("type"),
+                team=option("team"),
+                name=option("name"),
+                filters=filters,
+                sort=option("sort"),
+                descending=option("order") != "asc",
+                limit=limit,
+            ),
+        )
+
+    def _handler_class(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                status, body = service.handle(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
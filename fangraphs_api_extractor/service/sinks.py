@@ -0,0 +1,87 @@
+import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, Protocol
+
+from fangraphs_api_extractor.utils import Logger
+
+
+class Sink(Protocol):
+    """Anything that change events can be published to"""
+
+    def publish(self, event: Dict[str, Any]) -> None: ...
+
+
+class FileDropSink:
+    """
+    Publishes each event as a JSON file in a drop directory.
+
+    Files are written under a temporary name and renamed into place, so a
+    consumer watching the directory only ever sees complete events. Names sort
+    in publish order.
+    """
+
+    def __init__(self, drop_dir: str):
+        self.logger = Logger("file_drop_sink")
+        self.log = self.logger.logging
+        self.drop_dir = drop_dir
+        self.sequence = 0
+        self.lock = threading.Lock()
+        os.makedirs(drop_dir, exist_ok=True)
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        with self.lock:
+            self.sequence += 1
+            sequence = self.sequence
+        name = f"{time.time_ns()}-{sequence:06d}-{event.get('system')}-{event.get('group')}.json"
+        path = os.path.join(self.drop_dir, name)
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(event, f)
+        os.replace(f"{path}.tmp", path)
+        self.log.debug(f"Published {path}")
+
+
+class UnixSocketSink:
+    """
+    Publishes each event as one line of JSON to a Unix stream socket.
+
+    The connection is opened lazily and re-established after errors; events
+    published while no listener is available are logged and dropped.
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 5.0):
+        self.logger = Logger("unix_socket_sink")
+        self.log = self.logger.logging
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.sock: socket.socket | None = None
+        self.lock = threading.Lock()
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        return sock
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        line = json.dumps(event).encode() + b"\n"
+        with self.lock:
+            for attempt in range(2):
+                try:
+                    if self.sock is None:
+                        self.sock = self._connect()
+                    self.sock.sendall(line)
+                    return
+                except OSError as e:
+                    self.close()
+                    if attempt:
+                        self.log.warning(
+                            f"Dropping event, cannot publish to {self.socket_path}: {e}"
+                        )
+
+    def close(self) -> None:
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
@@ -0,0 +1,186 @@
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from fangraphs_api_extractor.managers import PlayersManager
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.utils import Logger, serialize_players
+
+from .sinks import Sink
+
+
+class WatchTarget(BaseModel):
+    """One projections page polled by the watch daemon"""
+
+    system: str
+    group: str
+    # Seconds between polls; None uses the daemon's default interval
+    interval: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.group}/{self.system}"
+
+    @property
+    def player_group(self) -> str:
+        return "hitters" if self.group == "bat" else "pitchers"
+
+
+def _fingerprint(player: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(player, sort_keys=True).encode()).hexdigest()
+
+
+class WatchDaemon:
+    """
+    Resident process that polls projections and publishes only what changed.
+
+    The `CoreFangraphs` session (and its connection pool) stays warm across
+    polls. Each target's raw response is hashed, and an unchanged payload is
+    skipped without parsing. For a changed payload, every serialized player is
+    fingerprinted, and only players that were added or changed (plus the ids
+    of removed players) are published to the sinks.
+    """
+
+    def __init__(
+        self,
+        core: CoreFangraphs,
+        targets: Sequence[WatchTarget],
+        sinks: Sequence[Sink],
+        interval: float = 900.0,
+        backend: str = "pydantic",
+        publish_initial: bool = True,
+    ):
+        """
+        Args:
+            core: Fangraphs client whose session is reused for every poll
+            targets: (system, group) pages to poll
+            sinks: Where change events are published
+            interval: Default seconds between polls of each target
+            backend: PlayersManager decoding backend
+            publish_initial: Publish every player on a target's first poll
+        """
+        self.logger = Logger("watch_daemon")
+        self.log = self.logger.logging
+        self.core = core
+        self.targets = list(targets)
+        self.sinks = list(sinks)
+        self.interval = interval
+        self.backend = backend
+        self.publish_initial = publish_initial
+        self.stop_event = threading.Event()
+
+        self.payload_hashes: Dict[str, str] = {}
+        self.fingerprints: Dict[str, Dict[str, str]] = {}
+        self.next_due: Dict[str, float] = {target.key: 0.0 for target in self.targets}
+
+    def poll(self, target: WatchTarget) -> Optional[Dict[str, Any]]:
+        """
+        Poll one target and publish its changes.
+
+        Returns:
+            The published event, or None if nothing changed or the fetch failed
+        """
+        content = self.core.get_projections_content(
+            target.group, projections_system=target.system
+        )
+        if content is None:
+            self.log.warning(f"Fetch failed for {target.key}")
+            return None
+
+        payload_hash = hashlib.sha256(content).hexdigest()
+        if self.payload_hashes.get(target.key) == payload_hash:
+            self.log.debug(f"{target.key} unchanged")
+            return None
+
+        manager = PlayersManager(
+            target.player_group, projection_system=target.system, backend=self.backend
+        )
+        players = serialize_players(manager.parse_players(content), self.logger)
+        # Players that failed to serialize come back as error records without
+        # a playerid; they cannot be fingerprinted
+        skipped = [player for player in players if player.get("playerid") is None]
+        if skipped:
+            self.log.warning(
+                f"Skipping {len(skipped)} unserializable players in {target.key}"
+            )
+            players = [
+                player for player in players if player.get("playerid") is not None
+            ]
+        if not players and content.strip():
+            # An error page or a payload in an unexpected shape, not a real
+            # empty board; keep the last state so every player is not "removed"
+            self.log.warning(f"No players parsed for {target.key}; treating as failed")
+            return None
+        current = {player["playerid"]: _fingerprint(player) for player in players}
+
+        first_poll = target.key not in self.fingerprints
+        previous = self.fingerprints.get(target.key, {})
+        changed = [
+            player
+            for player in players
+            if previous.get(player["playerid"]) != current[player["playerid"]]
+        ]
+        removed = sorted(set(previous) - set(current))
+
+        self.payload_hashes[target.key] = payload_hash
+        self.fingerprints[target.key] = current
+
+        if first_poll and not self.publish_initial:
+            return None
+        if not changed and not removed:
+            self.log.debug(f"{target.key} payload changed but no player did")
+            return None
+
+        event = {
+            "system": target.system,
+            "group": target.group,
+            "season": self.core.year,
+            "fetched_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "payload_sha256": payload_hash,
+            "initial": first_poll,
+            "changed": changed,
+            "removed": removed,
+        }
+        for sink in self.sinks:
+            try:
+                sink.publish(event)
+            except Exception as e:
+                self.log.error(f"Error publishing {target.key} to {sink}: {e}")
+
+        self.log.info(
+            f"{target.key}: published {len(changed)} changed, {len(removed)} removed"
+        )
+        return event
+
+    def run_once(self) -> List[Dict[str, Any]]:
+        """Poll every target that is due and return the published events"""
+        events = []
+        now = time.monotonic()
+        for target in self.targets:
+            if self.next_due[target.key] > now:
+                continue
+            self.next_due[target.key] = now + (target.interval or self.interval)
+            try:
+                event = self.poll(target)
+            except Exception as e:
+                self.log.error(f"Error polling {target.key}: {e}")
+                continue
+            if event is not None:
+                events.append(event)
+        return events
+
+    def run_forever(self) -> None:
+        """Poll on schedule until `stop()` is called"""
+        self.log.info(f"Watching {len(self.targets)} targets")
+        while not self.stop_event.is_set():
+            self.run_once()
+            wait = min(self.next_due.values()) - time.monotonic()
+            self.stop_event.wait(max(wait, 0.0))
+
+    def stop(self) -> None:
+        self.stop_event.set()
@@ -0,0 +1,16 @@
+__all__ = [
+    "Crosswalk",
+    "CrosswalkColumns",
+    "ParseCache",
+    "PlayerCodec",
+    "SnapshotStore",
+    "SpillingPlayerList",
+    "WorkQueue",
+]
+
+from .crosswalk import Crosswalk, CrosswalkColumns
+from .parse_cache import ParseCache
+from .player_codec import PlayerCodec
+from .snapshot_store import SnapshotStore
+from .spill import SpillingPlayerList
+from .work_queue import WorkQueue
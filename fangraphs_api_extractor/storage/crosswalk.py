@@ -0,0 +1,301 @@
+import csv
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+
+from fangraphs_api_extractor.models import PlayerModel
+from fangraphs_api_extractor.utils import Logger, normalize_string
+
+INDEX_MAGIC = b"FGXW"
+INDEX_VERSION = 1
+
+# Lookup tables stored in the index, in order
+LOOKUP_KEYS = ["fangraphs", "mlbam", "name"]
+
+# Set on a name table slot when several register rows share the name
+AMBIGUOUS = np.uint32(0x80000000)
+
+
+class CrosswalkColumns(BaseModel):
+    """
+    Register CSV column names. The defaults match the SFBB Player ID Map;
+    `external` maps output id names to register columns.
+    """
+
+    fangraphs: str = "IDFANGRAPHS"
+    mlbam: str = "MLBID"
+    name: str = "PLAYERNAME"
+    external: Dict[str, str] = {
+        "espn": "ESPNID",
+        "yahoo": "YAHOOID",
+        "cbs": "CBSID",
+        "fantrax": "FANTRAXID",
+        "bbref": "BREFID",
+    }
+
+
+def _name_key(name: str) -> str:
+    return normalize_string(name).strip().lower()
+
+
+def _hash(key: str) -> int:
+    return zlib.crc32(key.encode())
+
+
+def _source_signature(path: str) -> str:
+    stat = os.stat(path)
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+def _table_size(rows: int) -> int:
+    size = 8
+    while size < rows * 2:
+        size *= 2
+    return size
+
+
+def _build_table(keys: Sequence[str], mark_duplicates: bool) -> np.ndarray:
+    """Open addressing hash table of row + 1 per key; 0 marks an empty slot"""
+    table = np.zeros(_table_size(len(keys)), dtype=np.uint32)
+    mask = len(table) - 1
+    for row, key in enumerate(keys):
+        if not key:
+            continue
+        slot = _hash(key) & mask
+        while table[slot]:
+            existing = int(table[slot] & ~AMBIGUOUS) - 1
+            if keys[existing] == key:
+                if mark_duplicates:
+                    table[slot] |= AMBIGUOUS
+                break
+            slot = (slot + 1) & mask
+        else:
+            table[slot] = row + 1
+    return table
+
+
+def build_index(
+    register_path: str,
+    index_path: str,
+    columns: Optional[CrosswalkColumns] = None,
+) -> None:
+    """
+    Build the on-disk crosswalk index for a register CSV.
+
+    Layout: magic, header length and JSON header, then 8-byte aligned sections
+    for the field offsets (uint32), one hash table per lookup key (uint32) and
+    the UTF-8 field blob.
+    """
+    columns = columns or CrosswalkColumns()
+    field_columns = [columns.fangraphs, columns.mlbam, columns.name]
+    field_columns += list(columns.external.values())
+
+    with open(register_path, "r", newline="", encoding="utf-8-sig") as f:
+        rows = [
+            [(row.get(column) or "").strip() for column in field_columns]
+            for row in csv.DictReader(f)
+        ]
+
+    blob = bytearray()
+    offsets = np.zeros(len(rows) * len(field_columns) + 1, dtype=np.uint32)
+    i = 0
+    for row in rows:
+        for value in row:
+            blob += value.encode()
+            i += 1
+            offsets[i] = len(blob)
+
+    tables = [
+        _build_table([row[0] for row in rows], mark_duplicates=False),
+        _build_table([row[1] for row in rows], mark_duplicates=False),
+        _build_table([_name_key(row[2]) for row in rows], mark_duplicates=True),
+    ]
+
+    sections: List[Tuple[str, bytes]] = [("offsets", offsets.tobytes())]
+    sections += [(key, table.tobytes()) for key, table in zip(LOOKUP_KEYS, tables)]
+    sections.append(("blob", bytes(blob)))
+
+    header: Dict[str, Any] = {
+        "version": INDEX_VERSION,
+        "source": _source_signature(register_path),
+        "rows": len(rows),
+        "columns": ["fangraphs", "mlbam", "name"] + list(columns.external),
+        # Register columns the fields were read from; other mappings rebuild
+        "register_columns": columns.model_dump(),
+        "sections": {},
+    }
+    # Offsets are relative to the end of the header, which is padded to 8 bytes
+    position = 0
+    for name, body in sections:
+        header["sections"][name] = [position, len(body)]
+        position += len(body) + (-len(body) % 8)
+
+    header_bytes = json.dumps(header).encode()
+    header_bytes += b" " * (-(len(header_bytes) + 8) % 8)
+
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(INDEX_MAGIC + struct.pack("<I", len(header_bytes)) + header_bytes)
+        for _, body in sections:
+            f.write(body + b"\0" * (-len(body) % 8))
+    os.replace(tmp_path, index_path)
+
+
+class Crosswalk:
+    """
+    External ID crosswalk backed by a memory-mapped hash index.
+
+    The register CSV is parsed once into a compact index file next to it (or at
+    `index_path`) and rebuilt only when the CSV changes. Opening an existing
+    index just maps it, and lookups probe the mapped hash tables directly, so
+    nothing is loaded up front.
+
+    Players are matched by Fangraphs playerid, then MLBAM id, then by name with
+    accents and case ignored; names shared by several register rows are not
+    matched.
+    """
+
+    def __init__(
+        self,
+        register_path: str,
+        index_path: Optional[str] = None,
+        columns: Optional[CrosswalkColumns] = None,
+    ):
+        self.logger = Logger("crosswalk")
+        self.log = self.logger.logging
+        self.register_path = register_path
+        self.index_path = index_path or f"{register_path}.idx"
+        columns = columns or CrosswalkColumns()
+
+        if not self._index_is_current(columns):
+            self.log.info(f"Building crosswalk index {self.index_path}")
+            build_index(register_path, self.index_path, columns)
+
+        self._file = open(self.index_path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        header_length = struct.unpack_from("<I", self._map, len(INDEX_MAGIC))[0]
+        data_start = len(INDEX_MAGIC) + 4 + header_length
+        self.header = json.loads(self._map[len(INDEX_MAGIC) + 4 : data_start])
+        self.columns: List[str] = self.header["columns"]
+        self.rows: int = self.header["rows"]
+
+        def section(name: str) -> np.ndarray:
+            start, length = self.header["sections"][name]
+            return np.frombuffer(
+                self._map, dtype=np.uint32, count=length // 4, offset=data_start + start
+            )
+
+        self._offsets = section("offsets")
+        self._tables = {key: section(key) for key in LOOKUP_KEYS}
+        self._blob_start = data_start + self.header["sections"]["blob"][0]
+
+    def _index_is_current(self, columns: CrosswalkColumns) -> bool:
+        """Whether the index was built from the current CSV with these columns"""
+        if not os.path.exists(self.index_path):
+            return False
+        with open(self.index_path, "rb") as f:
+            if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                return False
+            header_length = struct.unpack("<I", f.read(4))[0]
+            header = json.loads(f.read(header_length))
+        return (
+            header.get("version") == INDEX_VERSION
+            and header.get("source") == _source_signature(self.register_path)
+            and header.get("register_columns") == columns.model_dump()
+        )
+
+    def close(self) -> None:
+        # Drop the array views before closing the map they point into
+        self._offsets = self._tables = None  # type: ignore[assignment]
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "Crosswalk":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def field(self, row: int, column: int) -> str:
+        i = row * len(self.columns) + column
+        start = self._blob_start + int(self._offsets[i])
+        end = self._blob_start + int(self._offsets[i + 1])
+        return self._map[start:end].decode()
+
+    def _row_key(self, key_type: str, row: int) -> str:
+        value = self.field(row, LOOKUP_KEYS.index(key_type))
+        return _name_key(value) if key_type == "name" else value
+
+    def find(self, key_type: str, key: str) -> Optional[int]:
+        """
+        Find the register row for a key.
+
+        Args:
+            key_type: "fangraphs", "mlbam" or "name"
+            key: Key value; names are normalized before lookup
+
+        Returns:
+            Row number, or None if missing or the name is ambiguous
+        """
+        if key_type == "name":
+            key = _name_key(key)
+        if not key:
+            return None
+
+        table = self._tables[key_type]
+        mask = len(table) - 1
+        slot = _hash(key) & mask
+        while table[slot]:
+            value = table[slot]
+            row = int(value & ~AMBIGUOUS) - 1
+            if self._row_key(key_type, row) == key:
+                return None if value & AMBIGUOUS else row
+            slot = (slot + 1) & mask
+        return None
+
+    def external_ids(self, row: int) -> Dict[str, str]:
+        """The non-empty external ids of a register row"""
+        ids = {}
+        for column, name in enumerate(self.columns[3:], start=3):
+            value = self.field(row, column)
+            if value:
+                ids[name] = value
+        return ids
+
+    def match(self, player: PlayerModel) -> Tuple[Optional[int], Optional[str]]:
+        """Return the matching row and which key matched it"""
+        row = self.find("fangraphs", player.playerid)
+        if row is not None:
+            return row, "fangraphs"
+        if player.xmlbam_id > 0:
+            row = self.find("mlbam", str(player.xmlbam_id))
+            if row is not None:
+                return row, "mlbam"
+        row = self.find("name", player.name)
+        return row, "name" if row is not None else None
+
+    def enrich(self, players: Sequence[PlayerModel]) -> Dict[str, int]:
+        """
+        Attach external ids to every matching player's `external_ids`.
+
+        Returns:
+            Number of players matched per key, plus "unmatched"
+        """
+        counts = {key: 0 for key in LOOKUP_KEYS}
+        counts["unmatched"] = 0
+        for player in players:
+            row, matched_by = self.match(player)
+            if row is None or matched_by is None:
+                counts["unmatched"] += 1
+                continue
+            counts[matched_by] += 1
+            player.external_ids = self.external_ids(row)
+
+        self.log.info(f"Crosswalk matches: {counts}")
+        return counts
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import struct
+from functools import lru_cache
+from typing import Any, Iterable, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from fangraphs_api_extractor import models
+from fangraphs_api_extractor.utils import Logger
+
+from .player_codec import PlayerCodec
+
+CACHE_MAGIC = b"FGPC"
+# Bump when the entry layout or PlayerCodec encoding changes
+CACHE_FORMAT = 2
+
+
+@lru_cache(maxsize=None)
+def model_version() -> str:
+    """
+    Fingerprint of the player and projection model definitions.
+
+    Changes whenever a model gains, loses or retypes a field, so entries
+    written by older model code are never loaded into newer models.
+    """
+    schema = []
+    for name in sorted(models.__all__):
+        cls = getattr(models, name)
+        if isinstance(cls, type) and issubclass(cls, BaseModel):
+            schema.append(
+                [
+                    name,
+                    [
+                        [field, repr(info.annotation), info.alias]
+                        for field, info in cls.model_fields.items()
+                    ],
+                ]
+            )
+    body = json.dumps([CACHE_FORMAT, schema]).encode()
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+class ParseCache:
+    """
+    Content-addressed cache of parsed player sets.
+
+    Entries are keyed by the sha256 of the raw response payload together with
+    everything else that shapes the parse (player group, projection system,
+    projected fields, limit and the model version), and store the parsed
+    players in the compact `PlayerCodec` format. A hit rebuilds the models
+    without validation, so re-parsing a byte-identical payload is a file read.
+
+    The cache directory is bounded to `max_bytes`; the least recently used
+    entries (by file mtime, refreshed on every hit) are evicted after a write.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            cache_dir: Directory for cache entries
+            max_bytes: Total size of entries to keep
+        """
+        self.logger = Logger("parse_cache")
+        self.log = self.logger.logging
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(
+        self,
+        payload: bytes,
+        player_group: str,
+        projection_system: str,
+        fields: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> str:
+        """Cache key for parsing `payload` with the given options"""
+        digest = hashlib.sha256(payload)
+        options = [
+            model_version(),
+            player_group,
+            projection_system,
+            sorted(fields) if fields is not None else None,
+            limit,
+        ]
+        digest.update(json.dumps(options).encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.fgpc")
+
+    def get(self, key: str) -> Optional[List[Any]]:
+        """
+        Load a cached player set.
+
+        Returns:
+            The parsed players, or None on a miss or an unreadable entry
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                if f.read(len(CACHE_MAGIC)) != CACHE_MAGIC:
+                    raise ValueError("bad magic")
+                header_length = struct.unpack("<I", f.read(4))[0]
+                header = json.loads(f.read(header_length))
+                codec = PlayerCodec.from_descriptions(header["classes"])
+                players = codec.loads(f.read())
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception as e:
+            self.log.warning(f"Discarding unreadable cache entry {path}: {e}")
+            self.misses += 1
+            self._remove(path)
+            return None
+
+        os.utime(path)
+        self.hits += 1
+        self.log.debug(f"Cache hit {key[:12]}: {len(players)} players")
+        return players
+
+    def put(self, key: str, players: Sequence[Any]) -> None:
+        """Store a parsed player set, then evict down to `max_bytes`"""
+        codec = PlayerCodec()
+        body = codec.dumps(players)
+        header = json.dumps({"classes": codec.describe_classes()}).encode()
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(CACHE_MAGIC + struct.pack("<I", len(header)) + header + body)
+        os.replace(tmp_path, path)
+        self.log.debug(f"Cached {len(players)} players as {key[:12]}")
+        self.evict()
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits `max_bytes`.
+
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".fgpc"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+        if removed:
+            self.log.debug(f"Evicted {removed} cache entries")
+        return removed
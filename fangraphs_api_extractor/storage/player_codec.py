@@ -0,0 +1,112 @@
+import json
+import zlib
+from typing import Any, Dict, List, Sequence, Type
+
+from pydantic import BaseModel
+
+from fangraphs_api_extractor import models
+from fangraphs_api_extractor.models import LazyPlayer
+from fangraphs_api_extractor.models.base_player import (
+    SLIM_MODEL_ORIGINS,
+    projection_model_for_fields,
+)
+
+
+class PlayerCodec:
+    """
+    Compact binary encoding of parsed player models.
+
+    Each model becomes a list of its field values in class field order (so
+    field names are stored once, in the class table), with projections nested
+    the same way, and a batch is written as zlib-compressed JSON. Decoding
+    rebuilds models with `model_construct` from those previously validated
+    values, skipping validation, so it is much faster than parsing the API
+    records again; nothing but JSON is ever read back.
+
+    Model classes are referenced by index into `classes`; `describe_classes()`
+    and `from_descriptions()` persist that table across processes.
+    """
+
+    def __init__(self, classes: Sequence[Type[BaseModel]] = ()):
+        self.classes: List[Type[BaseModel]] = []
+        self.class_ids: Dict[Type[BaseModel], int] = {}
+        self.field_names: List[List[str]] = []
+        self.has_projections: List[bool] = []
+        for cls in classes:
+            self._class_id(cls)
+
+    def _class_id(self, cls: Type[BaseModel]) -> int:
+        if cls not in self.class_ids:
+            self.class_ids[cls] = len(self.classes)
+            self.classes.append(cls)
+            self.field_names.append(list(cls.model_fields))
+            self.has_projections.append("projections" in cls.model_fields)
+        return self.class_ids[cls]
+
+    def encode(self, model: BaseModel | LazyPlayer) -> List[Any]:
+        if isinstance(model, LazyPlayer):
+            model = model.materialize()
+        class_id = self._class_id(type(model))
+        # Projections keep their place (and so the field order) as a None slot
+        values = [
+            None if name == "projections" else getattr(model, name)
+            for name in self.field_names[class_id]
+        ]
+        projections = [
+            [source, self.encode(projection)]
+            for source, projection in getattr(model, "projections", {}).items()
+        ]
+        return [class_id, values, projections]
+
+    def decode(self, row: Sequence[Any]) -> Any:
+        class_id, values, projections = row
+        cls = self.classes[class_id]
+        data = dict(zip(self.field_names[class_id], values))
+        if self.has_projections[class_id]:
+            data["projections"] = {
+                source: self.decode(projection) for source, projection in projections
+            }
+        return cls.model_construct(**data)
+
+    def dumps(self, players: Sequence[Any], level: int = 1) -> bytes:
+        """Encode a batch of players"""
+        rows = [self.encode(player) for player in players]
+        return zlib.compress(json.dumps(rows, separators=(",", ":")).encode(), level)
+
+    def loads(self, body: bytes) -> List[Any]:
+        """Decode a batch written by `dumps()`"""
+        return [self.decode(row) for row in json.loads(zlib.decompress(body))]
+
+    def describe_classes(self) -> List[List[Any]]:
+        """
+        JSON-serializable description of the class table.
+
+        Models are described by their name in `fangraphs_api_extractor.models`;
+        slimmed projection models by their full model and field names.
+        """
+        descriptions: List[List[Any]] = []
+        for cls in self.classes:
+            if cls in SLIM_MODEL_ORIGINS:
+                proj_cls, fields = SLIM_MODEL_ORIGINS[cls]
+                descriptions.append(["slim", proj_cls.__name__, sorted(fields)])
+            else:
+                descriptions.append(["model", cls.__name__])
+        return descriptions
+
+    @classmethod
+    def from_descriptions(cls, descriptions: Sequence[Sequence[Any]]) -> "PlayerCodec":
+        """
+        Rebuild a codec from `describe_classes()` output.
+
+        Raises:
+            AttributeError: If a described model no longer exists
+        """
+        classes: List[Type[BaseModel]] = []
+        for description in descriptions:
+            model_cls = getattr(models, description[1])
+            if description[0] == "slim":
+                model_cls = projection_model_for_fields(
+                    model_cls, frozenset(description[2])
+                )
+            classes.append(model_cls)
+        return cls(classes)
@@ -0,0 +1,315 @@
+import json
+import sqlite3
+from datetime import datetime, time, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from fangraphs_api_extractor.utils import Logger, read_json_file
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    systems TEXT NOT NULL,
+    label TEXT
+);
+CREATE TABLE IF NOT EXISTS players (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    playerid TEXT NOT NULL,
+    player_type TEXT NOT NULL DEFAULT '',
+    name TEXT,
+    ascii_name TEXT,
+    team TEXT,
+    xmlbam_id INTEGER,
+    PRIMARY KEY (run_id, playerid, player_type)
+);
+CREATE TABLE IF NOT EXISTS projections (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    playerid TEXT NOT NULL,
+    player_type TEXT NOT NULL DEFAULT '',
+    system TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (run_id, playerid, player_type, system)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_created_at ON runs(created_at);
+CREATE INDEX IF NOT EXISTS idx_players_playerid
+    ON players(playerid, player_type, run_id);
+CREATE INDEX IF NOT EXISTS idx_projections_player_system
+    ON projections(playerid, system, player_type, run_id);
+"""
+
+# Databases created before player_type was part of the keys; their rows are
+# copied over with an empty player_type
+MIGRATE_PLAYER_TYPE = """
+DROP INDEX IF EXISTS idx_players_playerid;
+DROP INDEX IF EXISTS idx_projections_player_system;
+ALTER TABLE players RENAME TO players_old;
+ALTER TABLE projections RENAME TO projections_old;
+"""
+
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _normalize_timestamp(value: str, end_of_day: bool = False) -> str:
+    """
+    Canonical UTC form of an ISO-8601 timestamp, so stored timestamps compare
+    correctly as strings.
+
+    Args:
+        value: Timestamp or date; naive timestamps are taken as UTC
+        end_of_day: Read a date-only value as the last second of that day
+            rather than midnight, for inclusive upper bounds
+    """
+    parsed = datetime.fromisoformat(value)
+    if end_of_day and "T" not in value and " " not in value:
+        parsed = datetime.combine(parsed.date(), time(23, 59, 59), parsed.tzinfo)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
+class SnapshotStore:
+    """
+    SQLite store of extractor runs for historical projection queries.
+
+    Every run's serialized players (the `fangraph_players.json` format) are
+    inserted in a single transaction, and projections are indexed by
+    (playerid, system, player_type, run) so as-of and time-series lookups are
+    index scans instead of re-reading JSON snapshots. A two-way player keeps
+    both their hitter and pitcher records in a run.
+    """
+
+    def __init__(self, db_path: str):
+        self.logger = Logger("snapshot_store")
+        self.log = self.logger.logging
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+        self.conn.executescript(SCHEMA)
+
+    def _migrate(self) -> None:
+        """Add player_type to the keys of a database from an older version"""
+        columns = {
+            row["name"] for row in self.conn.execute("PRAGMA table_info(players)")
+        }
+        if not columns or "player_type" in columns:
+            return
+        self.log.info(f"Adding player_type to the snapshot keys in {self.db_path}")
+        self.conn.executescript(MIGRATE_PLAYER_TYPE)
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO players (run_id, playerid, name, ascii_name, team, "
+                "xmlbam_id) SELECT run_id, playerid, name, ascii_name, team, "
+                "xmlbam_id FROM players_old"
+            )
+            self.conn.execute(
+                "INSERT INTO projections (run_id, playerid, system, data) "
+                "SELECT run_id, playerid, system, data FROM projections_old"
+            )
+            self.conn.execute("DROP TABLE players_old")
+            self.conn.execute("DROP TABLE projections_old")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def record_run(
+        self,
+        players: Iterable[Dict[str, Any]],
+        year: int,
+        created_at: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> int:
+        """
+        Insert one run of serialized players.
+
+        Args:
+            players: Serialized players as produced by `serialize_players`; any
+                iterable, consumed once (e.g. a stream of serialized players)
+            year: Season the projections are for
+            created_at: ISO-8601 timestamp of the run, defaults to now (UTC)
+            label: Optional free-form run label
+
+        Returns:
+            The new run id
+        """
+        created_at = _normalize_timestamp(created_at) if created_at else _utc_now()
+        systems: Set[str] = set()
+
+        player_rows: List[Tuple[Any, ...]] = []
+        projection_rows: List[Tuple[Any, ...]] = []
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (created_at, year, systems, label) VALUES (?, ?, ?, ?)",
+                (created_at, year, json.dumps([]), label),
+            )
+            run_id = cursor.lastrowid
+            assert run_id is not None
+
+            for player in players:
+                playerid = player.get("playerid")
+                if playerid is None:
+                    continue
+                player_type = player.get("player_type") or ""
+                player_rows.append(
+                    (
+                        run_id,
+                        playerid,
+                        player_type,
+                        player.get("name"),
+                        player.get("ascii_name"),
+                        player.get("team"),
+                        player.get("xmlbam_id"),
+                    )
+                )
+                for system, projection in player.get("projections", {}).items():
+                    systems.add(system)
+                    projection_rows.append(
+                        (run_id, playerid, player_type, system, json.dumps(projection))
+                    )
+
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO players VALUES (?, ?, ?, ?, ?, ?, ?)",
+                player_rows,
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO projections VALUES (?, ?, ?, ?, ?)",
+                projection_rows,
+            )
+            self.conn.execute(
+                "UPDATE runs SET systems = ? WHERE run_id = ?",
+                (json.dumps(sorted(systems)), run_id),
+            )
+
+        self.log.info(
+            f"Recorded run {run_id} with {len(player_rows)} players and "
+            f"{len(projection_rows)} projections"
+        )
+        return run_id
+
+    def import_json_file(
+        self,
+        file_path: str,
+        year: int,
+        created_at: Optional[str] = None,
+        label: Optional[str] = None,
+    ) -> int:
+        """Record a previously written `fangraph_players.json` snapshot (optionally compressed)"""
+        players = read_json_file(file_path)
+        return self.record_run(players, year, created_at=created_at, label=label)
+
+    def runs(self, year: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List recorded runs in chronological order"""
+        query = "SELECT * FROM runs"
+        params: Tuple[Any, ...] = ()
+        if year is not None:
+            query += " WHERE year = ?"
+            params = (year,)
+        rows = self.conn.execute(query + " ORDER BY created_at, run_id", params)
+        return [
+            dict(row, systems=json.loads(row["systems"])) for row in rows.fetchall()
+        ]
+
+    def as_of(
+        self,
+        playerid: str,
+        system: str,
+        timestamp: Optional[str] = None,
+        player_type: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Latest projection for a player and system recorded at or before `timestamp`.
+
+        Args:
+            playerid: Fangraphs player id
+            system: Projection system
+            timestamp: ISO-8601 timestamp, defaults to now; a date covers every
+                run recorded that day
+            player_type: Only the "hitter" or "pitcher" projection, to pick one
+                half of a two-way player (otherwise the hitter's is returned)
+
+        Returns:
+            Projection dictionary with `run_id` and `created_at` added, or None
+        """
+        row = self.conn.execute(
+            """
+            SELECT p.data, r.run_id, r.created_at
+            FROM projections p JOIN runs r ON r.run_id = p.run_id
+            WHERE p.playerid = ? AND p.system = ? AND r.created_at <= ?
+              AND (? IS NULL OR p.player_type = ?)
+            ORDER BY r.created_at DESC, r.run_id DESC, p.player_type
+            LIMIT 1
+            """,
+            (
+                playerid,
+                system,
+                (
+                    _normalize_timestamp(timestamp, end_of_day=True)
+                    if timestamp
+                    else _utc_now()
+                ),
+                player_type,
+                player_type and player_type.lower(),
+            ),
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(
+            json.loads(row["data"]), run_id=row["run_id"], created_at=row["created_at"]
+        )
+
+    def time_series(
+        self,
+        playerid: str,
+        system: str,
+        stat: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        player_type: Optional[str] = None,
+    ) -> List[Tuple[str, Any]]:
+        """
+        Values of one projected stat across runs, e.g. a player's steamer HR.
+
+        Args:
+            playerid: Fangraphs player id
+            system: Projection system
+            stat: Projection field name as serialized (e.g. "hr", "era")
+            start: Optional inclusive lower bound on run timestamp or date
+            end: Optional inclusive upper bound on run timestamp; a date
+                includes every run recorded that day
+            player_type: Only the "hitter" or "pitcher" projection; without it
+                a two-way player has one value per record in each run
+
+        Returns:
+            List of (created_at, value) tuples in chronological order
+        """
+        rows = self.conn.execute(
+            """
+            SELECT r.created_at, json_extract(p.data, ?) AS value
+            FROM projections p JOIN runs r ON r.run_id = p.run_id
+            WHERE p.playerid = ? AND p.system = ?
+              AND r.created_at >= ? AND r.created_at <= ?
+              AND (? IS NULL OR p.player_type = ?)
+            ORDER BY r.created_at, r.run_id, p.player_type
+            """,
+            (
+                f"$.{stat}",
+                playerid,
+                system,
+                _normalize_timestamp(start) if start else "",
+                _normalize_timestamp(end, end_of_day=True) if end else "9999",
+                player_type,
+                player_type and player_type.lower(),
+            ),
+        )
+        return [(row["created_at"], row["value"]) for row in rows.fetchall()]
@@ -0,0 +1,178 @@
+import sys
+import tempfile
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    overload,
+)
+
+from pydantic import BaseModel
+
+from fangraphs_api_extractor.models import PlayerModel
+from fangraphs_api_extractor.utils import Logger
+
+from .player_codec import PlayerCodec
+
+
+def _deep_sizeof(obj: Any) -> int:
+    """Approximate bytes held by a model and everything it references"""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, BaseModel):
+        size += _deep_sizeof(obj.__dict__)
+    elif isinstance(obj, dict):
+        size += sum(_deep_sizeof(k) + _deep_sizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_deep_sizeof(item) for item in obj)
+    return size
+
+
+class SpillingPlayerList(Sequence[PlayerModel]):
+    """
+    Player container that keeps its in-memory models under a byte budget.
+
+    Players are appended in memory until their estimated footprint exceeds
+    `memory_budget`; the in-memory batch is then encoded with `PlayerCodec`,
+    appended to an anonymous temporary file and dropped. Iterating yields the
+    spilled batches, each rebuilt into models by the codec one batch at a
+    time, followed by the players still in memory, so serialization and
+    export see a single sequence while at most one batch of models is alive.
+
+    Models yielded from a spilled batch are copies: in-place changes to them are
+    not kept. Use `apply()` to modify every player batch by batch.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int,
+        spill_dir: Optional[str] = None,
+        compression_level: int = 1,
+    ):
+        """
+        Args:
+            memory_budget: Bytes of player models to keep in memory
+            spill_dir: Directory for the spill file (default: system temp dir)
+            compression_level: zlib level of spilled batches
+        """
+        self.logger = Logger("spilling_player_list")
+        self.log = self.logger.logging
+        self.memory_budget = memory_budget
+        self.spill_dir = spill_dir
+        self.compression_level = compression_level
+
+        self._memory: List[PlayerModel] = []
+        self._player_size: Optional[int] = None
+        self._file = tempfile.TemporaryFile(prefix="players-", dir=spill_dir)
+        # (offset, length, count) of every spilled batch
+        self._batches: List[Tuple[int, int, int]] = []
+        self._spilled = 0
+        self.codec = PlayerCodec()
+
+    def close(self) -> None:
+        self._file.close()
+        self._memory = []
+
+    def __enter__(self) -> "SpillingPlayerList":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def spilled(self) -> int:
+        """Number of players currently on disk"""
+        return self._spilled
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._memory)
+
+    def append(self, player: PlayerModel) -> None:
+        self._memory.append(player)
+        if self._player_size is None:
+            self._player_size = _deep_sizeof(player)
+        if len(self._memory) * self._player_size > self.memory_budget:
+            self.spill()
+
+    def extend(self, players: Sequence[PlayerModel]) -> None:
+        for player in players:
+            self.append(player)
+
+    def spill(self) -> None:
+        """Move the in-memory players to the spill file"""
+        if not self._memory:
+            return
+        self._write_batch(self._file, self._memory)
+        self.log.debug(
+            f"Spilled {len(self._memory)} players "
+            f"({self._batches[-1][1]} bytes compressed)"
+        )
+        self._memory = []
+        # Re-estimate the model footprint from the next batch
+        self._player_size = None
+
+    def _write_batch(self, file: Any, players: Sequence[PlayerModel]) -> None:
+        body = self.codec.dumps(players, self.compression_level)
+        file.seek(0, 2)
+        self._batches.append((file.tell(), len(body), len(players)))
+        file.write(body)
+        self._spilled += len(players)
+
+    def _read_batch(
+        self, offset: int, length: int, file: Optional[Any] = None
+    ) -> List[PlayerModel]:
+        file = file or self._file
+        file.seek(offset)
+        return self.codec.loads(file.read(length))
+
+    def batches(self) -> Iterator[List[PlayerModel]]:
+        """Yield the spilled batches, then the in-memory players"""
+        for offset, length, _ in list(self._batches):
+            yield self._read_batch(offset, length)
+        if self._memory:
+            yield list(self._memory)
+
+    def __iter__(self) -> Iterator[PlayerModel]:
+        for batch in self.batches():
+            yield from batch
+
+    @overload
+    def __getitem__(self, index: int) -> PlayerModel: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[PlayerModel]: ...
+
+    def __getitem__(self, index: int | slice) -> PlayerModel | List[PlayerModel]:
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("player index out of range")
+        for offset, length, count in self._batches:
+            if index < count:
+                return self._read_batch(offset, length)[index]
+            index -= count
+        return self._memory[index]
+
+    def apply(self, fn: Callable[[List[PlayerModel]], Any]) -> None:
+        """
+        Call `fn` on every batch of players and keep its in-place changes.
+
+        Spilled batches are loaded one at a time and rewritten to a new spill
+        file, so memory stays bounded by one batch.
+        """
+        batches, self._batches = self._batches, []
+        old_file = self._file
+        self._file = tempfile.TemporaryFile(prefix="players-", dir=self.spill_dir)
+        self._spilled = 0
+        for offset, length, _ in batches:
+            batch = self._read_batch(offset, length, old_file)
+            fn(batch)
+            self._write_batch(self._file, batch)
+        old_file.close()
+        if self._memory:
+            fn(self._memory)
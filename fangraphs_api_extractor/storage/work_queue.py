@@ -0,0 +1,234 @@
+import json
+import sqlite3
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from fangraphs_api_extractor.utils import Logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    lease_owner TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    output TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, lease_expires);
+"""
+
+STATUSES = ["pending", "leased", "done", "failed"]
+
+
+class WorkQueue:
+    """
+    Durable SQLite job queue with leases, for coordinator/worker pulls.
+
+    A coordinator enqueues jobs by key; workers in any number of processes
+    claim one job at a time under a lease. A worker that dies simply lets its
+    lease expire, after which the job can be claimed again, up to
+    `max_attempts` claims; a job whose last lease expires is marked failed.
+    Claims run in an IMMEDIATE transaction so two workers never lease the
+    same job.
+
+    Every process opens its own `WorkQueue` on the same database file. SQLite
+    locking needs a local (or otherwise lock-safe) filesystem; for several
+    hosts, back the same interface with a shared store.
+    """
+
+    def __init__(self, db_path: str, max_attempts: int = 3):
+        self.logger = Logger("work_queue")
+        self.log = self.logger.logging
+        self.db_path = db_path
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "WorkQueue":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def enqueue(self, jobs: Iterable[Tuple[str, Dict[str, Any]]]) -> int:
+        """
+        Add jobs, ignoring keys that are already queued.
+
+        Args:
+            jobs: (key, payload) pairs; payloads must be JSON-serializable
+
+        Returns:
+            Number of newly added jobs
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO jobs (key, payload, updated_at) VALUES (?, ?, ?)",
+                [(key, json.dumps(payload), now) for key, payload in jobs],
+            )
+            added = self.conn.total_changes - before
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.log.info(f"Enqueued {added} new jobs")
+        return added
+
+    def _reap_expired(self, now: float) -> int:
+        """Fail leased jobs whose lease expired on their last attempt"""
+        cursor = self.conn.execute(
+            """
+            UPDATE jobs SET status = 'failed',
+                error = COALESCE(error, 'lease expired'),
+                lease_owner = NULL, lease_expires = NULL, updated_at = ?
+            WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+            """,
+            (now, now, self.max_attempts),
+        )
+        if cursor.rowcount:
+            self.log.warning(
+                f"Marked {cursor.rowcount} jobs failed after their last lease expired"
+            )
+        return cursor.rowcount
+
+    def reap(self) -> int:
+        """
+        Mark jobs failed whose lease expired with no attempts left.
+
+        Returns:
+            Number of jobs marked failed
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            reaped = self._reap_expired(time.time())
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return reaped
+
+    def claim(
+        self, worker_id: str, lease_seconds: float = 300.0
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Lease the next pending job, or one whose lease has expired.
+
+        Jobs whose expired lease was their last attempt are marked failed first.
+
+        Returns:
+            (key, payload) of the leased job, or None if nothing is claimable
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._reap_expired(now)
+            row = self.conn.execute(
+                """
+                SELECT key, payload FROM jobs
+                WHERE (status = 'pending'
+                       OR (status = 'leased' AND lease_expires < ?))
+                  AND attempts < ?
+                ORDER BY attempts, key
+                LIMIT 1
+                """,
+                (now, self.max_attempts),
+            ).fetchone()
+            if row is not None:
+                self.conn.execute(
+                    """
+                    UPDATE jobs SET status = 'leased', lease_owner = ?,
+                        lease_expires = ?, attempts = attempts + 1, updated_at = ?
+                    WHERE key = ?
+                    """,
+                    (worker_id, now + lease_seconds, now, row[0]),
+                )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return (row[0], json.loads(row[1])) if row is not None else None
+
+    def _update_leased(self, key: str, worker_id: str, sql: str, *params) -> bool:
+        """Apply an update only while `worker_id` still holds the job's lease"""
+        cursor = self.conn.execute(
+            sql + " WHERE key = ? AND status = 'leased' AND lease_owner = ?",
+            (*params, key, worker_id),
+        )
+        return cursor.rowcount == 1
+
+    def renew(self, key: str, worker_id: str, lease_seconds: float = 300.0) -> bool:
+        """Extend a held lease; False if it was lost"""
+        return self._update_leased(
+            key,
+            worker_id,
+            "UPDATE jobs SET lease_expires = ?, updated_at = ?",
+            time.time() + lease_seconds,
+            time.time(),
+        )
+
+    def complete(self, key: str, worker_id: str, output: Optional[str] = None) -> bool:
+        """Mark a leased job done; False if the lease was lost"""
+        return self._update_leased(
+            key,
+            worker_id,
+            "UPDATE jobs SET status = 'done', output = ?, lease_owner = NULL, "
+            "lease_expires = NULL, updated_at = ?",
+            output,
+            time.time(),
+        )
+
+    def fail(self, key: str, worker_id: str, error: str) -> bool:
+        """Release a leased job for retry, or mark it failed after max_attempts"""
+        return self._update_leased(
+            key,
+            worker_id,
+            "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN 'failed' "
+            "ELSE 'pending' END, error = ?, lease_owner = NULL, "
+            "lease_expires = NULL, updated_at = ?",
+            self.max_attempts,
+            error,
+            time.time(),
+        )
+
+    def counts(self) -> Dict[str, int]:
+        """Number of jobs per status"""
+        counts = {status: 0 for status in STATUSES}
+        for status, count in self.conn.execute(
+            "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+        ):
+            counts[status] = count
+        return counts
+
+    def jobs(self, status: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Payloads and outputs by key, optionally for one status"""
+        sql = "SELECT key, payload, status, output, error, attempts FROM jobs"
+        rows = (
+            self.conn.execute(sql + " WHERE status = ?", (status,))
+            if status
+            else self.conn.execute(sql)
+        )
+        return {
+            key: {
+                "payload": json.loads(payload),
+                "status": job_status,
+                "output": output,
+                "error": error,
+                "attempts": attempts,
+            }
+            for key, payload, job_status, output, error, attempts in rows
+        }
+
+    def is_drained(self) -> bool:
+        """True once no job is pending or leased, after reaping expired leases"""
+        self.reap()
+        counts = self.counts()
+        return counts["pending"] == 0 and counts["leased"] == 0
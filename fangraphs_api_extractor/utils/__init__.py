@@ -1,21 +1,48 @@
 __all__ = [
     "Logger",
+    "set_console_stream",
+    "RateLimiter",
     "BATTING_POSITIONS",
     "FANGRAPHS_PROJECTIONS_ENDPOINT",
     "PROJECTION_SYSTEMS",
     "USER_AGENT_HEADER",
     "write_json_file",
+    "write_partitioned",
+    "read_partitioned",
     "serialize_players",
+    "iter_serialized_players",
     "normalize_string",
     "get_nested_values",
+    "open_compressed",
+    "read_json_file",
+    "RecordPredicate",
+    "min_stat",
+    "max_stat",
+    "team_in",
+    "position_in",
 ]
 
+from .compression import open_compressed, read_json_file
 from .constants import (
     BATTING_POSITIONS,
     FANGRAPHS_PROJECTIONS_ENDPOINT,
     PROJECTION_SYSTEMS,
     USER_AGENT_HEADER,
 )
-from .logger import Logger
+from .logger import Logger, set_console_stream
+from .partitioned_writer import read_partitioned, write_partitioned
+from .rate_limiter import RateLimiter
+from .record_filters import (
+    RecordPredicate,
+    max_stat,
+    min_stat,
+    position_in,
+    team_in,
+)
 from .string_utils import normalize_string
-from .utils import get_nested_values, serialize_players, write_json_file
+from .utils import (
+    get_nested_values,
+    iter_serialized_players,
+    serialize_players,
+    write_json_file,
+)
@@ -0,0 +1,111 @@
+"""
+Streaming compression helpers for output files and raw response archives.
+
+Writers compress as data is written rather than after, and readers detect
+gzip or zstd from the file's magic bytes, so compressed and plain JSON files
+can be read the same way. zstd needs the optional `zstandard` package
+(`pip install fangraphs-api-extractor[zstd]`).
+"""
+
+import gzip
+import io
+import json
+from typing import IO, Any, Optional, cast
+
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst"}
+
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd compression requires the optional zstandard package: "
+            "pip install fangraphs-api-extractor[zstd]"
+        ) from e
+    return zstandard
+
+
+def compression_for_path(path: str) -> Optional[str]:
+    """Infer the compression from a file name's extension"""
+    for compression, extension in COMPRESSION_EXTENSIONS.items():
+        if path.endswith(extension):
+            return compression
+    return None
+
+
+def with_extension(path: str, compression: Optional[str]) -> str:
+    """Append the compression's extension to a path if it is missing"""
+    if compression is None:
+        return path
+    extension = COMPRESSION_EXTENSIONS[compression]
+    return path if path.endswith(extension) else path + extension
+
+
+def _detect(path: str) -> Optional[str]:
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic.startswith(GZIP_MAGIC):
+        return "gzip"
+    if magic == ZSTD_MAGIC:
+        return "zstd"
+    return None
+
+
+def open_compressed(
+    path: str,
+    mode: str = "rt",
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+) -> IO:
+    """
+    Open a file, compressing on write and decompressing on read.
+
+    Args:
+        path: File path
+        mode: "rt"/"wt" for text or "rb"/"wb" for bytes
+        compression: "gzip", "zstd" or None. When writing, None infers it from
+            the extension; when reading, it is always detected from the content
+        level: Compression level (default: 6 for gzip, 3 for zstd)
+
+    Returns:
+        A file object; closing it finishes the compressed stream
+    """
+    if compression is not None and compression not in COMPRESSION_EXTENSIONS:
+        raise ValueError(f"Unknown compression: {compression}")
+
+    writing = mode[0] in "wa"
+    if writing:
+        compression = compression or compression_for_path(path)
+    else:
+        compression = _detect(path)
+
+    text = "b" not in mode
+    if compression is None:
+        return open(path, mode)
+
+    level = level if level is not None else DEFAULT_LEVELS[compression]
+    if compression == "gzip":
+        if writing:
+            return cast(IO, gzip.open(path, mode, compresslevel=level))
+        return cast(IO, gzip.open(path, mode))
+
+    zstandard = _zstandard()
+    raw = open(path, "wb" if writing else "rb")
+    stream: IO[bytes]
+    if writing:
+        stream = zstandard.ZstdCompressor(level=level).stream_writer(raw)
+    else:
+        stream = zstandard.ZstdDecompressor().stream_reader(raw)
+    return io.TextIOWrapper(stream, encoding="utf-8") if text else stream
+
+
+def read_json_file(path: str) -> Any:
+    """Load a JSON file, transparently decompressing gzip or zstd content"""
+    with open_compressed(path, "rt") as f:
+        return json.load(f)
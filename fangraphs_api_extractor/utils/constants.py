@@ -1,6 +1,14 @@
+FANGRAPHS_URL = "https://www.fangraphs.com"
 BUILD_ID = "JnNS4pK_PHEa_Wk1StnE0"
-FANGRAPHS_CORE_BUILD_ENDPOINT = "https://www.fangraphs.com/_next/data/" + BUILD_ID
-FANGRAPHS_PROJECTIONS_ENDPOINT = FANGRAPHS_CORE_BUILD_ENDPOINT + "/projections.json"
+FANGRAPHS_CORE_BUILD_ENDPOINT = FANGRAPHS_URL + "/_next/data/" + BUILD_ID
+FANGRAPHS_PROJECTIONS_PATH = "/projections.json"
+FANGRAPHS_PROJECTIONS_ENDPOINT = (
+    FANGRAPHS_CORE_BUILD_ENDPOINT + FANGRAPHS_PROJECTIONS_PATH
+)
+
+# Leaderboards (actual season stats) are served by the site API, not the build data
+FANGRAPHS_LEADERBOARDS_PATH = "/api/leaders/major-league/data"
+LEADERBOARD_PAGE_SIZE = 500
 
 # Requests
 USER_AGENT_HEADER = {
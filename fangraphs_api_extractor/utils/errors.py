@@ -8,3 +8,11 @@ class InvalidPositionError(Exception):
 
 class InvalidProjectionsSystemError(Exception):
     pass
+
+
+class RequestCancelledError(Exception):
+    pass
+
+
+class DeadlineExceededError(RequestCancelledError):
+    pass
@@ -1,27 +1,102 @@
+import atexit
 import json
 import logging
+import queue
 import sys
-from typing import MutableMapping
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, MutableMapping, Optional, TextIO
+
+# Background listeners for queue-mode loggers, keyed by logger name
+_listeners: Dict[str, QueueListener] = {}
+
+# Stream console handlers write to, and every handler created so far
+_console_stream: Optional[TextIO] = None
+_console_handlers: List[logging.StreamHandler] = []
+
+
+def set_console_stream(stream: TextIO) -> None:
+    """
+    Send every Logger's console output to `stream` (e.g. sys.stderr).
+
+    Applies to loggers already created and to those created afterwards, so
+    stdout can be kept for data.
+    """
+    global _console_stream
+    _console_stream = stream
+    for handler in _console_handlers:
+        handler.setStream(stream)
+
+
+def _stop_listeners() -> None:
+    """Drain and stop every queue listener; registered to run at exit"""
+    while _listeners:
+        _, listener = _listeners.popitem()
+        listener.stop()
+
+
+atexit.register(_stop_listeners)
+
+
+class _RawQueueHandler(QueueHandler):
+    """Enqueues records unformatted; the listener's handler formats them"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 class Logger(object):
-    def __init__(self, name: str, debug=False):
+    def __init__(self, name: str, debug=False, use_queue=False):
+        """
+        Args:
+            name: Name of the underlying `logging` logger
+            debug: Log at DEBUG instead of INFO
+            use_queue: Enqueue the raw records from the calling thread and format and
+                write them on a single background thread, so worker threads never
+                block on a slow stdout. Arguments are formatted when written, so
+                pass values that will not change. Only applies when the named
+                logger is first created.
+        """
         level = logging.DEBUG if debug else logging.INFO
         self.logging = logging.getLogger(name)
+        self.listener: Optional[QueueListener] = _listeners.get(name)
 
         # if logger already exists don't add handlers
         if len(self.logging.handlers):
             self.logging.handlers[0].setLevel(level)
+            if self.listener is not None:
+                self.listener.handlers[0].setLevel(level)
             return
 
-        handler = logging.StreamHandler(sys.stdout)
+        handler = logging.StreamHandler(_console_stream or sys.stdout)
+        _console_handlers.append(handler)
         formatter = logging.Formatter("%(message)s")
         handler.setFormatter(formatter)
         handler.setLevel(level)
 
-        self.logging.addHandler(handler)
+        if use_queue:
+            records: queue.Queue = queue.Queue(-1)
+            listener = QueueListener(records, handler, respect_handler_level=True)
+            listener.start()
+            _listeners[name] = listener
+            self.listener = listener
+
+            queue_handler = _RawQueueHandler(records)
+            queue_handler.setLevel(level)
+            self.logging.addHandler(queue_handler)
+        else:
+            self.logging.addHandler(handler)
         self.logging.setLevel(level)
 
+    def stop(self) -> None:
+        """Flush pending records and stop the background writer in queue mode"""
+        listener = _listeners.pop(self.logging.name, None)
+        self.listener = None
+        if listener is None:
+            return
+        listener.stop()
+        # Fall back to writing directly so later records are not lost
+        self.logging.handlers = list(listener.handlers)
+
     def log_request(
         self,
         endpoint: str,
@@ -29,6 +104,9 @@ class Logger(object):
         params: dict | None = None,
         headers: dict | MutableMapping[str, str | bytes] | None = None,
     ):
+        # Dumping the response is expensive; skip it unless it will be emitted
+        if not self.logging.isEnabledFor(logging.DEBUG):
+            return
         log = f"ESPN API Request: url: {endpoint} params: {params} headers: {headers} \nESPN API Response: {json.dumps(response)}"
         self.logging.debug(log)
 
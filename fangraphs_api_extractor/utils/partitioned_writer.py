@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .compression import read_json_file
+from .logger import Logger
+from .utils import write_json_file
+
+PARTITION_KEYS = ["player_type", "system", "team", "position"]
+
+MANIFEST_FILE = "manifest.json"
+
+
+def _partition_values(player: Dict[str, Any], key: str) -> List[str]:
+    """Values of one partition key for a serialized player"""
+    if key == "player_type":
+        return [player.get("player_type") or "unknown"]
+    if key == "team":
+        return [player.get("team") or "FA"]
+    if key == "position":
+        if player.get("player_type") == "pitcher":
+            return ["P"]
+        positions = [
+            p.strip() for p in (player.get("min_position") or "").split("/") if p
+        ]
+        return positions or ["unknown"]
+    if key == "system":
+        return list(player.get("projections", {})) or ["none"]
+    raise ValueError(f"Unknown partition key: {key}")
+
+
+def partition_players(
+    players: Iterable[Dict[str, Any]], partition_by: Sequence[str]
+) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    """
+    Group serialized players by the values of the partition keys.
+
+    Players eligible at several positions appear in every position partition,
+    and partitioning by system keeps only that system's projection.
+
+    Args:
+        players: Serialized players (the `serialize_players` format)
+        partition_by: Partition keys, any of PARTITION_KEYS
+
+    Returns:
+        Partition values, in `partition_by` order, to the players in it
+    """
+    for key in partition_by:
+        if key not in PARTITION_KEYS:
+            raise ValueError(f"Unknown partition key: {key}")
+
+    partitions: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for player in players:
+        combinations: List[Tuple[str, ...]] = [()]
+        for key in partition_by:
+            combinations = [
+                combination + (value,)
+                for combination in combinations
+                for value in _partition_values(player, key)
+            ]
+
+        for values in combinations:
+            record = player
+            if "system" in partition_by:
+                system = values[list(partition_by).index("system")]
+                record = {
+                    **player,
+                    "projections": {
+                        s: p
+                        for s, p in player.get("projections", {}).items()
+                        if s == system
+                    },
+                }
+            partitions.setdefault(values, []).append(record)
+    return partitions
+
+
+def _partition_path(partition_by: Sequence[str], values: Tuple[str, ...]) -> str:
+    """Relative path of a partition, e.g. player_type=hitter/system=steamer.json"""
+    parts = [f"{key}={value}" for key, value in zip(partition_by, values)]
+    return os.path.join(*parts[:-1], f"{parts[-1]}.json") if parts else "all.json"
+
+
+def _write_partition(
+    dir_path: str,
+    relative_path: str,
+    records: List[Dict[str, Any]],
+    logger: Logger,
+    compression: Optional[str],
+    level: Optional[int],
+) -> Dict[str, Any]:
+    full_path = write_json_file(
+        records,
+        dir_path,
+        relative_path,
+        logger,
+        indent=None,
+        compression=compression,
+        level=level,
+    )
+    if full_path is None:
+        raise OSError(f"Could not write partition {relative_path}")
+
+    # Size and hash describe the file as written, compressed or not
+    digest = hashlib.sha256()
+    with open(full_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+
+    return {
+        "path": os.path.relpath(full_path, dir_path),
+        "count": len(records),
+        "bytes": os.path.getsize(full_path),
+        "sha256": digest.hexdigest(),
+    }
+
+
+def write_partitioned(
+    data: List[Dict[str, Any]],
+    dir_path: str,
+    logger: Logger,
+    partition_by: Sequence[str] = ("player_type", "system"),
+    max_workers: Optional[int] = None,
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Write serialized players as one file per partition, plus a manifest.
+
+    Files are written concurrently to `<dir_path>/<key>=<value>/.../<key>=<value>.json`.
+    The manifest lists every file with its partition values, record count,
+    byte size and sha256, so consumers can open only the partitions they need.
+
+    Args:
+        data: Serialized players (the `serialize_players` format)
+        dir_path: Output directory
+        logger: Logger for logging messages
+        partition_by: Partition keys, any of player_type, system, team, position
+        max_workers: Concurrent file writes (default: ThreadPoolExecutor's)
+        compression: Optional "gzip" or "zstd" for the partition files, which then
+            get the .gz/.zst extension; the manifest stays plain JSON
+        level: Compression level (default: 6 for gzip, 3 for zstd)
+
+    Returns:
+        The manifest that was written
+    """
+    log = logger.logging
+    partitions = partition_players(data, partition_by)
+    log.debug(f"Writing {len(data)} players into {len(partitions)} partitions")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            values: executor.submit(
+                _write_partition,
+                dir_path,
+                _partition_path(partition_by, values),
+                records,
+                logger,
+                compression,
+                level,
+            )
+            for values, records in sorted(partitions.items())
+        }
+        files = []
+        for values, future in futures.items():
+            entry = future.result()
+            entry["partition"] = dict(zip(partition_by, values))
+            files.append(entry)
+
+    manifest = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "partition_by": list(partition_by),
+        "players": len(data),
+        "files": files,
+    }
+    # The manifest is replaced last, so readers never see it point at
+    # partition files that have not been written yet
+    manifest_path = os.path.join(dir_path, MANIFEST_FILE)
+    with open(f"{manifest_path}.tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    log.info(f"Wrote {len(files)} partition files to {dir_path}")
+    return manifest
+
+
+def read_partitioned(dir_path: str, **partition: str) -> List[Dict[str, Any]]:
+    """
+    Read the players of the partitions matching the given key values.
+
+    Example:
+        read_partitioned("out", system="steamer", team="NYY")
+
+    Args:
+        dir_path: Directory written by `write_partitioned`
+        **partition: Partition key values to match; keys not partitioned on are
+            not allowed
+
+    Returns:
+        Players from every matching partition file
+    """
+    with open(os.path.join(dir_path, MANIFEST_FILE), "r") as f:
+        manifest = json.load(f)
+
+    unknown = set(partition) - set(manifest["partition_by"])
+    if unknown:
+        raise ValueError(f"Output is not partitioned by: {sorted(unknown)}")
+
+    players: List[Dict[str, Any]] = []
+    for entry in manifest["files"]:
+        if all(entry["partition"][k] == v for k, v in partition.items()):
+            players.extend(read_json_file(os.path.join(dir_path, entry["path"])))
+    return players
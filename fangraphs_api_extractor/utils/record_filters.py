@@ -0,0 +1,61 @@
+"""
+Predicates over raw Fangraphs API records (keyed by API field names like
+"PA", "IP", "Team", "minpos"), for filtering before records become models.
+"""
+
+from typing import Any, Callable, Dict, Iterable
+
+RecordPredicate = Callable[[Dict[str, Any]], bool]
+
+
+def _number(record: Dict[str, Any], key: str) -> float | None:
+    value = record.get(key)
+    return value if isinstance(value, (int, float)) else None
+
+
+def min_stat(key: str, minimum: float) -> RecordPredicate:
+    """Keep records whose `key` is at least `minimum`, e.g. min_stat("PA", 300)"""
+
+    def predicate(record: Dict[str, Any]) -> bool:
+        value = _number(record, key)
+        return value is not None and value >= minimum
+
+    return predicate
+
+
+def max_stat(key: str, maximum: float) -> RecordPredicate:
+    """Keep records whose `key` is at most `maximum`, e.g. max_stat("ERA", 4.0)"""
+
+    def predicate(record: Dict[str, Any]) -> bool:
+        value = _number(record, key)
+        return value is not None and value <= maximum
+
+    return predicate
+
+
+def team_in(teams: Iterable[str]) -> RecordPredicate:
+    """Keep records on any of the given teams; free agents are "FA" """
+    wanted = {team.upper() for team in teams}
+
+    def predicate(record: Dict[str, Any]) -> bool:
+        return (record.get("Team") or "FA").upper() in wanted
+
+    return predicate
+
+
+def position_in(positions: Iterable[str]) -> RecordPredicate:
+    """
+    Keep records eligible at any of the given positions.
+
+    Multi-position strings like "SS/2B" match each listed position, and
+    pitcher records (which have no minpos) match "P".
+    """
+    wanted = {position.upper() for position in positions}
+
+    def predicate(record: Dict[str, Any]) -> bool:
+        minpos = record.get("minpos")
+        if not minpos:
+            return "P" in wanted and "IP" in record
+        return any(p.strip().upper() in wanted for p in minpos.split("/"))
+
+    return predicate
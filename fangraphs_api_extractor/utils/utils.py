@@ -1,15 +1,25 @@
 import json
 import os
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sized,
+)
 
 from fangraphs_api_extractor.utils import Logger
+from fangraphs_api_extractor.utils.compression import open_compressed, with_extension
 from fangraphs_api_extractor.utils.string_utils import normalize_string
 
 if TYPE_CHECKING:
     from fangraphs_api_extractor.models import PlayerModel
 
 
-def serialize_players(players: List["PlayerModel"], logger: Logger) -> List[Dict]:
+def serialize_players(players: Iterable["PlayerModel"], logger: Logger) -> List[Dict]:
     """
     Serialize a list of PlayerModel objects into a JSON-serializable dictionary.
 
@@ -20,10 +30,30 @@ def serialize_players(players: List["PlayerModel"], logger: Logger) -> List[Dict
     Returns:
         List of dictionaries representing player data
     """
-    log = logger.logging
-    log.debug(f"Starting serialization of {len(players)} players")
+    player_data_list = list(iter_serialized_players(players, logger))
+    logger.logging.info(f"Completed serialization with {len(player_data_list)} results")
+    return player_data_list
+
+
+def iter_serialized_players(
+    players: Iterable["PlayerModel"], logger: Logger
+) -> Iterator[Dict]:
+    """
+    Serialize players one at a time, in the `serialize_players` format.
 
-    player_data_list = []
+    Lets large (e.g. spilled) player sets be written without holding every
+    serialized player in memory.
+
+    Args:
+        players: PlayerModel objects, any iterable
+        logger: Logger for logging messages
+
+    Yields:
+        Dictionaries representing player data
+    """
+    log = logger.logging
+    total = len(players) if isinstance(players, Sized) else "?"
+    log.debug(f"Starting serialization of {total} players")
 
     for i, player in enumerate(players):
         try:
@@ -47,6 +77,8 @@ def serialize_players(players: List["PlayerModel"], logger: Logger) -> List[Dict
                 "xmlbam_id": getattr(player, "xmlbam_id", -1),
                 "slug": getattr(player, "slug", ""),
                 "stats_api": getattr(player, "stats_api", ""),
+                "player_type": getattr(player, "player_type", None),
+                "min_position": getattr(player, "min_position", None),
                 "projections": {},
             }
 
@@ -72,58 +104,98 @@ def serialize_players(players: List["PlayerModel"], logger: Logger) -> List[Dict
                 except Exception as proj_e:
                     log.error(f"Error processing projections: {proj_e}")
 
-            player_data_list.append(serialized_player)
+            # Add ids from other providers joined by the crosswalk
+            if getattr(player, "external_ids", None):
+                serialized_player["external_ids"] = player.external_ids
+
+            # Add hydrated stats page data
+            if getattr(player, "stats", None) is not None:
+                serialized_player["stats"] = player.stats
+
+            yield serialized_player
 
             if i % 100 == 0:  # Log progress every 100 players
-                log.info(f"Serialized {i + 1}/{len(players)} players")
+                log.info(f"Serialized {i + 1}/{total} players")
 
         except Exception as e:
             log.error(f"Error serializing player {i + 1}: {e}")
 
             # Still add basic info even if there's an error
             name = getattr(player, "name", "unknown")
-            player_data_list.append(
-                {"name": name, "ascii_name": normalize_string(name), "error": str(e)}
-            )
-
-    log.info(f"Completed serialization with {len(player_data_list)} results")
-
-    return player_data_list
+            yield {"name": name, "ascii_name": normalize_string(name), "error": str(e)}
+
+
+def _dump_json_array(items: Iterable[Any], f: Any, indent: Optional[int] = 2) -> int:
+    """Write items as a JSON array one at a time, matching json.dump's layout"""
+    count = 0
+    separator = "\n" if indent is not None else ""
+    pad = " " * (indent or 0)
+    f.write("[")
+    for item in items:
+        text = json.dumps(item, indent=indent)
+        if indent is not None:
+            text = text.replace("\n", "\n" + pad)
+        if count:
+            f.write("," if indent is not None else ", ")
+        f.write(separator + pad + text)
+        count += 1
+    f.write((separator if count else "") + "]")
+    return count
 
 
 def write_json_file(
-    data: List[Dict],
+    data: Iterable[Dict],
     dir_path: str,
     file_name: str,
     logger: Logger,
     indent: Optional[int] = 2,
-) -> None:
+    compression: Optional[str] = None,
+    level: Optional[int] = None,
+) -> Optional[str]:
     """
     Write player data to a JSON file.
 
     Args:
-        data: Data to write (JSON-serializable)
+        data: Data to write (JSON-serializable); any iterable other than a list
+            is streamed into a JSON array item by item
         output_path: Path to output file
         indent: Indentation level for JSON formatting
         logger: Logger for logging messages
+        compression: Optional "gzip" or "zstd"; the data is compressed as it is
+            written and the extension (.gz/.zst) is appended to the file name
+        level: Compression level (default: 6 for gzip, 3 for zstd)
+
+    Returns:
+        Path of the written file, or None if writing failed
     """
     log = logger.logging
-    full_path = os.path.join(dir_path, file_name)
+    full_path = with_extension(os.path.join(dir_path, file_name), compression)
     log.debug(f"Writing data to {full_path}")
-    log.debug(f"Data contains {len(data)} items")
+    if isinstance(data, list):
+        log.debug(f"Data contains {len(data)} items")
 
     # Ensure the directory exists
     os.makedirs(os.path.dirname(os.path.abspath(full_path)), exist_ok=True)
 
+    # Write to a temporary file and rename it into place, so readers
+    # (e.g. the query service) never see a partially written file
+    tmp_path = f"{full_path}.tmp"
     try:
-        # Write the data to the file
-        with open(full_path, "w") as f:
-            json.dump(data, f, indent=indent)
+        with open_compressed(tmp_path, "wt", compression, level) as f:
+            if isinstance(data, list):
+                json.dump(data, f, indent=indent)
+            else:
+                _dump_json_array(data, f, indent)
+        os.replace(tmp_path, full_path)
 
         log.info(f"Data successfully written to {full_path}")
+        return full_path
 
     except Exception as e:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
         log.error(f"Error writing data to {full_path}: {e}")
+        return None
 
 
 def get_nested_values(
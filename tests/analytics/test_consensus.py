@@ -0,0 +1,97 @@
+"""
+Tests for the weighted consensus projection builder.
+"""
+
+import pytest
+
+from fangraphs_api_extractor.analytics import ConsensusBuilder
+from fangraphs_api_extractor.models import PlayerModel
+from tests.conftest import load_fixture
+
+
+@pytest.fixture
+def multi_system_players():
+    """A hitter and a pitcher pulled separately from steamer and atc."""
+    hitter = load_fixture("hitter_steamer.json")
+    pitcher = load_fixture("pitcher_steamer.json")
+    hitter_atc = dict(hitter, AB=hitter["AB"] * 0.9, H=hitter["H"] * 0.8, HR=10)
+    pitcher_atc = dict(pitcher, ER=pitcher["ER"] * 2, IP=pitcher["IP"] / 2)
+    return [
+        PlayerModel.parse_player(hitter, "steamer"),
+        PlayerModel.parse_player(hitter_atc, "atc"),
+        PlayerModel.parse_player(pitcher, "steamer"),
+        PlayerModel.parse_player(pitcher_atc, "atc"),
+    ]
+
+
+def test_counting_stats_are_weighted(multi_system_players):
+    """Counting stats should be weighted means renormalised over present systems."""
+    builder = ConsensusBuilder({"steamer": 3.0, "atc": 1.0, "zips": 2.0})
+    table = builder.build(multi_system_players)["hitters"]
+
+    assert table.playerids == [multi_system_players[0].playerid]
+    steamer = multi_system_players[0].projections["steamer"]
+    atc = multi_system_players[1].projections["atc"]
+
+    hr = table.values[0, table.fields.index("hr")]
+    assert hr == pytest.approx(0.75 * steamer.hr + 0.25 * atc.hr)
+    assert table.system_weights[0].tolist() == [0.75, 0.25, 0.0]
+
+
+def test_rate_stats_are_recomputed(multi_system_players):
+    """AVG and ERA should come from consensus components, not averaged rates."""
+    builder = ConsensusBuilder({"steamer": 1.0, "atc": 1.0})
+    tables = builder.build(multi_system_players)
+
+    hitters = tables["hitters"]
+    row = dict(zip(hitters.fields, hitters.values[0]))
+    assert row["avg"] == pytest.approx(row["h"] / row["ab"])
+
+    pitchers = tables["pitchers"]
+    row = dict(zip(pitchers.fields, pitchers.values[0]))
+    assert row["era"] == pytest.approx(9 * row["earned_runs"] / row["innings_pitched"])
+    assert row["whip"] == pytest.approx(
+        (row["walks"] + row["hits"]) / row["innings_pitched"]
+    )
+
+
+def test_apply_attaches_consensus(multi_system_players):
+    """Every model should receive the consensus projection for its player."""
+    ConsensusBuilder().apply(multi_system_players)
+
+    for player in multi_system_players:
+        assert "consensus" in player.projections
+
+    hitter = multi_system_players[0].projections["consensus"]
+    assert hitter.hr == round(
+        (multi_system_players[0].projections["steamer"].hr + 10) / 2
+    )
+    pitcher = multi_system_players[2].projections["consensus"]
+    assert pitcher.era > multi_system_players[2].projections["steamer"].era
+
+
+def test_single_system_matches_source(sample_players):
+    """A player projected by only one system keeps that system's counting stats."""
+    table = ConsensusBuilder().build(sample_players)["hitters"]
+
+    steamer = sample_players[0].projections["steamer"]
+    assert table.values[0, table.fields.index("pa")] == pytest.approx(steamer.pa)
+    assert table.system_weights[0, table.systems.index("steamer")] == 1.0
+
+
+def test_int_fields_survive_non_uniform_weights():
+    """Blended int fields are rounded and age is taken from the first system."""
+    hitter = load_fixture("hitter_steamer.json")
+    players = [
+        PlayerModel.parse_player(dict(hitter, PA=612.3, Age=27, HR=31), "steamer"),
+        PlayerModel.parse_player(dict(hitter, PA=587.9, Age=28, HR=26), "atc"),
+        PlayerModel.parse_player(dict(hitter, PA=601.7, Age=27, HR=29), "zips"),
+    ]
+
+    ConsensusBuilder({"steamer": 0.5, "atc": 0.3, "zips": 0.2}).apply(players)
+
+    consensus = players[0].projections["consensus"]
+    assert consensus.age == 27
+    assert consensus.hr == round(0.5 * 31 + 0.3 * 26 + 0.2 * 29)
+    assert isinstance(consensus.h, int)
+    assert consensus.pa == pytest.approx(0.5 * 612.3 + 0.3 * 587.9 + 0.2 * 601.7)
@@ -0,0 +1,65 @@
+"""
+Tests for the Monte Carlo projection simulator.
+"""
+
+import numpy as np
+import pytest
+
+from fangraphs_api_extractor.analytics import ProjectionSimulator
+
+
+def test_sampled_outcomes_follow_percentiles(sample_players):
+    """Empirical percentiles of the draws should match the published knots."""
+    simulator = ProjectionSimulator(sample_players)
+    outcomes = simulator.sample_outcomes(20000, np.random.default_rng(7))
+
+    assert outcomes.shape == (20000, len(sample_players))
+    empirical = np.percentile(outcomes, [10, 50, 90], axis=0).T
+    expected = simulator.knots[:, [0, 4, 8]]
+    assert np.allclose(empirical, expected, atol=0.01)
+
+
+def test_simulate_scales_projected_points(sample_players):
+    """Median simulated points should be close to the projected fpts."""
+    result = ProjectionSimulator(sample_players).simulate(20000, seed=3)
+
+    assert result.n_draws == 20000
+    medians = result.percentiles([50])[0]
+    projected = [p.projections["steamer"].fpts for p in sample_players]
+    assert medians == pytest.approx(projected, rel=0.02)
+
+    # Pitchers gain points when their simulated ERA is low
+    pitcher = len(sample_players) - 1
+    assert result.percentiles([90])[0][pitcher] > projected[pitcher]
+
+
+def test_simulate_is_reproducible(sample_players):
+    """The same seed should produce identical draws."""
+    simulator = ProjectionSimulator(sample_players)
+    first = simulator.simulate(100, seed=11).fantasy_points
+    second = simulator.simulate(100, seed=11).fantasy_points
+    assert np.array_equal(first, second)
+
+
+def test_players_without_percentiles_are_deterministic(sample_players):
+    """Missing percentiles should fall back to the projected points."""
+    sample_players[0].projections["steamer"].q30 = None
+    result = ProjectionSimulator(sample_players).simulate(50, seed=1)
+
+    expected = sample_players[0].projections["steamer"].fpts
+    assert np.allclose(result.fantasy_points[:, 0], expected)
+
+
+def test_team_totals(sample_players):
+    """Team totals should sum player columns for each draw."""
+    result = ProjectionSimulator(sample_players).simulate(10, seed=5)
+
+    by_mlb_team = result.team_totals()
+    assert set(by_mlb_team) == {p.team for p in sample_players}
+    total = sum(by_mlb_team.values())
+    assert np.allclose(total, result.fantasy_points.sum(axis=1))
+
+    rosters = {sample_players[0].playerid: "A", sample_players[1].playerid: "A"}
+    by_roster = result.team_totals(rosters)
+    assert list(by_roster) == ["A"]
+    assert np.allclose(by_roster["A"], result.fantasy_points[:, :2].sum(axis=1))
@@ -0,0 +1,102 @@
+"""
+Tests for the league valuation engine.
+"""
+
+import numpy as np
+import pytest
+
+from fangraphs_api_extractor.analytics import (
+    Category,
+    LeagueSettings,
+    ValuationEngine,
+)
+
+
+@pytest.fixture
+def small_league() -> LeagueSettings:
+    """One-team league sized to the fixture players."""
+    return LeagueSettings(
+        teams=1,
+        budget=100.0,
+        hitter_slots={"SS": 1, "OF": 1, "UT": 1},
+        pitcher_slots={"P": 1},
+    )
+
+
+def test_points_basis(sample_players, small_league):
+    """Points should be the dot product of stats and scoring weights."""
+    settings = small_league.model_copy(
+        update={"basis": "points", "hitter_points": {"hr": 4.0, "r": 1.0}}
+    )
+    table = ValuationEngine(sample_players).value(settings).table("hitters", "steamer")
+
+    hitters = [p for p in sample_players if p.min_position]
+    expected = [
+        4 * p.projections["steamer"].hr + p.projections["steamer"].r for p in hitters
+    ]
+    assert table.points == pytest.approx(expected)
+    assert np.array_equal(table.value, table.points)
+
+
+def test_category_scores(sample_players, small_league):
+    """Category scores should favour the better player in every category."""
+    table = (
+        ValuationEngine(sample_players).value(small_league).table("hitters", "steamer")
+    )
+
+    assert table.category_names == ["r", "hr", "rbi", "sb", "avg"]
+    judge = table.playerids.index("15640")
+    merrifield = table.playerids.index("11281")
+    hr = table.category_names.index("hr")
+    assert table.category_scores[judge, hr] > table.category_scores[merrifield, hr]
+    assert table.value[judge] > table.value[merrifield]
+
+
+def test_replacement_and_dollars(sample_players, small_league):
+    """Three hitter slots leave one replacement-level hitter unpaid."""
+    table = (
+        ValuationEngine(sample_players).value(small_league).table("hitters", "steamer")
+    )
+
+    assert np.count_nonzero(table.dollars) == 3
+    assert table.dollars.sum() == pytest.approx(small_league.group_budget("hitters"))
+    assert table.dollars.min() == 0.0
+    assert np.all(table.dollars[table.dollars > 0] >= small_league.min_bid)
+
+
+def test_sgp_denominators(sample_players, small_league):
+    """SGP denominators should replace z-scores for their categories."""
+    settings = small_league.model_copy(update={"sgp_denominators": {"hr": 10.0}})
+    table = ValuationEngine(sample_players).value(settings).table("hitters", "steamer")
+
+    hr = table.category_names.index("hr")
+    judge = table.playerids.index("15640")
+    merrifield = table.playerids.index("11281")
+    gap = table.category_scores[judge, hr] - table.category_scores[merrifield, hr]
+    assert gap == pytest.approx((44 - 2) / 10.0)
+
+
+def test_missing_system_is_unvalued(sample_players, small_league):
+    """Players without a projection in a system get no value or dollars."""
+    table = (
+        ValuationEngine(sample_players).value(small_league).table("pitchers", "zips")
+    )
+
+    assert np.isnan(table.value).all()
+    assert not table.dollars.any()
+
+
+def test_results_are_memoized(sample_players, small_league):
+    """Identical settings should return the cached result."""
+    engine = ValuationEngine(sample_players, cache_size=1)
+    first = engine.value(small_league)
+
+    assert engine.value(small_league.model_copy()) is first
+
+    settings = small_league.model_copy(
+        update={"pitcher_categories": [Category(field="strikeouts")]}
+    )
+    assert settings.config_hash != small_league.config_hash
+    assert engine.value(settings) is not first
+    # The single cache slot now holds the second result
+    assert engine.value(small_league) is not first
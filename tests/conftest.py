@@ -1,4 +1,33 @@
 """
 Configuration and shared fixtures for pytest.
 """
-import pytest
\ No newline at end of file
+import json
+import os
+from typing import Any, Dict, List
+
+import pytest
+
+from fangraphs_api_extractor.models import PlayerModel
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(file_name: str) -> Any:
+    """Load a JSON fixture from the fixtures directory."""
+    with open(os.path.join(FIXTURES_DIR, file_name), "r") as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def projections_response() -> Dict:
+    """Full hitter projections API response."""
+    return load_fixture("hitter_projections.json")
+
+
+@pytest.fixture
+def sample_players() -> List[PlayerModel]:
+    """Parsed hitters from the projections response plus one pitcher."""
+    response = load_fixture("hitter_projections.json")
+    records = response["pageProps"]["dehydratedState"]["queries"][0]["state"]["data"]
+    records.append(load_fixture("pitcher_steamer.json"))
+    return [PlayerModel.parse_player(record) for record in records]
@@ -0,0 +1,3 @@
+__all__ = ["FangraphsStandIn", "ServerConfig"]
+
+from .fangraphs_server import FangraphsStandIn, ServerConfig
@@ -0,0 +1,311 @@
+"""
+Local stand-in for the Fangraphs Next.js data endpoints.
+
+Serves synthetic `projections.json`, player `stats.json` and paginated
+leaderboard payloads shaped like the fixtures in `tests/fixtures`, scaled to
+any number of players, with configurable latency, bandwidth, 429/503
+injection, stalled responses and build id rotation. In replay mode the data and
+leaderboard endpoints serve the responses saved by `CoreFangraphs(archive_dir=...)`
+instead, so real payloads can be replayed under the same fault injection.
+"""
+
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from pydantic import BaseModel
+
+from debug.payloads import (
+    hitter_templates,
+    pitcher_templates,
+    projections_body,
+    scale_records,
+    wrap_response,
+)
+from fangraphs_api_extractor.requests.core_fangraphs import archive_name
+from fangraphs_api_extractor.utils.compression import (
+    COMPRESSION_EXTENSIONS,
+    open_compressed,
+)
+
+DATA_PATH = re.compile(r"^/_next/data/(?P<build_id>[^/]+)(?P<path>/.*)$")
+LEADERBOARDS_PATH = "/api/leaders/major-league/data"
+
+
+class ServerConfig(BaseModel):
+    """Behaviour of the stand-in server"""
+
+    hitters: int = 1500
+    pitchers: int = 1500
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    # Bytes per second per response; 0 disables throttling
+    bandwidth: int = 0
+    error_rate_429: float = 0.0
+    error_rate_503: float = 0.0
+    retry_after: Optional[int] = None
+    build_id: str = "local-build-0"
+    # Rotate the build id after this many data requests; 0 disables rotation
+    rotate_build_id_every: int = 0
+    seed: int = 0
+    # Serve responses archived in this directory; requests without one get a 404
+    replay_dir: Optional[str] = None
+
+
+def _leaderboard_rows(records: List[Dict]) -> List[Dict]:
+    """Reshape projection records the way the leaderboards API reports them"""
+    rows = []
+    for record in records:
+        row = dict(record)
+        team = row.get("Team") or ""
+        row["Team"] = f'<a href="/teams/{team.lower()}">{team}</a>'
+        row["TeamNameAbb"] = team
+        row["playerid"] = int(row["playerid"])
+        row["position"] = row.pop("minpos", None)
+        rows.append(row)
+    return rows
+
+
+class FangraphsStandIn:
+    """
+    Threaded HTTP server imitating Fangraphs, usable as a context manager.
+
+    Example:
+        with FangraphsStandIn(ServerConfig(latency_ms=50)) as server:
+            core = CoreFangraphs(2025, logger, fangraphs_url=server.url,
+                                 build_id=server.build_id)
+    """
+
+    def __init__(self, config: Optional[ServerConfig] = None):
+        self.config = config or ServerConfig()
+        self.random = random.Random(self.config.seed)
+        self.lock = threading.Lock()
+        self.build_id = self.config.build_id
+        self.data_requests = 0
+        self.status_counts: Dict[int, int] = {}
+        self.stalls: List[float] = []
+        self.leaderboard_requests = 0
+        self.leaderboard_inflight = 0
+        self.max_leaderboard_inflight = 0
+
+        self.bodies = projections_body(self.config.hitters, self.config.pitchers)
+        self.leaderboards = {
+            "bat": _leaderboard_rows(
+                scale_records(hitter_templates(), self.config.hitters, 100000)
+            ),
+            "pit": _leaderboard_rows(
+                scale_records(pitcher_templates(), self.config.pitchers, 500000)
+            ),
+        }
+        self.stats_body = json.dumps(
+            wrap_response([{"Season": 2024, "G": 150, "HR": 30, "WAR": 4.5}])
+        ).encode()
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> "FangraphsStandIn":
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FangraphsStandIn":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def stall(self, count: int, seconds: float) -> None:
+        """Hold the next `count` responses for `seconds` each"""
+        with self.lock:
+            self.stalls.extend([seconds] * count)
+
+    def _next_stall(self) -> float:
+        with self.lock:
+            return self.stalls.pop(0) if self.stalls else 0.0
+
+    def reset_counts(self) -> None:
+        with self.lock:
+            self.data_requests = 0
+            self.status_counts = {}
+
+    def _leaderboard_page(self, query: Dict[str, List[str]]) -> bytes:
+        group = query.get("stats", ["bat"])[0]
+        rows = self.leaderboards["pit" if group in ("pit", "sta", "rel") else "bat"]
+        season = int(query.get("season", ["2024"])[0])
+        size = int(query.get("pageitems", ["30"])[0])
+        page = int(query.get("pagenum", ["1"])[0])
+        data = [
+            dict(row, Season=season) for row in rows[(page - 1) * size : page * size]
+        ]
+        return json.dumps({"data": data, "totalCount": len(rows)}).encode()
+
+    def _replay(self, path: str, query: Dict[str, List[str]]) -> Optional[bytes]:
+        """Saved response body for a request, or None if none was archived"""
+        assert self.config.replay_dir is not None
+        params = {key: values[0] for key, values in query.items()}
+        # Stats page queries are part of the archived path, not its params
+        for name in (archive_name(path, params), archive_name(path)):
+            for extension in ("", *COMPRESSION_EXTENSIONS.values()):
+                file_path = os.path.join(
+                    self.config.replay_dir, f"{name}.json{extension}"
+                )
+                if os.path.exists(file_path):
+                    with open_compressed(file_path, "rb") as f:
+                        return f.read()
+        return None
+
+    def _count(self, status: int) -> None:
+        with self.lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def _next_data_request(self) -> str:
+        """Count a data request and rotate the build id when due"""
+        with self.lock:
+            self.data_requests += 1
+            every = self.config.rotate_build_id_every
+            if every and self.data_requests % every == 0:
+                generation = self.data_requests // every
+                self.build_id = f"{self.config.build_id}-{generation}"
+            return self.build_id
+
+    def _injected_error(self) -> Optional[int]:
+        roll = self.random.random()
+        if roll < self.config.error_rate_429:
+            return 429
+        if roll < self.config.error_rate_429 + self.config.error_rate_503:
+            return 503
+        return None
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, body: bytes, content_type: str) -> None:
+                server._count(status)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                if status == 429 and server.config.retry_after is not None:
+                    self.send_header("Retry-After", str(server.config.retry_after))
+                try:
+                    self.end_headers()
+                    self._write_throttled(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up on the response (timed out or hedged)
+                    self.close_connection = True
+
+            def _write_throttled(self, body: bytes) -> None:
+                bandwidth = server.config.bandwidth
+                if not bandwidth:
+                    self.wfile.write(body)
+                    return
+                chunk = max(1024, bandwidth // 20)
+                for start in range(0, len(body), chunk):
+                    self.wfile.write(body[start : start + chunk])
+                    time.sleep(len(body[start : start + chunk]) / bandwidth)
+
+            def _delay(self) -> None:
+                config = server.config
+                delay = config.latency_ms + server.random.uniform(
+                    0, config.latency_jitter_ms
+                )
+                delay += server._next_stall() * 1000
+                if delay > 0:
+                    time.sleep(delay / 1000)
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                if parsed.path == LEADERBOARDS_PATH:
+                    self._leaderboards(parse_qs(parsed.query))
+                    return
+                self._delay()
+
+                if parsed.path == "/projections":
+                    page = (
+                        '<html><script id="__NEXT_DATA__" type="application/json">'
+                        + json.dumps({"buildId": server.build_id})
+                        + "</script></html>"
+                    )
+                    self._send(200, page.encode(), "text/html")
+                    return
+
+                match = DATA_PATH.match(parsed.path)
+                if match is None:
+                    self._send(404, b"{}", "application/json")
+                    return
+
+                current_build_id = server._next_data_request()
+                if match.group("build_id") != current_build_id:
+                    self._send(404, b'{"notFound": true}', "application/json")
+                    return
+
+                error = server._injected_error()
+                if error is not None:
+                    self._send(error, b"{}", "application/json")
+                    return
+
+                path = match.group("path")
+                if server.config.replay_dir:
+                    body = server._replay(path, parse_qs(parsed.query))
+                    if body is None:
+                        self._send(404, b"{}", "application/json")
+                    else:
+                        self._send(200, body, "application/json")
+                elif path == "/projections.json":
+                    group = parse_qs(parsed.query).get("stats", ["bat"])[0]
+                    body = server.bodies[
+                        "pit" if group in ("pit", "sta", "rel") else "bat"
+                    ]
+                    self._send(200, body, "application/json")
+                elif path.endswith("/stats.json"):
+                    self._send(200, server.stats_body, "application/json")
+                else:
+                    self._send(404, b"{}", "application/json")
+
+            def _leaderboards(self, query: Dict[str, List[str]]) -> None:
+                with server.lock:
+                    server.leaderboard_requests += 1
+                    server.leaderboard_inflight += 1
+                    server.max_leaderboard_inflight = max(
+                        server.max_leaderboard_inflight, server.leaderboard_inflight
+                    )
+                try:
+                    self._delay()
+                    error = server._injected_error()
+                    if error is not None:
+                        self._send(error, b"{}", "application/json")
+                        return
+                    if server.config.replay_dir:
+                        replayed = server._replay(LEADERBOARDS_PATH, query)
+                    else:
+                        replayed = server._leaderboard_page(query)
+                finally:
+                    with server.lock:
+                        server.leaderboard_inflight -= 1
+                if replayed is None:
+                    self._send(404, b"{}", "application/json")
+                else:
+                    self._send(200, replayed, "application/json")
+
+        return Handler
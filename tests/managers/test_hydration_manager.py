@@ -0,0 +1,92 @@
+"""
+Tests for concurrent player stats hydration.
+"""
+
+import threading
+
+import pytest
+
+from fangraphs_api_extractor.managers import HydrationManager
+from fangraphs_api_extractor.utils import Logger, serialize_players
+
+
+class FakeCore:
+    """Stands in for CoreFangraphs, serving stats pages from memory."""
+
+    max_workers = 4
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def get_player_stats_data(self, stats_api):
+        with self.lock:
+            self.requested.append(stats_api)
+        if any(playerid in stats_api for playerid in self.failing):
+            return None
+        data = [{"Season": 2024, "path": stats_api}]
+        return {
+            "pageProps": {"dehydratedState": {"queries": [{"state": {"data": data}}]}}
+        }
+
+
+def test_hydrate_attaches_stats(sample_players):
+    """Every player should receive the data from its stats page."""
+    core = FakeCore()
+    failed = HydrationManager(core).hydrate(sample_players)
+
+    assert failed == []
+    assert len(core.requested) == len(sample_players)
+    for player in sample_players:
+        assert player.stats == [{"Season": 2024, "path": player.stats_api}]
+
+    serialized = serialize_players(sample_players, Logger("test"))
+    assert serialized[0]["stats"] == sample_players[0].stats
+
+
+def test_hydrate_resumes_from_state(sample_players, tmp_path):
+    """A rerun should only fetch the players that previously failed."""
+    state_path = str(tmp_path / "hydration.jsonl")
+    judge = "15640"
+
+    failed = HydrationManager(FakeCore(failing=[judge]), state_path).hydrate(
+        sample_players
+    )
+    assert [p.playerid for p in failed] == [judge]
+
+    for player in sample_players:
+        player.stats = None
+    core = FakeCore()
+    failed = HydrationManager(core, state_path).hydrate(sample_players)
+
+    assert failed == []
+    assert len(core.requested) == 1
+    assert judge in core.requested[0]
+    assert all(player.stats is not None for player in sample_players)
+
+
+def test_two_way_players_hydrate_both_pages(sample_players, tmp_path):
+    """A hitter and a pitcher sharing a playerid each get their own stats page."""
+    state_path = str(tmp_path / "hydration.jsonl")
+    hitter = sample_players[0]
+    pitcher = sample_players[-1].model_copy(update={"playerid": hitter.playerid})
+
+    core = FakeCore()
+    HydrationManager(core, state_path).hydrate([hitter, pitcher])
+
+    assert len(core.requested) == 2
+    assert hitter.stats[0]["path"] == hitter.stats_api
+    assert pitcher.stats[0]["path"] == pitcher.stats_api
+
+    # Both halves are restored from the state file without refetching
+    hitter.stats = pitcher.stats = None
+    core = FakeCore()
+    HydrationManager(core, state_path).hydrate([hitter, pitcher])
+    assert core.requested == []
+    assert pitcher.stats[0]["path"] == pitcher.stats_api
+
+
+def test_parse_stats_falls_back_to_page_props():
+    """Unexpected page shapes keep the whole pageProps payload."""
+    assert HydrationManager.parse_stats({"pageProps": {"x": 1}}) == {"x": 1}
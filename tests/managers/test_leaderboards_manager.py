@@ -0,0 +1,78 @@
+"""
+Tests for paginated leaderboard pulls.
+"""
+
+from fangraphs_api_extractor.managers import LeaderboardsManager
+from fangraphs_api_extractor.managers.leaderboards_manager import LEADERBOARD_SOURCE
+from fangraphs_api_extractor.models import HitterModel, PitcherModel
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.utils import Logger
+from tests.harness import FangraphsStandIn, ServerConfig
+
+
+def test_multi_season_pages_are_fetched_concurrently():
+    """Every page of every season should be pulled, in parallel, in order."""
+    config = ServerConfig(hitters=1050, pitchers=300, latency_ms=30)
+    with FangraphsStandIn(config) as server:
+        core = CoreFangraphs(
+            year=2025,
+            logger=Logger("test-leaderboards"),
+            fangraphs_url=server.url,
+            build_id=server.build_id,
+        )
+        manager = LeaderboardsManager(core, max_workers=8, page_size=200)
+        hitters = manager.pull("bat", [2023, 2024])
+
+        # 6 pages per season, with later pages queued once page 1 is known
+        assert server.leaderboard_requests == 12
+        assert server.max_leaderboard_inflight > 2
+        assert manager.failed_pages == []
+
+        pitchers = manager.pull("pit", [2024])
+
+    for season, players in hitters.items():
+        assert [p.playerid for p in players] == [str(i) for i in range(100000, 101050)]
+        assert all(isinstance(p, HitterModel) for p in players)
+        stats = players[0].projections[LEADERBOARD_SOURCE]
+        assert stats.season == str(season)
+        assert players[0].team == server.leaderboards["bat"][0]["TeamNameAbb"]
+
+    assert len(pitchers[2024]) == 300
+    assert isinstance(pitchers[2024][0], PitcherModel)
+
+
+class UncountedCore:
+    """Serves leaderboard pages without a total count."""
+
+    max_workers = 4
+
+    def __init__(self, rows, failing_page=None):
+        self.rows = rows
+        self.failing_page = failing_page
+        self.requested = []
+
+    def get_leaderboard_page(self, position_group, season, page, page_size):
+        self.requested.append((season, page))
+        if page == self.failing_page:
+            return None
+        start = (page - 1) * page_size
+        return {"data": self.rows[start : start + page_size]}
+
+
+def test_pages_continue_while_full_without_total_count(projections_response):
+    """Without totalCount, paging stops at the first short page or a failure."""
+    rows = projections_response["pageProps"]["dehydratedState"]["queries"][0]["state"][
+        "data"
+    ]
+    rows = [dict(rows[i % len(rows)], playerid=i, Season=2024) for i in range(25)]
+
+    core = UncountedCore(rows)
+    players = LeaderboardsManager(core, page_size=10, fields=["hr"]).pull("bat", [2024])
+    assert core.requested == [(2024, 1), (2024, 2), (2024, 3)]
+    assert [p.playerid for p in players[2024]] == [str(i) for i in range(25)]
+    assert set(players[2024][0].projections[LEADERBOARD_SOURCE].model_dump()) == {"hr"}
+
+    manager = LeaderboardsManager(UncountedCore(rows, failing_page=2), page_size=10)
+    players = manager.pull("bat", [2024])
+    assert len(players[2024]) == 10
+    assert manager.failed_pages == [(2024, 2)]
@@ -9,7 +9,12 @@ from typing import Dict
 import pytest
 
 from fangraphs_api_extractor.managers import PlayersManager
-from fangraphs_api_extractor.models import HitterModel, HitterSteamerProjectionModel
+from fangraphs_api_extractor.models import (
+    HitterModel,
+    HitterSteamerProjectionModel,
+    PlayerModel,
+)
+from fangraphs_api_extractor.utils import min_stat, position_in
 
 
 @pytest.fixture
@@ -65,3 +70,101 @@ def test_parse_players(hitter_projections_data):
     if first_player.upurl:
         assert "stats.json" in first_player.stats_api
         assert first_player.stats_api != first_player.upurl  # Should be transformed
+
+
+def test_parse_players_with_fields(hitter_projections_data):
+    """Only the requested projection fields are validated and serialized."""
+    full = PlayersManager("test").parse_players(hitter_projections_data)
+    slim = PlayersManager("test").parse_players(
+        hitter_projections_data, fields=["hr", "h", "avg", "not_a_stat"]
+    )
+
+    assert [p.playerid for p in slim] == [p.playerid for p in full]
+    for full_player, slim_player in zip(full, slim):
+        full_proj = full_player.projections["steamer"]
+        slim_proj = slim_player.projections["steamer"]
+        assert set(slim_proj.model_dump()) == {"hr", "h", "avg"}
+        assert slim_proj.hr == full_proj.hr
+        assert slim_proj.avg == full_proj.avg
+        # Field validators still apply to the selected fields
+        assert isinstance(slim_proj.h, int)
+        assert slim_player.name == full_player.name
+
+
+def test_msgspec_backend_matches_pydantic(hitter_projections_data):
+    """Decoding response bytes with msgspec yields the same player models."""
+    pytest.importorskip("msgspec")
+    content = json.dumps(hitter_projections_data).encode()
+
+    expected = PlayersManager("hitters").parse_players(hitter_projections_data)
+    manager = PlayersManager("hitters", backend="msgspec")
+    players = manager.parse_players(content)
+
+    assert [p.model_dump() for p in players] == [p.model_dump() for p in expected]
+    assert all(isinstance(p, HitterModel) for p in players)
+
+    records = manager.parse_records(content)
+    assert records[0].name == "Bobby Witt Jr."
+
+    slim = PlayersManager("hitters", backend="msgspec").parse_players(
+        content, fields=["hr"]
+    )
+    assert set(slim[0].projections["steamer"].model_dump()) == {"hr"}
+
+
+def test_msgspec_backend_keeps_nulls_and_system_fields(hitter_projections_data):
+    """Explicit nulls and system-specific stats should survive struct decoding."""
+    pytest.importorskip("msgspec")
+    data = json.loads(json.dumps(hitter_projections_data))
+    records = data["pageProps"]["dehydratedState"]["queries"][0]["state"]["data"]
+    records[0]["ra_talent_sd"] = 1.5
+    records[1]["RBI"] = None
+    records[2]["Team"] = None
+    content = json.dumps(data).encode()
+
+    expected = PlayersManager("hitters").parse_players(content)
+    players = PlayersManager("hitters", backend="msgspec").parse_players(content)
+
+    assert len(players) == len(records)
+    assert [p.model_dump() for p in players] == [p.model_dump() for p in expected]
+    assert players[0].projections["steamer"].ra_talent_sd == 1.5
+    assert players[1].projections["steamer"].rbi is None
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        PlayersManager("hitters", backend="orjson")
+
+
+def test_parse_players_where_and_limit(hitter_projections_data, monkeypatch):
+    """Rejected records and records past the limit are never validated."""
+    validated = []
+    parse_player = PlayerModel.parse_player.__func__
+
+    def counting_parse_player(cls, data, *args, **kwargs):
+        validated.append(data["playerid"])
+        return parse_player(cls, data, *args, **kwargs)
+
+    monkeypatch.setattr(PlayerModel, "parse_player", classmethod(counting_parse_player))
+
+    outfielders = PlayersManager("hitters").parse_players(
+        hitter_projections_data, where=[position_in(["OF"])]
+    )
+    assert {p.playerid for p in outfielders} == {"15640", "11281", "23697"}
+    assert sorted(validated) == sorted(p.playerid for p in outfielders)
+
+    validated.clear()
+    first = PlayersManager("hitters").parse_players(hitter_projections_data, limit=2)
+    assert len(first) == 2 and validated == [p.playerid for p in first]
+    with pytest.raises(ValueError):
+        PlayersManager("hitters").parse_players(hitter_projections_data, limit=0)
+
+    # An impossible threshold leaves nothing to parse
+    validated.clear()
+    assert (
+        PlayersManager("hitters").parse_players(
+            hitter_projections_data, where=[min_stat("PA", 10_000)]
+        )
+        == []
+    )
+    assert validated == []
@@ -0,0 +1,68 @@
+"""
+Tests for deriving position and role splits locally.
+"""
+
+from fangraphs_api_extractor.managers import SplitsManager
+from fangraphs_api_extractor.models import PlayerModel
+from fangraphs_api_extractor.storage import SpillingPlayerList
+from tests.conftest import load_fixture
+
+
+def _names(players):
+    return sorted(p.name for p in players)
+
+
+def test_position_splits(sample_players):
+    """Multi-position players should appear under every listed position."""
+    splits = SplitsManager(sample_players)
+
+    assert len(splits.get_players("bat")) == 4
+    assert _names(splits.get_players("bat", "ss")) == ["Bobby Witt Jr."]
+    assert _names(splits.get_players("bat", "2b")) == ["Whit Merrifield"]
+    assert _names(splits.get_players("bat", "of")) == [
+        "Aaron Judge",
+        "Julio Rodríguez",
+        "Whit Merrifield",
+    ]
+    # Individual outfield positions fall back to OF eligibility
+    assert splits.get_players("bat", "cf") == splits.get_players("bat", "of")
+    assert splits.get_players("bat", "c") == []
+
+
+def test_role_splits(sample_players):
+    """Pitchers should be partitioned into starters and relievers by GS/G."""
+    reliever = load_fixture("pitcher_steamer.json")
+    reliever.update({"playerid": "1", "PlayerName": "Closer", "GS": 0, "G": 65})
+    players = sample_players + [PlayerModel.parse_player(reliever)]
+    splits = SplitsManager(players)
+
+    assert _names(splits.get_players("pit")) == ["Closer", "Paul Skenes"]
+    assert _names(splits.get_players("sta")) == ["Paul Skenes"]
+    assert _names(splits.get_players("rel")) == ["Closer"]
+
+
+def test_invalid_splits(sample_players):
+    """Invalid groups and positions should mirror get_projections_data."""
+    splits = SplitsManager(sample_players)
+
+    assert splits.get_players("fielders") is None
+    assert splits.get_players("bat", "p") is None
+    assert splits.get_players("pit", "ss") is None
+
+
+def test_streamed_splits_match_indexed_splits(sample_players, tmp_path):
+    """iter_split should serve the same players from a spilled stream."""
+    reliever = load_fixture("pitcher_steamer.json")
+    reliever.update({"playerid": "1", "PlayerName": "Closer", "GS": 0, "G": 65})
+    players = sample_players + [PlayerModel.parse_player(reliever)]
+    indexed = SplitsManager(players)
+    streaming = SplitsManager()
+
+    with SpillingPlayerList(memory_budget=1, spill_dir=str(tmp_path)) as spill:
+        spill.extend(players)
+        assert spill.spilled == len(players)
+        for split in ["all", "ss", "cf", "c", "sta", "rel"]:
+            streamed = streaming.iter_split(spill, split)
+            assert _names(streamed) == _names(indexed.get_split(split))
+
+    assert streaming.iter_split(players, "p") is None
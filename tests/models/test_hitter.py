@@ -8,6 +8,7 @@ import os
 import pytest
 
 from fangraphs_api_extractor.models import (
+    BaseProjectionModel,
     HitterModel,
     HitterSteamerProjectionModel,
     PlayerModel,
@@ -58,3 +59,16 @@ def test_hitter_basic_parsing(hitter_steamer_data):
     # Check that percentiles were captured
     assert proj.q50 == 0.357
     assert proj.tt_q50 == 0.357
+
+
+def test_slim_projection_model_dump_round_trip(hitter_steamer_data):
+    """A player parsed with fields= should dump, and reload, its selected stats."""
+    player = PlayerModel.parse_player(hitter_steamer_data, fields=["hr", "avg", "q50"])
+    proj = player.projections["steamer"]
+    assert isinstance(proj, BaseProjectionModel)
+
+    dumped = player.model_dump()
+    assert dumped["projections"]["steamer"] == {"hr": 25, "avg": 0.264213, "q50": 0.357}
+
+    reloaded = type(proj).model_validate(dumped["projections"]["steamer"])
+    assert reloaded == proj
@@ -0,0 +1,75 @@
+"""
+Tests for lazily validated player proxies.
+"""
+
+from fangraphs_api_extractor.analytics import (
+    ConsensusBuilder,
+    ProjectionSimulator,
+    ValuationEngine,
+)
+from fangraphs_api_extractor.managers import PlayersManager, SplitsManager
+from fangraphs_api_extractor.models import HitterModel, LazyPlayer, PitcherModel
+from fangraphs_api_extractor.utils import Logger, serialize_players
+from tests.conftest import load_fixture
+
+
+def test_lazy_player_validates_on_first_access(projections_response):
+    """Nothing should be validated until an attribute is read."""
+    players = PlayersManager("hitters", lazy=True).parse_players(projections_response)
+
+    assert all(isinstance(player, LazyPlayer) for player in players)
+    assert not any(player.is_loaded for player in players)
+
+    judge = next(p for p in players if p.record["playerid"] == "15640")
+    assert not judge.is_loaded
+    assert judge.name == "Aaron Judge"
+    assert judge.is_loaded
+    assert judge.player_type == "hitter"
+    assert judge.projections["steamer"].hr > 0
+
+    # Validated models are cached
+    assert judge.materialize() is judge.materialize()
+    assert isinstance(judge.materialize(), HitterModel)
+
+
+def test_lazy_players_serialize_like_eager_players(projections_response):
+    """Proxies should be interchangeable with models for serialization."""
+    logger = Logger("test-lazy-player")
+    records = projections_response["pageProps"]["dehydratedState"]["queries"][0][
+        "state"
+    ]["data"] + [load_fixture("pitcher_steamer.json")]
+
+    eager = PlayersManager("hitters").parse_players(records, fields=["hr", "era"])
+    lazy = PlayersManager("hitters", lazy=True).parse_players(
+        records, fields=["hr", "era"]
+    )
+
+    lazy[0].external_ids = {"espn": "1"}
+    eager[0].external_ids = {"espn": "1"}
+    assert serialize_players(lazy, logger) == serialize_players(eager, logger)
+
+
+def test_lazy_players_pass_model_type_checks(projections_response):
+    """Splits and analytics should see lazy players as hitters and pitchers."""
+    records = projections_response["pageProps"]["dehydratedState"]["queries"][0][
+        "state"
+    ]["data"] + [load_fixture("pitcher_steamer.json")]
+    eager = PlayersManager("players").parse_players(records)
+    lazy = PlayersManager("players", lazy=True).parse_players(records)
+
+    assert isinstance(lazy[0], HitterModel) and isinstance(lazy[-1], PitcherModel)
+    assert not any(player.is_loaded for player in lazy)
+
+    def splits(players):
+        manager = SplitsManager(players)
+        return [p.playerid for p in manager.get_split("of") + manager.get_split("sta")]
+
+    assert splits(lazy) == splits(eager)
+    assert {k: len(v) for k, v in ValuationEngine(lazy).groups.items()} == {
+        "hitters": len(eager) - 1,
+        "pitchers": 1,
+    }
+    assert set(ConsensusBuilder().build(lazy)) == set(ConsensusBuilder().build(eager))
+    assert ProjectionSimulator(lazy).lower_is_better.tolist() == (
+        ProjectionSimulator(eager).lower_is_better.tolist()
+    )
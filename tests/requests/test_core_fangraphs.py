@@ -0,0 +1,215 @@
+"""
+Tests for the Fangraphs API client.
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fangraphs_api_extractor.managers import PlayersManager
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.utils import Logger, read_json_file
+from tests.harness import FangraphsStandIn, ServerConfig
+
+
+@pytest.fixture
+def client() -> CoreFangraphs:
+    return CoreFangraphs(year=2025, logger=Logger("test-core-fangraphs"))
+
+
+def test_invalid_arguments_return_none(client):
+    """Invalid groups, positions and systems should not hit the API."""
+    assert client.get_projections_data("fielders") is None
+    assert client.get_projections_data("pit", position="ss") is None
+    assert client.get_projections_data("bat", projections_system="pecota") is None
+
+
+def test_identical_requests_are_coalesced(client, monkeypatch):
+    """Concurrent identical requests should share a single fetch."""
+    release = threading.Event()
+    calls = []
+
+    def slow_get(params=None, headers=None, extend=""):
+        calls.append(params)
+        release.wait(timeout=5)
+        return {"params": dict(params)}
+
+    monkeypatch.setattr(client, "_get", slow_get)
+
+    with ThreadPoolExecutor(max_workers=9) as executor:
+        futures = [
+            executor.submit(client.get_projections_data, "bat") for _ in range(8)
+        ]
+        other = executor.submit(client.get_projections_data, "pit")
+        # Give every caller time to either start or join a fetch
+        while len(calls) < 2:
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.1)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert len(calls) == 2
+    assert all(result is results[0] for result in results)
+    assert results[0]["params"]["stats"] == "bat"
+    assert other.result()["params"]["stats"] == "pit"
+    assert client._inflight == {}
+
+
+def test_failed_fetch_is_shared_and_not_cached(client, monkeypatch):
+    """A failed fetch returns None to every waiter and is retried afterwards."""
+
+    def failing_get(params=None, headers=None, extend=""):
+        raise ConnectionError("boom")
+
+    monkeypatch.setattr(client, "_get", failing_get)
+    assert client.get_projections_data("bat") is None
+
+    monkeypatch.setattr(client, "_get", lambda params=None, **kwargs: {"ok": True})
+    assert client.get_projections_data("bat") == {"ok": True}
+
+
+def _standin_client(server, **kwargs) -> CoreFangraphs:
+    return CoreFangraphs(
+        year=2025,
+        logger=Logger("test-core-fangraphs"),
+        fangraphs_url=server.url,
+        build_id=server.build_id,
+        backoff_factor=0.01,
+        **kwargs,
+    )
+
+
+def test_fetch_from_standin_server():
+    """Projections and stats pages should round-trip over HTTP."""
+    with FangraphsStandIn(ServerConfig(hitters=10, pitchers=5)) as server:
+        client = _standin_client(server)
+        hitters = client.get_projections_data("bat")
+        pitchers = client.get_projections_data("pit")
+        stats = client.get_player_stats_data("/players/x/1/stats.json?position=OF")
+
+    assert len(PlayersManager("hitters").parse_players(hitters)) == 10
+    assert len(PlayersManager("pitchers").parse_players(pitchers)) == 5
+    assert stats is not None and "pageProps" in stats
+
+
+def test_rate_limited_requests_are_retried():
+    """429 and 503 responses should be retried until they succeed."""
+    config = ServerConfig(hitters=2, pitchers=2, error_rate_429=0.3, error_rate_503=0.3)
+    with FangraphsStandIn(config) as server:
+        client = _standin_client(server, max_retries=10)
+        for position in ["all", "c", "1b", "2b", "ss"]:
+            assert client.get_projections_data("bat", position=position) is not None
+
+    assert server.status_counts[200] == 5
+    assert server.status_counts.get(429, 0) + server.status_counts.get(503, 0) > 0
+
+
+def test_build_id_rotation_is_followed():
+    """A changed build id should be re-discovered after a 404."""
+    config = ServerConfig(hitters=2, pitchers=2, rotate_build_id_every=2)
+    with FangraphsStandIn(config) as server:
+        client = _standin_client(server)
+        for position in ["all", "c", "1b", "2b"]:
+            assert client.get_projections_data("bat", position=position) is not None
+        assert client.build_id == server.build_id != "local-build-0"
+
+
+def test_raw_responses_are_archived_compressed(tmp_path):
+    """Archived response bodies should be gzip files that read back as the response."""
+    with FangraphsStandIn(ServerConfig(hitters=3, pitchers=1)) as server:
+        client = _standin_client(server, archive_dir=str(tmp_path))
+        hitters = client.get_projections_data("bat")
+
+    archived = os.listdir(tmp_path)
+    assert len(archived) == 1 and archived[0].endswith(".json.gz")
+    assert read_json_file(os.path.join(tmp_path, archived[0])) == hitters
+
+
+def test_replay_serves_archived_responses(tmp_path):
+    """A replaying stand-in should serve back exactly what was archived."""
+    with FangraphsStandIn(ServerConfig(hitters=3, pitchers=1)) as server:
+        client = _standin_client(server, archive_dir=str(tmp_path))
+        hitters = client.get_projections_data("bat")
+        stats = client.get_player_stats_data("/players/a/100000/stats.json?position=OF")
+
+    config = ServerConfig(replay_dir=str(tmp_path), latency_ms=5)
+    with FangraphsStandIn(config) as server:
+        client = _standin_client(server)
+        assert client.get_projections_data("bat") == hitters
+        assert (
+            client.get_player_stats_data("/players/a/100000/stats.json?position=OF")
+            == stats
+        )
+        # Nothing was archived for pitchers
+        assert not client.get_projections_data("pit")
+        assert server.status_counts[404] >= 1
+
+
+def test_projections_content_is_raw_bytes():
+    """The undecoded body should be the same response as the decoded data."""
+    with FangraphsStandIn(ServerConfig(hitters=3, pitchers=1)) as server:
+        client = _standin_client(server)
+        content = client.get_projections_content("bat")
+        data = client.get_projections_data("bat")
+
+    assert isinstance(content, bytes)
+    assert json.loads(content) == data
+
+
+def test_timed_out_request_is_retried():
+    """A stalled response should time out and be sent again after a backoff."""
+    with FangraphsStandIn(ServerConfig(hitters=2, pitchers=1)) as server:
+        client = _standin_client(server, timeout=0.3)
+        delays = []
+        backoff = client._backoff
+        client._backoff = lambda seconds: (delays.append(seconds), backoff(seconds))
+        server.stall(1, 5)
+        start = time.monotonic()
+        assert client.get_projections_data("bat") is not None
+
+    assert time.monotonic() - start < 2
+    assert delays == [client.backoff_factor]
+
+
+def test_deadline_cancels_outstanding_requests():
+    """Requests in flight at the deadline fail, and later ones are never sent."""
+    with FangraphsStandIn(ServerConfig(hitters=2, pitchers=1)) as server:
+        client = _standin_client(server, timeout=10, deadline=0.5)
+        server.stall(1, 5)
+        start = time.monotonic()
+        assert client.get_projections_data("bat") is None
+        assert time.monotonic() - start < 2
+        assert client.cancelled
+
+        server.reset_counts()
+        assert client.get_projections_data("pit") is None
+        assert server.status_counts == {}
+
+        client.set_deadline(10)
+        assert client.get_projections_data("pit") is not None
+        client.cancel()
+        assert client.get_player_stats_data("/players/x/1/stats.json") is None
+
+
+def test_slow_request_is_hedged():
+    """Past the latency percentile a duplicate is sent and the first response wins."""
+    with FangraphsStandIn(ServerConfig(hitters=2, pitchers=1)) as server:
+        client = _standin_client(
+            server, timeout=10, hedge_percentile=95, hedge_min_samples=5
+        )
+        for _ in range(5):
+            assert client.get_projections_data("pit") is not None
+        assert client.hedge_threshold() is not None
+        assert client.hedged_requests == 0
+
+        server.stall(1, 5)
+        start = time.monotonic()
+        assert client.get_projections_data("bat") is not None
+        client.close()
+
+    assert time.monotonic() - start < 2
+    assert client.hedged_requests == 1
@@ -0,0 +1,171 @@
+"""
+Tests for the multi-season backfill runner.
+"""
+
+import json
+
+import pytest
+
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.runners.backfill import (
+    BackfillCheckpoint,
+    merge_season_outputs,
+    plan_backfill,
+    run_backfill,
+)
+from fangraphs_api_extractor.utils import Logger, read_json_file, write_json_file
+from fangraphs_api_extractor.utils.errors import (
+    InvalidPositionError,
+    InvalidPositionGroupError,
+)
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch, projections_response):
+    """Replace API calls with the fixture response, failing any listed keys."""
+    calls = []
+    failing = set()
+
+    def get_projections_data(
+        self, position_group, params=None, position="all", projections_system="steamer"
+    ):
+        key = (self.year, position_group, projections_system)
+        calls.append(key)
+        if key in failing:
+            return None
+        return json.loads(json.dumps(projections_response))
+
+    monkeypatch.setattr(CoreFangraphs, "get_projections_data", get_projections_data)
+    return calls, failing
+
+
+def test_plan_backfill():
+    """Positions and pitcher roles should be splits of one "all" pull per group."""
+    tasks = plan_backfill(
+        [2023, 2024], ["steamer", "zips"], ["bat", "pit", "sta"], ["all", "c"]
+    )
+
+    assert len(tasks) == 2 * 2 * 2
+    assert {tuple(t.splits) for t in tasks if t.group == "bat"} == {("all", "c")}
+    assert {tuple(t.splits) for t in tasks if t.group == "pit"} == {("all", "sta")}
+    assert len({t.key for t in tasks}) == len(tasks)
+
+    roles_only = plan_backfill([2025], ["steamer"], ["rel"])
+    assert [(t.group, t.splits) for t in roles_only] == [("pit", ["rel"])]
+
+    with pytest.raises(InvalidPositionError):
+        plan_backfill([2025], ["steamer"], ["bat"], ["all", "dh2"])
+    with pytest.raises(InvalidPositionGroupError):
+        plan_backfill([2025], ["steamer"], ["bat", "fld"])
+
+
+def test_new_splits_rerun_a_completed_task(tmp_path, fake_fetch):
+    """Asking for more positions should not be skipped by the checkpoint."""
+    calls, _ = fake_fetch
+    logger = Logger("test-backfill")
+    checkpoint_path = str(tmp_path / "cp.json")
+
+    run_backfill(
+        plan_backfill([2025], ["steamer"], ["bat"]),
+        str(tmp_path),
+        BackfillCheckpoint(checkpoint_path),
+        logger,
+    )
+    run_backfill(
+        plan_backfill([2025], ["steamer"], ["bat"], ["all", "ss"]),
+        str(tmp_path),
+        BackfillCheckpoint(checkpoint_path),
+        logger,
+    )
+
+    assert len(calls) == 2
+    assert (tmp_path / "2025" / "parts" / "bat_ss_steamer.json").exists()
+
+
+def test_splits_are_written_without_extra_requests(tmp_path, fake_fetch):
+    """Position parts should be derived from the "all" pull."""
+    calls, _ = fake_fetch
+    logger = Logger("test-backfill")
+    tasks = plan_backfill([2025], ["steamer"], ["bat"], ["all", "ss", "of"])
+
+    failed = run_backfill(
+        tasks, str(tmp_path), BackfillCheckpoint(str(tmp_path / "cp.json")), logger
+    )
+
+    assert failed == []
+    assert calls == [(2025, "bat", "steamer")]
+    parts_dir = tmp_path / "2025" / "parts"
+    shortstops = read_json_file(str(parts_dir / "bat_ss_steamer.json"))
+    outfielders = read_json_file(str(parts_dir / "bat_of_steamer.json"))
+    assert [p["min_position"] for p in shortstops] == ["SS"]
+    assert len(outfielders) == 3
+    assert len(read_json_file(str(tmp_path / "2025" / "fangraph_players.json"))) == 4
+
+
+def test_backfill_resumes_from_checkpoint(tmp_path, fake_fetch):
+    """An interrupted backfill should only re-run the failed requests."""
+    calls, failing = fake_fetch
+    logger = Logger("test-backfill")
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    tasks = plan_backfill([2023, 2024], ["steamer", "atc"], ["bat"])
+
+    failing.add((2024, "bat", "atc"))
+    failed = run_backfill(
+        tasks, str(tmp_path), BackfillCheckpoint(checkpoint_path), logger, 2
+    )
+    assert [t.key for t in failed] == ["2024/bat/all/atc"]
+    assert len(calls) == 4
+    assert (tmp_path / "2023" / "fangraph_players.json").exists()
+    assert not (tmp_path / "2024" / "fangraph_players.json").exists()
+
+    failing.clear()
+    calls.clear()
+    failed = run_backfill(
+        tasks, str(tmp_path), BackfillCheckpoint(checkpoint_path), logger, 2
+    )
+    assert failed == []
+    assert calls == [(2024, "bat", "atc")]
+
+    with open(tmp_path / "2024" / "fangraph_players.json") as f:
+        players = json.load(f)
+    assert len(players) == 4
+    assert set(players[0]["projections"]) == {"steamer", "atc"}
+
+
+def test_merge_keeps_two_way_players_separate(tmp_path):
+    """A player in both the bat and pit parts keeps both projections."""
+    logger = Logger("test-backfill")
+    parts_dir = str(tmp_path / "2025" / "parts")
+    hitter = {"playerid": "19755", "player_type": "hitter", "name": "Shohei Ohtani"}
+    pitcher = dict(hitter, player_type="pitcher")
+    parts = {
+        "bat_all_steamer.json": [dict(hitter, projections={"steamer": {"hr": 44}})],
+        "bat_all_zips.json": [dict(hitter, projections={"zips": {"hr": 40}})],
+        "pit_all_steamer.json": [dict(pitcher, projections={"steamer": {"era": 3.1}})],
+    }
+    for file_name, players in parts.items():
+        write_json_file(players, parts_dir, file_name, logger)
+
+    assert merge_season_outputs(2025, str(tmp_path), logger) == 2
+    merged = {
+        p["player_type"]: p["projections"]
+        for p in read_json_file(str(tmp_path / "2025" / "fangraph_players.json"))
+    }
+    assert merged == {
+        "hitter": {"steamer": {"hr": 44}, "zips": {"hr": 40}},
+        "pitcher": {"steamer": {"era": 3.1}},
+    }
+
+
+def test_backfill_closes_its_clients(tmp_path, fake_fetch, monkeypatch):
+    """Every season's client should be closed once the backfill finishes."""
+    closed = []
+    monkeypatch.setattr(CoreFangraphs, "close", lambda self: closed.append(self.year))
+
+    run_backfill(
+        plan_backfill([2024, 2025], ["steamer"], ["bat"]),
+        str(tmp_path),
+        BackfillCheckpoint(str(tmp_path / "cp.json")),
+        Logger("test-backfill"),
+    )
+    assert sorted(closed) == [2024, 2025]
@@ -0,0 +1,81 @@
+"""
+Tests for coordinator/worker pulls through the work queue.
+"""
+
+import json
+import time
+
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.runners.backfill import plan_backfill
+from fangraphs_api_extractor.runners.distributed import (
+    enqueue_tasks,
+    merge_completed,
+    run_worker,
+)
+from fangraphs_api_extractor.storage.work_queue import WorkQueue
+from fangraphs_api_extractor.utils import Logger
+
+
+def test_claims_are_exclusive_and_leases_expire(tmp_path):
+    """A job is leased to one worker at a time and reclaimable after expiry."""
+    path = str(tmp_path / "queue.db")
+    with WorkQueue(path, max_attempts=2) as a, WorkQueue(path, max_attempts=2) as b:
+        assert a.enqueue([("job", {"n": 1})]) == 1
+        assert a.enqueue([("job", {"n": 1})]) == 0
+
+        assert a.claim("a", lease_seconds=0.05) == ("job", {"n": 1})
+        assert b.claim("b") is None
+        time.sleep(0.1)
+        assert b.claim("b") == ("job", {"n": 1})
+
+        # The first worker lost its lease and can no longer complete the job
+        assert not a.complete("job", "a")
+        assert b.fail("job", "b", "boom")
+        assert a.counts()["failed"] == 1
+        assert a.is_drained()
+
+
+def test_expired_last_attempt_is_marked_failed(tmp_path):
+    """A job whose final lease expires must not stay leased forever."""
+    with WorkQueue(str(tmp_path / "queue.db"), max_attempts=1) as queue:
+        queue.enqueue([("job", {"n": 1})])
+        assert queue.claim("a", lease_seconds=0.05) == ("job", {"n": 1})
+        time.sleep(0.1)
+
+        assert queue.claim("b") is None
+        job = queue.jobs()["job"]
+        assert (job["status"], job["error"]) == ("failed", "lease expired")
+        assert queue.is_drained()
+
+
+def test_workers_drain_queue_and_merge(tmp_path, monkeypatch, projections_response):
+    """Several workers should split the jobs; failures retry until merged."""
+    failing = {(2024, "bat", "atc")}
+
+    def get_projections_data(
+        self, position_group, params=None, position="all", projections_system="steamer"
+    ):
+        key = (self.year, position_group, projections_system)
+        if key in failing:
+            failing.discard(key)
+            return None
+        return json.loads(json.dumps(projections_response))
+
+    monkeypatch.setattr(CoreFangraphs, "get_projections_data", get_projections_data)
+    logger = Logger("test-distributed")
+    path = str(tmp_path / "queue.db")
+
+    with WorkQueue(path) as queue:
+        enqueue_tasks(queue, plan_backfill([2023, 2024], ["steamer", "atc"], ["bat"]))
+
+    with WorkQueue(path) as w1, WorkQueue(path) as w2:
+        first = run_worker(w1, str(tmp_path), logger, worker_id="w1", max_jobs=2)
+        second = run_worker(w2, str(tmp_path), logger, worker_id="w2")
+        assert (first, second) == (2, 2)
+        assert w1.counts() == {"pending": 0, "leased": 0, "done": 4, "failed": 0}
+
+        assert merge_completed(w1, str(tmp_path), logger) == [2023, 2024]
+
+    with open(tmp_path / "2024" / "fangraph_players.json") as f:
+        players = json.load(f)
+    assert set(players[0]["projections"]) == {"steamer", "atc"}
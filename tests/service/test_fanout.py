@@ -0,0 +1,142 @@
+"""
+Tests for the serialize-once fan-out writer.
+"""
+
+import io
+import json
+import threading
+
+import pytest
+
+from fangraphs_api_extractor.service import (
+    FanOutWriter,
+    JsonFileSink,
+    ListSink,
+    NdjsonSink,
+    RecordSink,
+    SnapshotSink,
+    StdoutSink,
+)
+from fangraphs_api_extractor.storage import SnapshotStore
+from fangraphs_api_extractor.utils import Logger, serialize_players
+from fangraphs_api_extractor.utils import utils as utils_module
+
+
+def test_players_serialized_once_for_every_sink(tmp_path, sample_players, monkeypatch):
+    """Every sink should receive the same records from a single serialization."""
+    logger = Logger("test-fanout")
+    expected = serialize_players(sample_players, logger)
+
+    serialized = []
+    original = utils_module.normalize_string
+
+    def counting_normalize(name):
+        serialized.append(name)
+        return original(name)
+
+    monkeypatch.setattr(utils_module, "normalize_string", counting_normalize)
+
+    collected = ListSink()
+    stdout = io.StringIO()
+    db_path = str(tmp_path / "snapshots.db")
+    snapshot = SnapshotSink(db_path, 2025)
+    metrics = FanOutWriter(
+        [
+            JsonFileSink(str(tmp_path), logger=logger),
+            NdjsonSink(str(tmp_path / "players.ndjson")),
+            snapshot,
+            StdoutSink(stdout),
+            collected,
+        ],
+        logger,
+        queue_size=2,
+    ).write(sample_players)
+
+    # serialize_players normalizes each name once (ascii_name)
+    assert len(serialized) == len(sample_players)
+    assert [m.records for m in metrics] == [len(sample_players)] * 5
+    assert all(m.error is None for m in metrics)
+
+    with open(tmp_path / "fangraph_players.json") as f:
+        assert json.load(f) == expected
+    with open(tmp_path / "players.ndjson") as f:
+        assert [json.loads(line) for line in f] == expected
+    assert [json.loads(line) for line in stdout.getvalue().splitlines()] == expected
+    assert collected.records == expected
+
+    with SnapshotStore(db_path) as store:
+        run = store.runs()[0]
+    assert run["run_id"] == snapshot.run_id
+    assert run["systems"] == ["steamer"]
+
+
+def test_failing_sink_does_not_block_others(sample_players):
+    """A sink that raises is drained so the producer and other sinks finish."""
+
+    class ExplodingSink(RecordSink):
+        name = "exploding"
+
+        def write(self, record):
+            raise RuntimeError("disk full")
+
+    collected = ListSink()
+    writer = FanOutWriter([ExplodingSink(), collected], queue_size=1)
+
+    done = threading.Event()
+    result = []
+
+    def run():
+        result.extend(writer.write(sample_players))
+        done.set()
+
+    threading.Thread(target=run, daemon=True).start()
+    assert done.wait(timeout=10)
+
+    exploding, listed = result
+    assert exploding.error == "disk full"
+    assert listed.error is None
+    assert len(collected.records) == len(sample_players)
+
+
+def test_failed_producer_publishes_nothing(tmp_path, sample_players):
+    """A producer error should abort every sink and keep the last good files."""
+    logger = Logger("test-fanout")
+    (tmp_path / "fangraph_players.json").write_text("[]")
+    (tmp_path / "players.ndjson").write_text("")
+    db_path = str(tmp_path / "snapshots.db")
+
+    def records():
+        yield from serialize_players(sample_players[:2], logger)
+        raise RuntimeError("lost connection")
+
+    writer = FanOutWriter(
+        [
+            JsonFileSink(str(tmp_path), logger=logger),
+            NdjsonSink(str(tmp_path / "players.ndjson")),
+            SnapshotSink(db_path, 2025),
+        ]
+    )
+    with pytest.raises(RuntimeError, match="lost connection"):
+        writer.write_records(records())
+
+    assert (tmp_path / "fangraph_players.json").read_text() == "[]"
+    assert (tmp_path / "players.ndjson").read_text() == ""
+    assert not list(tmp_path.glob("*.tmp"))
+    with SnapshotStore(db_path) as store:
+        assert store.runs() == []
+
+
+def test_failed_write_discards_partial_ndjson(tmp_path, sample_players):
+    """A sink whose write fails should remove its temporary file."""
+
+    class FailingNdjsonSink(NdjsonSink):
+        def write(self, record):
+            if record["playerid"] == sample_players[1].playerid:
+                raise OSError("disk full")
+            super().write(record)
+
+    metrics = FanOutWriter([FailingNdjsonSink(str(tmp_path / "p.ndjson"))]).write(
+        sample_players
+    )
+    assert metrics[0].error == "disk full"
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,116 @@
+"""
+Tests for the in-memory projection query service.
+"""
+
+import os
+
+import pytest
+import requests
+
+from fangraphs_api_extractor.service import PlayerIndex, QueryService
+from fangraphs_api_extractor.utils import Logger, serialize_players, write_json_file
+
+
+@pytest.fixture
+def serialized_players(sample_players):
+    return serialize_players(sample_players, Logger("test"))
+
+
+def test_index_lookups(serialized_players):
+    index = PlayerIndex(serialized_players)
+
+    assert index.get("25764")["name"] == "Bobby Witt Jr."
+    assert index.get("bobby-witt-jr")["playerid"] == "25764"
+    assert index.get("missing") is None
+
+    outfielders = index.query(position="of")
+    assert {p["playerid"] for p in outfielders} == {"15640", "11281", "23697"}
+
+    # Names match regardless of accents and case
+    assert [p["playerid"] for p in index.query(name="julio rodriguez")] == ["23697"]
+    assert [p["player_type"] for p in index.query(position="p")] == ["pitcher"]
+
+
+def test_index_filters_and_top_n(serialized_players):
+    index = PlayerIndex(serialized_players)
+    hitters = index.query(player_type="hitter", system="steamer")
+    by_hr = sorted(hitters, key=lambda p: p["projections"]["steamer"]["hr"])
+
+    top = index.query(player_type="hitter", system="steamer", sort="hr", limit=2)
+    assert [p["playerid"] for p in top] == [p["playerid"] for p in by_hr[::-1][:2]]
+
+    cutoff = by_hr[1]["projections"]["steamer"]["hr"]
+    filtered = index.query(system="steamer", filters={"hr": (cutoff, None)})
+    assert {p["playerid"] for p in filtered} == {p["playerid"] for p in by_hr[1:]}
+
+    assert index.query(system="atc") == []
+
+
+def test_two_way_player_lookup(tmp_path, serialized_players):
+    """A hitter and pitcher sharing a playerid are both indexed and selectable."""
+    pitcher = next(p for p in serialized_players if p["player_type"] == "pitcher")
+    two_way = dict(pitcher, playerid="25764")
+    players = serialized_players + [two_way]
+    index = PlayerIndex(players)
+
+    assert [p["player_type"] for p in index.lookup("25764")] == ["hitter", "pitcher"]
+    assert index.get("25764", "pitcher") is two_way
+
+    write_json_file(players, str(tmp_path), "players.json", Logger("test"))
+    with QueryService(str(tmp_path / "players.json"), port=0) as service:
+        response = requests.get(f"{service.url}/players/25764")
+        assert response.status_code == 300
+        assert len(response.json()) == 2
+        response = requests.get(
+            f"{service.url}/players/25764", params={"type": "pitcher"}
+        )
+        assert response.json()["player_type"] == "pitcher"
+
+
+def test_service_http_and_hot_reload(tmp_path, serialized_players):
+    logger = Logger("test")
+    write_json_file(serialized_players, str(tmp_path), "players.json", logger)
+    players_file = os.path.join(tmp_path, "players.json")
+
+    with QueryService(players_file, port=0, reload_interval=60) as service:
+        response = requests.get(
+            f"{service.url}/players", params={"position": "ss", "system": "steamer"}
+        )
+        assert response.status_code == 200
+        assert [p["playerid"] for p in response.json()] == ["25764"]
+
+        assert requests.get(f"{service.url}/players/15640").json()["name"] == (
+            "Aaron Judge"
+        )
+        assert requests.get(f"{service.url}/players/nobody").status_code == 404
+        assert requests.get(f"{service.url}/players?bogus=1").status_code == 400
+        assert requests.get(f"{service.url}/players?limit=-1").status_code == 400
+
+        # Unchanged file: nothing to reload
+        assert service.reload() is False
+
+        write_json_file(serialized_players[:1], str(tmp_path), "players.json", logger)
+        assert service.reload() is True
+        assert requests.get(f"{service.url}/health").json()["players"] == 1
+        assert requests.get(f"{service.url}/players").json()[0]["playerid"] == "25764"
+
+
+def test_error_records_are_skipped(tmp_path, serialized_players):
+    """Players that failed to serialize should not break indexing or reloads."""
+    error_record = {"name": "Broken", "ascii_name": "Broken", "error": "bad stats"}
+    index = PlayerIndex(serialized_players + [error_record])
+    assert len(index.players) == len(serialized_players)
+    assert index.query(name="broken") == []
+
+    logger = Logger("test")
+    write_json_file(serialized_players, str(tmp_path), "players.json", logger)
+    players_file = os.path.join(tmp_path, "players.json")
+    with QueryService(players_file, port=0, reload_interval=60) as service:
+        write_json_file(
+            serialized_players[:1] + [error_record],
+            str(tmp_path),
+            "players.json",
+            logger,
+        )
+        assert service.reload() is True
+        assert len(service.index.players) == 1
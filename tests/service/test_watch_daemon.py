@@ -0,0 +1,139 @@
+"""
+Tests for the watch daemon and its sinks.
+"""
+
+import json
+import os
+import socket
+import threading
+
+from fangraphs_api_extractor.requests.core_fangraphs import CoreFangraphs
+from fangraphs_api_extractor.service import (
+    FileDropSink,
+    UnixSocketSink,
+    WatchDaemon,
+    WatchTarget,
+)
+from fangraphs_api_extractor.service import watch_daemon
+from fangraphs_api_extractor.utils import Logger
+from tests.harness import FangraphsStandIn, ServerConfig
+
+
+def _client(server) -> CoreFangraphs:
+    return CoreFangraphs(
+        year=2025,
+        logger=Logger("test-watch"),
+        fangraphs_url=server.url,
+        build_id=server.build_id,
+    )
+
+
+def _edit_hitters(server, edit) -> None:
+    response = json.loads(server.bodies["bat"])
+    edit(response["pageProps"]["dehydratedState"]["queries"][0]["state"]["data"])
+    server.bodies["bat"] = json.dumps(response).encode()
+
+
+def test_only_changed_players_are_published(tmp_path):
+    drop_dir = os.path.join(tmp_path, "drops")
+    with FangraphsStandIn(ServerConfig(hitters=4, pitchers=2)) as server:
+        daemon = WatchDaemon(
+            _client(server),
+            [WatchTarget(system="steamer", group="bat")],
+            [FileDropSink(drop_dir)],
+            interval=0,
+        )
+        first = daemon.poll(daemon.targets[0])
+        assert first is not None and first["initial"]
+        assert len(first["changed"]) == 4
+
+        # Identical payload: skipped before parsing
+        assert daemon.poll(daemon.targets[0]) is None
+
+        def bump_and_drop(records):
+            records[1]["HR"] = records[1]["HR"] + 5
+            del records[3]
+
+        _edit_hitters(server, bump_and_drop)
+        second = daemon.poll(daemon.targets[0])
+
+    assert second is not None and not second["initial"]
+    assert [p["playerid"] for p in second["changed"]] == ["100001"]
+    assert second["removed"] == ["100003"]
+
+    drops = sorted(os.listdir(drop_dir))
+    assert len(drops) == 2
+    with open(os.path.join(drop_dir, drops[-1])) as f:
+        assert json.load(f)["removed"] == ["100003"]
+
+
+def test_unparseable_payload_is_a_failed_fetch(tmp_path):
+    """A payload without players must not mark every player removed."""
+    with FangraphsStandIn(ServerConfig(hitters=3, pitchers=1)) as server:
+        daemon = WatchDaemon(
+            _client(server),
+            [WatchTarget(system="steamer", group="bat")],
+            [FileDropSink(os.path.join(tmp_path, "drops"))],
+            interval=0,
+        )
+        target = daemon.targets[0]
+        assert daemon.poll(target) is not None
+        state = (daemon.payload_hashes[target.key], daemon.fingerprints[target.key])
+
+        server.bodies["bat"] = b'{"pageProps": {"statusCode": 500}}'
+        assert daemon.poll(target) is None
+        assert (
+            daemon.payload_hashes[target.key],
+            daemon.fingerprints[target.key],
+        ) == state
+
+    assert len(os.listdir(os.path.join(tmp_path, "drops"))) == 1
+
+
+def test_error_records_are_not_fingerprinted(tmp_path, monkeypatch):
+    """A player that fails to serialize should not fail every poll of the page."""
+    serialize_players = watch_daemon.serialize_players
+
+    def with_error_record(players, logger):
+        return serialize_players(players, logger) + [
+            {"name": "Broken", "ascii_name": "Broken", "error": "bad stats"}
+        ]
+
+    monkeypatch.setattr(watch_daemon, "serialize_players", with_error_record)
+    with FangraphsStandIn(ServerConfig(hitters=3, pitchers=1)) as server:
+        daemon = WatchDaemon(
+            _client(server),
+            [WatchTarget(system="steamer", group="bat")],
+            [FileDropSink(os.path.join(tmp_path, "drops"))],
+            interval=0,
+        )
+        event = daemon.poll(daemon.targets[0])
+
+    assert event is not None
+    assert len(event["changed"]) == 3
+
+
+def test_unix_socket_sink_streams_events(tmp_path):
+    socket_path = os.path.join(tmp_path, "events.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(1)
+    received = []
+
+    def accept():
+        conn, _ = listener.accept()
+        with conn, conn.makefile("r") as lines:
+            for line in lines:
+                received.append(json.loads(line))
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+
+    sink = UnixSocketSink(socket_path)
+    sink.publish({"system": "steamer", "changed": [1]})
+    sink.publish({"system": "atc", "changed": [2]})
+    sink.close()
+    thread.join(timeout=5)
+    listener.close()
+
+    assert [event["system"] for event in received] == ["steamer", "atc"]
@@ -0,0 +1,83 @@
+"""
+Tests for the external ID crosswalk.
+"""
+
+import csv
+import os
+
+import pytest
+
+from fangraphs_api_extractor.storage import Crosswalk, CrosswalkColumns
+from fangraphs_api_extractor.utils import Logger, serialize_players
+
+REGISTER_COLUMNS = ["IDFANGRAPHS", "MLBID", "PLAYERNAME", "ESPNID", "YAHOOID"]
+
+
+def write_register(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(REGISTER_COLUMNS)
+        writer.writerows(rows)
+
+
+@pytest.fixture
+def register(tmp_path):
+    path = os.path.join(tmp_path, "register.csv")
+    write_register(
+        path,
+        [
+            ["25764", "677951", "Bobby Witt Jr.", "42403", "12345"],
+            # Only the MLBAM id links Judge
+            ["", "592450", "Aaron Judge", "33192", ""],
+            # Only the name links Rodríguez, without the accent
+            ["", "", "Julio Rodriguez", "41044", "64123"],
+            # Two registered players share Merrifield's name
+            ["", "", "Whit Merrifield", "1", ""],
+            ["", "", "whit merrifield", "2", ""],
+        ],
+    )
+    return path
+
+
+def test_enrich_matches_by_id_then_name(register, sample_players):
+    with Crosswalk(register) as crosswalk:
+        counts = crosswalk.enrich(sample_players)
+
+    by_id = {player.playerid: player for player in sample_players}
+    assert by_id["25764"].external_ids == {"espn": "42403", "yahoo": "12345"}
+    assert by_id["15640"].external_ids == {"espn": "33192"}
+    assert by_id["23697"].external_ids == {"espn": "41044", "yahoo": "64123"}
+    # Ambiguous names and unregistered players stay unmatched
+    assert by_id["11281"].external_ids == {}
+    assert by_id["33677"].external_ids == {}
+    assert counts == {"fangraphs": 1, "mlbam": 1, "name": 1, "unmatched": 2}
+
+    serialized = serialize_players(sample_players, Logger("test"))
+    assert serialized[0]["external_ids"]["espn"] == "42403"
+
+
+def test_index_is_reused_until_register_changes(register):
+    Crosswalk(register).close()
+    index_path = f"{register}.idx"
+    built_at = os.stat(index_path).st_mtime_ns
+
+    with Crosswalk(register) as crosswalk:
+        assert crosswalk.find("fangraphs", "25764") == 0
+    assert os.stat(index_path).st_mtime_ns == built_at
+
+    write_register(register, [["99999", "1", "New Player", "7", ""]])
+    with Crosswalk(register) as crosswalk:
+        assert crosswalk.rows == 1
+        assert crosswalk.find("fangraphs", "25764") is None
+        assert crosswalk.find("name", "NEW PLAYER") == 0
+
+
+def test_index_is_rebuilt_for_other_columns(register):
+    """Reopening the same register with a different column mapping rebuilds it."""
+    with Crosswalk(register) as crosswalk:
+        assert crosswalk.external_ids(0)["espn"] == "42403"
+
+    columns = CrosswalkColumns(external={"espn": "YAHOOID"})
+    with Crosswalk(register, columns=columns) as crosswalk:
+        assert crosswalk.columns[3:] == ["espn"]
+        assert crosswalk.external_ids(0) == {"espn": "12345"}
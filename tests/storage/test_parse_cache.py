@@ -0,0 +1,94 @@
+"""
+Tests for the content-addressed parse cache.
+"""
+
+import json
+import os
+import struct
+import time
+import zlib
+
+from fangraphs_api_extractor.managers import PlayersManager
+from fangraphs_api_extractor.storage import ParseCache
+from fangraphs_api_extractor.storage.parse_cache import CACHE_MAGIC
+from fangraphs_api_extractor.utils import Logger, min_stat, serialize_players
+
+
+def test_identical_payload_reloads_without_validation(
+    tmp_path, projections_response, monkeypatch
+):
+    """A second parse of the same bytes should come from the cache."""
+    logger = Logger("test-parse-cache")
+    payload = json.dumps(projections_response).encode()
+    cache = ParseCache(str(tmp_path))
+
+    first = PlayersManager("hitters", cache=cache).parse_players(
+        payload, fields=["hr", "avg"]
+    )
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    def no_validation(*args, **kwargs):
+        raise AssertionError("cached parse should not validate records")
+
+    with monkeypatch.context() as m:
+        m.setattr(PlayersManager, "_build_player", no_validation)
+        second = PlayersManager("hitters", cache=cache).parse_players(
+            payload, fields=["hr", "avg"]
+        )
+    assert cache.hits == 1
+    assert serialize_players(second, logger) == serialize_players(first, logger)
+    assert set(second[0].projections["steamer"].model_dump()) == {"hr", "avg"}
+
+    # Different options or predicates never share an entry
+    PlayersManager("hitters", cache=cache).parse_players(payload)
+    PlayersManager("hitters", cache=cache).parse_players(
+        payload, where=[min_stat("PA", 1)]
+    )
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert len(os.listdir(tmp_path)) == 2
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, projections_response):
+    """The cache directory should stay under its size bound."""
+    payloads = []
+    for hr in range(3):
+        response = json.loads(json.dumps(projections_response))
+        response["pageProps"]["dehydratedState"]["queries"][0]["state"]["data"][0][
+            "HR"
+        ] = hr
+        payloads.append(json.dumps(response).encode())
+
+    cache = ParseCache(str(tmp_path))
+    PlayersManager("hitters", cache=cache).parse_players(payloads[0])
+    entry_size = os.path.getsize(os.path.join(tmp_path, os.listdir(tmp_path)[0]))
+    cache.max_bytes = int(entry_size * 2.5)
+
+    time.sleep(0.01)
+    PlayersManager("hitters", cache=cache).parse_players(payloads[1])
+    time.sleep(0.01)
+    # Touch the first entry so the second becomes least recently used
+    PlayersManager("hitters", cache=cache).parse_players(payloads[0])
+    time.sleep(0.01)
+    PlayersManager("hitters", cache=cache).parse_players(payloads[2])
+
+    assert len(os.listdir(tmp_path)) == 2
+    keys = [cache.key(p, "hitters", "steamer") for p in payloads]
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+
+
+def test_entries_are_stored_as_json(tmp_path, projections_response):
+    """Cache entries should hold plain JSON, never pickled objects."""
+    payload = json.dumps(projections_response).encode()
+    cache = ParseCache(str(tmp_path))
+    first = PlayersManager("hitters", cache=cache).parse_players(payload)
+
+    with open(os.path.join(tmp_path, os.listdir(tmp_path)[0]), "rb") as f:
+        assert f.read(len(CACHE_MAGIC)) == CACHE_MAGIC
+        f.read(struct.unpack("<I", f.read(4))[0])
+        rows = json.loads(zlib.decompress(f.read()))
+    assert len(rows) == len(first)
+
+    second = PlayersManager("hitters", cache=cache).parse_players(payload)
+    assert cache.hits == 1
+    assert [p.model_dump() for p in second] == [p.model_dump() for p in first]
@@ -0,0 +1,149 @@
+"""
+Tests for the SQLite snapshot store.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from fangraphs_api_extractor.storage import SnapshotStore
+from fangraphs_api_extractor.utils import Logger, serialize_players
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SnapshotStore(str(tmp_path / "snapshots.db")) as store:
+        yield store
+
+
+@pytest.fixture
+def serialized_players(sample_players):
+    return serialize_players(sample_players, Logger("test"))
+
+
+def _with_hr(players, playerid, hr):
+    """Copy serialized players with one player's steamer HR changed."""
+    players = json.loads(json.dumps(players))
+    for player in players:
+        if player["playerid"] == playerid:
+            player["projections"]["steamer"]["hr"] = hr
+    return players
+
+
+def test_record_run(store, serialized_players):
+    """A run should store metadata, players and per-system projections."""
+    run_id = store.record_run(serialized_players, 2025, "2025-03-01T00:00:00+00:00")
+
+    runs = store.runs()
+    assert [r["run_id"] for r in runs] == [run_id]
+    assert runs[0]["year"] == 2025
+    assert runs[0]["systems"] == ["steamer"]
+
+    count = store.conn.execute("SELECT COUNT(*) FROM projections").fetchone()[0]
+    assert count == len(serialized_players)
+
+
+def test_as_of_and_time_series(store, serialized_players):
+    """Lookups should follow a projection across runs."""
+    judge = "15640"
+    for day, hr in [("01", 40), ("08", 42), ("15", 45)]:
+        players = _with_hr(serialized_players, judge, hr)
+        store.record_run(players, 2025, f"2025-03-{day}T00:00:00+00:00")
+
+    series = store.time_series(judge, "steamer", "hr")
+    assert [value for _, value in series] == [40, 42, 45]
+
+    bounded = store.time_series(
+        judge, "steamer", "hr", start="2025-03-05", end="2025-03-10"
+    )
+    assert bounded == [("2025-03-08T00:00:00+00:00", 42)]
+
+    snapshot = store.as_of(judge, "steamer", "2025-03-10T00:00:00+00:00")
+    assert snapshot is not None
+    assert snapshot["hr"] == 42
+    assert snapshot["created_at"] == "2025-03-08T00:00:00+00:00"
+
+    assert store.as_of(judge, "steamer", "2025-02-01T00:00:00+00:00") is None
+    assert store.as_of(judge, "zips") is None
+
+
+def test_date_bounds_include_the_whole_day(store, serialized_players):
+    """Date-only bounds should cover runs recorded later that (UTC) day."""
+    judge = "15640"
+    store.record_run(
+        _with_hr(serialized_players, judge, 40), 2025, "2025-03-01T09:30:00Z"
+    )
+    store.record_run(
+        _with_hr(serialized_players, judge, 44), 2025, "2025-03-01T20:00:00-05:00"
+    )
+
+    snapshot = store.as_of(judge, "steamer", "2025-03-01")
+    assert snapshot is not None
+    assert snapshot["hr"] == 40
+    assert snapshot["created_at"] == "2025-03-01T09:30:00+00:00"
+
+    series = store.time_series(
+        judge, "steamer", "hr", start="2025-03-01", end="2025-03-01"
+    )
+    assert [value for _, value in series] == [40]
+    assert store.as_of(judge, "steamer", "2025-03-02")["hr"] == 44
+
+
+def test_import_json_file(store, serialized_players, tmp_path):
+    """Existing JSON snapshots should import as runs."""
+    path = tmp_path / "fangraph_players.json"
+    path.write_text(json.dumps(serialized_players))
+
+    store.import_json_file(str(path), 2024, label="backfill")
+    assert store.runs(year=2024)[0]["label"] == "backfill"
+    assert store.runs(year=2025) == []
+
+
+def test_two_way_player_keeps_both_records(store):
+    """A hitter and pitcher record with the same playerid should not collide."""
+    ohtani = {"playerid": "19755", "name": "Shohei Ohtani"}
+    players = [
+        dict(ohtani, player_type="hitter", projections={"steamer": {"hr": 45}}),
+        dict(ohtani, player_type="pitcher", projections={"steamer": {"era": 3.1}}),
+    ]
+    store.record_run(players, 2025, "2025-03-01T00:00:00+00:00")
+
+    assert store.as_of("19755", "steamer", player_type="hitter")["hr"] == 45
+    assert store.as_of("19755", "steamer", player_type="pitcher")["era"] == 3.1
+    assert store.as_of("19755", "steamer")["hr"] == 45
+    assert store.time_series("19755", "steamer", "hr", player_type="hitter") == [
+        ("2025-03-01T00:00:00+00:00", 45)
+    ]
+    assert store.time_series("19755", "steamer", "era", player_type="pitcher") == [
+        ("2025-03-01T00:00:00+00:00", 3.1)
+    ]
+
+
+def test_older_databases_are_migrated(tmp_path):
+    """Rows keyed without player_type should be carried into the new schema."""
+    db_path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE runs (run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at TEXT NOT NULL, year INTEGER NOT NULL,
+            systems TEXT NOT NULL, label TEXT);
+        CREATE TABLE players (run_id INTEGER NOT NULL, playerid TEXT NOT NULL,
+            name TEXT, ascii_name TEXT, team TEXT, xmlbam_id INTEGER,
+            PRIMARY KEY (run_id, playerid));
+        CREATE TABLE projections (run_id INTEGER NOT NULL,
+            playerid TEXT NOT NULL, system TEXT NOT NULL, data TEXT NOT NULL,
+            PRIMARY KEY (run_id, playerid, system));
+        CREATE INDEX idx_players_playerid ON players(playerid, run_id);
+        INSERT INTO runs VALUES (1, '2025-03-01T00:00:00+00:00', 2025,
+            '["steamer"]', NULL);
+        INSERT INTO players VALUES (1, '15640', 'Aaron Judge', NULL, 'NYY', NULL);
+        INSERT INTO projections VALUES (1, '15640', 'steamer', '{"hr": 44}');
+        """)
+    conn.close()
+
+    with SnapshotStore(db_path) as store:
+        assert store.as_of("15640", "steamer")["hr"] == 44
+        store.record_run(
+            [{"playerid": "15640", "player_type": "hitter", "projections": {}}], 2025
+        )
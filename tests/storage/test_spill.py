@@ -0,0 +1,73 @@
+"""
+Tests for the memory-bounded spilling player container.
+"""
+
+import json
+
+from fangraphs_api_extractor.managers import PlayersManager
+from fangraphs_api_extractor.storage import SpillingPlayerList
+from fangraphs_api_extractor.utils import (
+    Logger,
+    iter_serialized_players,
+    serialize_players,
+    write_json_file,
+)
+from tests.conftest import load_fixture
+
+
+def test_spilled_players_round_trip(sample_players):
+    """Players read back from disk should serialize exactly like the originals."""
+    logger = Logger("test-spill")
+    with SpillingPlayerList(memory_budget=1) as players:
+        players.extend(sample_players)
+
+        # A one byte budget spills every player as soon as it is added
+        assert players.spilled == len(players) == len(sample_players)
+        assert serialize_players(players, logger) == serialize_players(
+            sample_players, logger
+        )
+        assert players[1].name == sample_players[1].name
+        assert players[-1].player_type == "pitcher"
+
+
+def test_apply_keeps_changes_to_spilled_batches(sample_players):
+    """In-place changes made through apply() should survive re-spilling."""
+
+    def tag(batch):
+        for player in batch:
+            player.external_ids = {"espn": player.playerid}
+
+    with SpillingPlayerList(memory_budget=30_000) as players:
+        players.extend(sample_players)
+        assert 0 < players.spilled < len(players)
+
+        players.apply(tag)
+        assert [p.external_ids["espn"] for p in players] == [
+            p.playerid for p in sample_players
+        ]
+
+
+def test_managers_share_budget_and_stream_output(tmp_path, projections_response):
+    """Managers should append into one container whose output streams to disk."""
+    logger = Logger("test-spill")
+    with SpillingPlayerList(memory_budget=1) as players:
+        PlayersManager("hitters", players=players).parse_players(
+            projections_response, fields=["hr", "avg"]
+        )
+        PlayersManager("pitchers", players=players).parse_players(
+            [load_fixture("pitcher_steamer.json")]
+        )
+        assert len(players) == players.spilled == 5
+        assert set(players[0].projections["steamer"].model_dump()) == {"hr", "avg"}
+
+        streamed = write_json_file(
+            iter_serialized_players(players, logger), str(tmp_path), "s.json", logger
+        )
+        listed = write_json_file(
+            serialize_players(players, logger), str(tmp_path), "l.json", logger
+        )
+
+    with open(streamed) as s, open(listed) as l:
+        assert s.read() == l.read()
+    with open(streamed) as s:
+        assert len(json.load(s)) == 5
@@ -0,0 +1,85 @@
+"""
+Tests for streaming compression of output files.
+"""
+
+import gzip
+import json
+import os
+
+import pytest
+
+from fangraphs_api_extractor.utils import (
+    Logger,
+    read_json_file,
+    serialize_players,
+    write_json_file,
+)
+
+
+@pytest.fixture
+def serialized_players(sample_players):
+    return serialize_players(sample_players, Logger("test"))
+
+
+def test_gzip_output_round_trip(tmp_path, serialized_players):
+    path = write_json_file(
+        serialized_players,
+        str(tmp_path),
+        "players.json",
+        Logger("test"),
+        compression="gzip",
+    )
+
+    assert path == os.path.join(tmp_path, "players.json.gz")
+    with gzip.open(path, "rt") as f:
+        assert json.load(f) == serialized_players
+    assert read_json_file(path) == serialized_players
+    assert os.path.getsize(path) < len(json.dumps(serialized_players, indent=2))
+
+
+def test_readers_detect_compression_from_content(tmp_path, serialized_players):
+    """Plain files, and compressed files without the extension, read the same."""
+    logger = Logger("test")
+    plain = write_json_file(serialized_players, str(tmp_path), "plain.json", logger)
+    assert read_json_file(plain) == serialized_players
+
+    renamed = os.path.join(tmp_path, "renamed.json")
+    os.replace(
+        write_json_file(
+            serialized_players, str(tmp_path), "c.json", logger, compression="gzip"
+        ),
+        renamed,
+    )
+    assert read_json_file(renamed) == serialized_players
+
+
+def test_zstd_output_round_trip(tmp_path, serialized_players):
+    pytest.importorskip("zstandard")
+    path = write_json_file(
+        serialized_players,
+        str(tmp_path),
+        "players.json",
+        Logger("test"),
+        compression="zstd",
+        level=10,
+    )
+
+    assert path is not None and path.endswith(".json.zst")
+    assert read_json_file(path) == serialized_players
+
+
+def test_failed_stream_leaves_no_temp_file(tmp_path, serialized_players):
+    """A stream that fails partway should keep the old file and no .tmp."""
+    (tmp_path / "players.json.gz").write_bytes(b"old")
+
+    def records():
+        yield from serialized_players
+        raise RuntimeError("serialization failed")
+
+    path = write_json_file(
+        records(), str(tmp_path), "players.json", Logger("test"), compression="gzip"
+    )
+
+    assert path is None
+    assert os.listdir(tmp_path) == ["players.json.gz"]
+    assert (tmp_path / "players.json.gz").read_bytes() == b"old"
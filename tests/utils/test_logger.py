@@ -0,0 +1,85 @@
+"""
+Tests for the queue-based logging mode.
+"""
+
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fangraphs_api_extractor.utils import Logger, set_console_stream
+
+
+class SlowStream(io.StringIO):
+    """A stream that takes a while to write, like a slow stdout pipe."""
+
+    def write(self, s: str) -> int:
+        time.sleep(0.01)
+        return super().write(s)
+
+
+def test_queue_logger_does_not_block_on_slow_sink():
+    """Worker threads enqueue records; the slow sink is written in the background."""
+    logger = Logger("test-queue-logger", use_queue=True)
+    assert logger.listener is not None
+    stream = SlowStream()
+    logger.listener.handlers[0].setStream(stream)  # type: ignore[attr-defined]
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda i: logger.logging.info(f"record {i}"), range(40)))
+    # 40 synchronous writes would take at least 0.4s
+    assert time.monotonic() - start < 0.2
+
+    logger.stop()
+    lines = stream.getvalue().splitlines()
+    assert sorted(lines) == sorted(f"record {i}" for i in range(40))
+
+    # After stopping, records are written directly instead of being dropped
+    logger.logging.info("after stop")
+    assert stream.getvalue().splitlines()[-1] == "after stop"
+
+
+class ThreadRecorder:
+    """Log argument that notes which thread formatted it."""
+
+    def __init__(self):
+        self.threads = []
+
+    def __str__(self) -> str:
+        self.threads.append(threading.current_thread())
+        return "formatted"
+
+
+def test_queue_logger_formats_on_the_writer_thread():
+    """Records are enqueued raw, so the message is built off the calling thread."""
+    logger = Logger("test-queue-logger-format", use_queue=True)
+    assert logger.listener is not None
+    stream = io.StringIO()
+    logger.listener.handlers[0].setStream(stream)  # type: ignore[attr-defined]
+
+    # Keep pytest's capture handlers on the root logger out of the picture
+    logger.logging.propagate = False
+    recorder = ThreadRecorder()
+    logger.logging.info("value: %s", recorder)
+    logger.stop()
+
+    assert stream.getvalue() == "value: formatted\n"
+    assert recorder.threads and threading.current_thread() not in recorder.threads
+
+
+def test_console_stream_moves_existing_and_new_loggers(monkeypatch):
+    """set_console_stream retargets loggers created before and after the call."""
+    # Only retarget the loggers made here
+    monkeypatch.setattr("fangraphs_api_extractor.utils.logger._console_stream", None)
+    monkeypatch.setattr("fangraphs_api_extractor.utils.logger._console_handlers", [])
+    before = Logger("test-console-before")
+    before.logging.propagate = False
+    stream = io.StringIO()
+    set_console_stream(stream)
+    after = Logger("test-console-after")
+    after.logging.propagate = False
+
+    before.logging.info("before")
+    after.logging.info("after")
+    assert stream.getvalue().splitlines() == ["before", "after"]
@@ -0,0 +1,75 @@
+"""
+Tests for the partitioned output writer.
+"""
+
+import hashlib
+import json
+import os
+
+import pytest
+
+from fangraphs_api_extractor.utils import (
+    Logger,
+    read_partitioned,
+    serialize_players,
+    write_partitioned,
+)
+
+
+@pytest.fixture
+def serialized_players(sample_players):
+    return serialize_players(sample_players, Logger("test"))
+
+
+def test_write_partitioned_manifest(tmp_path, serialized_players):
+    manifest = write_partitioned(
+        serialized_players, str(tmp_path), Logger("test"), ["player_type", "team"]
+    )
+
+    assert manifest["players"] == len(serialized_players)
+    assert sum(entry["count"] for entry in manifest["files"]) == len(serialized_players)
+    for entry in manifest["files"]:
+        with open(os.path.join(tmp_path, entry["path"]), "rb") as f:
+            body = f.read()
+        assert len(body) == entry["bytes"]
+        assert hashlib.sha256(body).hexdigest() == entry["sha256"]
+        players = json.loads(body)
+        assert all(p["team"] == entry["partition"]["team"] for p in players)
+
+    with open(os.path.join(tmp_path, "manifest.json")) as f:
+        assert json.load(f)["partition_by"] == ["player_type", "team"]
+
+
+def test_read_partitioned_by_position_and_system(tmp_path, serialized_players):
+    write_partitioned(
+        serialized_players, str(tmp_path), Logger("test"), ["system", "position"]
+    )
+
+    # Merrifield (2B/OF) appears in both position partitions
+    outfielders = read_partitioned(str(tmp_path), position="OF")
+    assert {p["playerid"] for p in outfielders} == {"15640", "11281", "23697"}
+    assert [p["playerid"] for p in read_partitioned(str(tmp_path), position="2B")] == [
+        "11281"
+    ]
+
+    steamer = read_partitioned(str(tmp_path), system="steamer", position="P")
+    assert len(steamer) == 1 and list(steamer[0]["projections"]) == ["steamer"]
+
+    with pytest.raises(ValueError):
+        read_partitioned(str(tmp_path), team="NYY")
+
+
+def test_partitions_are_compressed(tmp_path, serialized_players):
+    """Partition files honour the compression settings; the manifest hashes them."""
+    manifest = write_partitioned(
+        serialized_players, str(tmp_path), Logger("test"), compression="gzip", level=1
+    )
+
+    for entry in manifest["files"]:
+        assert entry["path"].endswith(".json.gz")
+        with open(os.path.join(tmp_path, entry["path"]), "rb") as f:
+            body = f.read()
+        assert body[:2] == b"\x1f\x8b"
+        assert hashlib.sha256(body).hexdigest() == entry["sha256"]
+
+    assert len(read_partitioned(str(tmp_path))) == len(serialized_players)
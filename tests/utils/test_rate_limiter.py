@@ -0,0 +1,25 @@
+"""
+Tests for the request rate limiter.
+"""
+
+import time
+
+from fangraphs_api_extractor.utils import RateLimiter
+
+
+def test_rate_limiter_spaces_calls():
+    """Calls beyond the first should be spaced by the configured rate."""
+    limiter = RateLimiter(rate=50)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+def test_unlimited_rate_does_not_wait():
+    """Without a rate, acquire should return immediately."""
+    limiter = RateLimiter()
+    start = time.monotonic()
+    for _ in range(1000):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.1
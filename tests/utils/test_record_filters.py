@@ -0,0 +1,25 @@
+"""
+Tests for raw record predicates.
+"""
+
+from fangraphs_api_extractor.utils import max_stat, min_stat, position_in, team_in
+
+
+def test_stat_bounds():
+    record = {"PA": 550.0, "ERA": None}
+    assert min_stat("PA", 500)(record)
+    assert not min_stat("PA", 600)(record)
+    assert max_stat("PA", 600)(record)
+    # Missing or null stats never pass a bound
+    assert not max_stat("ERA", 4.0)(record)
+    assert not min_stat("IP", 0)(record)
+
+
+def test_team_and_position():
+    hitter = {"Team": "nyy", "minpos": "2B/OF"}
+    pitcher = {"Team": None, "IP": 180.0}
+    assert team_in(["NYY"])(hitter)
+    assert team_in(["FA"])(pitcher)
+    assert position_in(["of"])(hitter) and position_in(["2B"])(hitter)
+    assert not position_in(["SS"])(hitter)
+    assert position_in(["P"])(pitcher) and not position_in(["P"])(hitter)